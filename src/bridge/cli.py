@@ -34,6 +34,7 @@ from bridge.parser import parse_oi_report
 from bridge.runner import build_oi_prompt, run_open_interpreter
 from bridge.storage import (
     append_log,
+    close_logs,
     create_run_context,
     status_payload,
     tail_lines,
@@ -41,8 +42,8 @@ from bridge.storage import (
     write_status,
 )
 from bridge.web_backend import (
-    destroy_session_top_bar,
     ensure_session_top_bar,
+    release_and_destroy_session_top_bar,
     release_session_control_overlay,
     run_web_task,
 )
@@ -227,6 +228,7 @@ def main() -> None:
             print_events=args.print_events,
             only=args.only,
             notify=args.notify,
+            max_interval_ms=args.max_interval_ms,
         )
         return
     if args.command == "live":
@@ -375,7 +377,7 @@ def _build_parser() -> argparse.ArgumentParser:
 
     watch_parser = subparsers.add_parser(
         "watch",
-        help="Watch web session observer state in real-time (polls /state)",
+        help="Watch web session observer state in real-time (long-polls /state)",
     )
     watch_parser.add_argument(
         "--attach",
@@ -384,6 +386,12 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Session id to watch, or 'last' for last session.",
     )
     watch_parser.add_argument("--interval-ms", type=int, default=800)
+    watch_parser.add_argument(
+        "--max-interval-ms",
+        type=int,
+        default=None,
+        help="Upper bound for idle poll backoff (default: 5x --interval-ms).",
+    )
     watch_parser.add_argument("--since-last", action="store_true")
     watch_parser.add_argument("--json", action="store_true")
     watch_parser.add_argument("--print-events", type=int, default=0)
@@ -604,9 +612,8 @@ def run_command(
                 timeout_seconds=timeout_seconds,
                 run_dir=ctx.run_dir,
             )
+            # The runner streams the full transcript into oi_stdout.log/oi_stderr.log.
             stdout_text = result.stdout
-            ctx.stdout_log.write_text(result.stdout, encoding="utf-8")
-            ctx.stderr_log.write_text(result.stderr, encoding="utf-8")
             append_log(ctx.bridge_log, f"oi_returncode={result.returncode}")
             append_log(ctx.bridge_log, f"oi_timed_out={result.timed_out}")
 
@@ -708,6 +715,9 @@ def run_command(
         if ctx is not None:
             _finalize_failed_run(ctx, task, f"Unhandled runtime error: {exc}")
         raise SystemExit(f"Run failed: {exc}") from exc
+    finally:
+        # Also releases handles opened outside this function (e.g. learning audit).
+        close_logs()
 
 
 def web_open_command(url: str | None) -> None:
@@ -760,8 +770,7 @@ def web_release_command(session_id: str) -> None:
 def web_close_command(session_id: str) -> None:
     session = load_and_refresh_session(session_id)
     if session_is_alive(session):
-        release_session_control_overlay(session)
-        destroy_session_top_bar(session)
+        release_and_destroy_session_top_bar(session)
     close_session(session)
     print(
         json.dumps(
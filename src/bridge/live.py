@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
+import sys
 import time
+from collections.abc import Iterator
 from pathlib import Path
 
-from bridge.storage import status_payload, tail_lines
+from bridge.storage import json_line, status_payload, tail_lines
 from bridge.web_session import (
     get_last_session,
     load_and_refresh_session,
@@ -29,15 +30,57 @@ def _fmt_event(evt: dict[str, object]) -> str:
     return f"[{sev}] {typ}"
 
 
-def _iter_log_lines(run_dir: Path, tail_count: int) -> list[str]:
-    bridge_log = run_dir / "bridge.log"
-    oi_stdout = run_dir / "oi_stdout.log"
-    oi_stderr = run_dir / "oi_stderr.log"
-    lines: list[str] = []
-    lines.extend(tail_lines(bridge_log, tail_count))
-    lines.extend(tail_lines(oi_stdout, tail_count))
-    lines.extend(tail_lines(oi_stderr, tail_count))
-    return [ln for ln in lines if ln.strip()]
+def _event_key(evt: dict[str, object]) -> str:
+    return "|".join(
+        [
+            str(evt.get("created_at", "")),
+            str(evt.get("type", "")),
+            str(evt.get("message", "")),
+            str(evt.get("status", "")),
+        ]
+    )
+
+
+def _new_events(
+    events: list[object],
+    last_event_ts: str | None,
+    boundary_keys: set[str],
+) -> tuple[list[dict[str, object]], str | None, set[str]]:
+    # recent_events is ordered oldest-first; walk it newest-first and stop at the
+    # first event already covered by the cursor. Events sharing the cursor
+    # timestamp are disambiguated through boundary_keys.
+    fresh: list[dict[str, object]] = []
+    for evt in reversed(events):
+        if not isinstance(evt, dict):
+            continue
+        created_at = str(evt.get("created_at", "") or "")
+        if last_event_ts is not None and created_at < last_event_ts:
+            break
+        if last_event_ts is not None and created_at == last_event_ts:
+            if _event_key(evt) in boundary_keys:
+                continue
+        fresh.append(evt)
+    fresh.reverse()
+    if not fresh:
+        return fresh, last_event_ts, boundary_keys
+
+    newest_ts = max(str(evt.get("created_at", "") or "") for evt in fresh)
+    if newest_ts != last_event_ts:
+        boundary_keys = set()
+    boundary_keys.update(
+        _event_key(evt) for evt in fresh if str(evt.get("created_at", "") or "") == newest_ts
+    )
+    return fresh, newest_ts, boundary_keys
+
+
+_LOG_FILENAMES = ("bridge.log", "oi_stdout.log", "oi_stderr.log")
+
+
+def _iter_log_lines(run_dir: Path, tail_count: int) -> Iterator[str]:
+    for name in _LOG_FILENAMES:
+        for ln in tail_lines(run_dir / name, tail_count):
+            if ln.strip():
+                yield ln
 
 
 def live_command(
@@ -61,7 +104,8 @@ def live_command(
     if not session_is_alive(session):
         raise SystemExit("Attached session is not alive; run web-open again.")
 
-    seen_events: set[str] = set()
+    last_event_ts: str | None = None
+    boundary_keys: set[str] = set()
     seen_log_lines: set[str] = set()
     last_snapshot: tuple[str, str, str, str, str, bool, bool, bool] | None = None
 
@@ -84,22 +128,12 @@ def live_command(
         progress = str(payload.get("progress", ""))
         run_dir = Path(str(payload.get("run_dir", ""))) if payload.get("run_dir") else None
 
-        event_lines: list[str] = []
-        for evt in list(observer.get("recent_events", []) or []):
-            if not isinstance(evt, dict):
-                continue
-            key = "|".join(
-                [
-                    str(evt.get("created_at", "")),
-                    str(evt.get("type", "")),
-                    str(evt.get("message", "")),
-                    str(evt.get("status", "")),
-                ]
-            )
-            if key in seen_events:
-                continue
-            seen_events.add(key)
-            event_lines.append(_fmt_event(evt))
+        fresh_events, last_event_ts, boundary_keys = _new_events(
+            observer.get("recent_events", []) or [],
+            last_event_ts,
+            boundary_keys,
+        )
+        event_lines = [_fmt_event(evt) for evt in fresh_events]
 
         log_lines: list[str] = []
         if run_dir is not None and run_dir.exists():
@@ -130,35 +164,44 @@ def live_command(
                 return
             continue
 
-        output = {
-            "run_id": run_id,
-            "run_state": run_state,
-            "run_result": run_result,
-            "progress": progress,
-            "session_id": session.session_id,
-            "session_state": session.state,
-            "controlled": session.controlled,
-            "agent_online": agent_online,
-            "incident_open": incident_open,
-            "events": event_lines,
-            "logs": log_lines,
-        }
-
+        # Header/status only on a real transition; log/event-only ticks emit just the new lines.
+        session_transition = snapshot != last_snapshot
+        chunks: list[str] = []
         if json_mode:
-            print(json.dumps(output, ensure_ascii=False), flush=True)
+            if session_transition:
+                status = {
+                    "kind": "status",
+                    "run_id": run_id,
+                    "run_state": run_state,
+                    "run_result": run_result,
+                    "progress": progress,
+                    "session_id": session.session_id,
+                    "session_state": session.state,
+                    "controlled": session.controlled,
+                    "agent_online": agent_online,
+                    "incident_open": incident_open,
+                }
+                chunks.append(json_line(status))
+            if event_lines:
+                chunks.append(json_line({"kind": "events", "events": event_lines}))
+            if log_lines:
+                chunks.append(json_line({"kind": "logs", "lines": log_lines}))
         else:
-            print(f"run={run_id} state={run_state} result={run_result} progress={progress}", flush=True)
-            print(
-                f"session={session.session_id} state={session.state} controlled={session.controlled} "
-                f"agent_online={agent_online} "
-                f"incident_open={incident_open}",
-                flush=True,
-            )
-            for item in event_lines:
-                print(f"event: {item}", flush=True)
-            for item in log_lines:
-                print(f"log: {item}", flush=True)
-            print("---", flush=True)
+            if session_transition:
+                chunks.append(
+                    f"run={run_id} state={run_state} result={run_result} progress={progress}"
+                )
+                chunks.append(
+                    f"session={session.session_id} state={session.state} "
+                    f"controlled={session.controlled} agent_online={agent_online} "
+                    f"incident_open={incident_open}"
+                )
+            chunks.extend(f"event: {item}" for item in event_lines)
+            chunks.extend(f"log: {item}" for item in log_lines)
+            chunks.append("---")
+        # One write + flush per tick instead of a flushed print per line.
+        sys.stdout.write("\n".join(chunks) + "\n")
+        sys.stdout.flush()
 
         last_snapshot = snapshot
 
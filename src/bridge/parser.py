@@ -3,38 +3,52 @@
 from __future__ import annotations
 
 import json
+import re
 from typing import Any
 
 from bridge.models import OIReport
 
+# JSONDecoder holds no per-call state, so one instance serves every parse.
+_DECODER = json.JSONDecoder()
+
+_EXACT_RESULTS = frozenset({"success", "partial", "failed"})
+# Checked in order: any failure keyword wins over partial, partial over success.
+_RESULT_KEYWORDS = (
+    (re.compile(r"fail|error|denied|blocked"), "failed"),
+    (re.compile(r"partial|unable|missing|not |can't"), "partial"),
+    (re.compile(r"success|completed|done|ok"), "success"),
+)
+
 
 def extract_first_json_object(text: str) -> dict:
-    decoder = json.JSONDecoder()
-    for idx, char in enumerate(text):
-        if char != "{":
-            continue
+    raw_decode = _DECODER.raw_decode
+    idx = text.find("{")
+    while idx != -1:
         try:
-            obj, _end = decoder.raw_decode(text[idx:])
+            obj, _end = raw_decode(text, idx)
             if isinstance(obj, dict):
                 return obj
         except json.JSONDecodeError:
-            continue
+            pass
+        idx = text.find("{", idx + 1)
     raise ValueError("No valid JSON object found in Open Interpreter output")
 
 
 def parse_oi_report(raw_output: str) -> OIReport:
-    decoder = json.JSONDecoder()
+    raw_decode = _DECODER.raw_decode
     best_payload: dict[str, Any] | None = None
     best_score = -1
     best_report: OIReport | None = None
     best_report_score = -1
     last_error: Exception | None = None
 
-    for idx, char in enumerate(raw_output):
-        if char != "{":
-            continue
+    idx = -1
+    while True:
+        idx = raw_output.find("{", idx + 1)
+        if idx == -1:
+            break
         try:
-            payload, _end = decoder.raw_decode(raw_output[idx:])
+            payload, _end = raw_decode(raw_output, idx)
         except json.JSONDecodeError:
             continue
         if not isinstance(payload, dict):
@@ -96,6 +110,8 @@ def _coerce_payload(payload: dict[str, Any]) -> dict[str, Any]:
 def _coerce_actions_list(value: Any) -> list[str]:
     if not isinstance(value, list):
         return [str(value)]
+    if all(isinstance(item, str) for item in value):
+        return value
     out: list[str] = []
     for item in value:
         if isinstance(item, str):
@@ -119,12 +135,9 @@ def _coerce_actions_list(value: Any) -> list[str]:
 
 def _coerce_result(value: Any) -> str:
     text = str(value).strip().lower()
-    if text in {"success", "partial", "failed"}:
+    if text in _EXACT_RESULTS:
         return text
-    if any(token in text for token in ("fail", "error", "denied", "blocked")):
-        return "failed"
-    if any(token in text for token in ("partial", "unable", "missing", "not ", "can't")):
-        return "partial"
-    if any(token in text for token in ("success", "completed", "done", "ok")):
-        return "success"
+    for pattern, result in _RESULT_KEYWORDS:
+        if pattern.search(text):
+            return result
     return "partial"
@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import shlex
 import shutil
 import subprocess
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
+from typing import IO
+
+
+# Enough of the OI transcript tail to hold the final report JSON object.
+STREAM_TAIL_CHARS = 256 * 1024
+# How long to keep draining pipes after the child exits or is killed.
+_READER_GRACE_SECONDS = 5.0
 
 
 @dataclass(frozen=True)
@@ -52,41 +63,105 @@ goal: {task}
 def run_open_interpreter(prompt: str, timeout_seconds: int, run_dir: Path) -> RunnerResult:
     command = os.getenv("OI_BRIDGE_COMMAND", "interpreter").strip()
     command = _resolve_command(command)
-    args = _normalize_args(shlex.split(os.getenv("OI_BRIDGE_ARGS", "")))
-    args = _ensure_non_interactive_args(args)
+    args = _command_args(os.getenv("OI_BRIDGE_ARGS", ""))
     prompt = _prompt_for_stdin_mode(prompt)
     env = _build_runner_env(run_dir)
+    proc = subprocess.Popen(
+        [command, *args],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        bufsize=1,
+        env=env,
+    )
+    stdout_tail = _TailBuffer(STREAM_TAIL_CHARS)
+    stderr_tail = _TailBuffer(STREAM_TAIL_CHARS)
+    workers = [
+        threading.Thread(
+            target=_drain_stream,
+            args=(proc.stdout, run_dir / "oi_stdout.log", stdout_tail),
+            daemon=True,
+        ),
+        threading.Thread(
+            target=_drain_stream,
+            args=(proc.stderr, run_dir / "oi_stderr.log", stderr_tail),
+            daemon=True,
+        ),
+    ]
+    # Feed the prompt from a thread: a child that never reads stdin must not
+    # block us past the timeout once the pipe buffer fills.
+    workers.append(threading.Thread(target=_feed_stdin, args=(proc.stdin, prompt), daemon=True))
+    deadline = time.monotonic() + timeout_seconds
+    for worker in workers:
+        worker.start()
+
+    timed_out = False
+    try:
+        returncode = proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+    except subprocess.TimeoutExpired:
+        timed_out = True
+        proc.kill()
+        proc.wait()
+        returncode = 124
+    # Grandchildren may keep the pipes open after the child exits; don't hang on them.
+    join_deadline = time.monotonic() + _READER_GRACE_SECONDS
+    for worker in workers:
+        worker.join(timeout=max(0.0, join_deadline - time.monotonic()))
+    return RunnerResult(
+        stdout=stdout_tail.text(),
+        stderr=stderr_tail.text(),
+        returncode=returncode,
+        timed_out=timed_out,
+    )
+
+
+class _TailBuffer:
+    """Keep only the last `limit` characters written to it."""
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._chunks: deque[str] = deque()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def append(self, chunk: str) -> None:
+        with self._lock:
+            self._chunks.append(chunk)
+            self._size += len(chunk)
+            while self._size - len(self._chunks[0]) >= self._limit:
+                self._size -= len(self._chunks.popleft())
+
+    def text(self) -> str:
+        with self._lock:
+            joined = "".join(self._chunks)
+        return joined[-self._limit:]
+
+
+def _feed_stdin(stream: IO[str] | None, prompt: str) -> None:
+    if stream is None:
+        return
     try:
-        proc = subprocess.run(
-            [command, *args],
-            input=prompt,
-            text=True,
-            capture_output=True,
-            timeout=timeout_seconds,
-            check=False,
-            env=env,
-        )
-        return RunnerResult(
-            stdout=proc.stdout,
-            stderr=proc.stderr,
-            returncode=proc.returncode,
-            timed_out=False,
-        )
-    except subprocess.TimeoutExpired as exc:
-        stdout = exc.stdout if isinstance(exc.stdout, str) else (exc.stdout or b"").decode(
-            "utf-8", errors="replace"
-        )
-        stderr = exc.stderr if isinstance(exc.stderr, str) else (exc.stderr or b"").decode(
-            "utf-8", errors="replace"
-        )
-        return RunnerResult(
-            stdout=stdout,
-            stderr=stderr,
-            returncode=124,
-            timed_out=True,
-        )
+        stream.write(prompt)
+        stream.close()
+    except (BrokenPipeError, OSError, ValueError):
+        pass
 
 
+def _drain_stream(stream: IO[str] | None, log_path: Path, tail: _TailBuffer) -> None:
+    if stream is None:
+        return
+    with log_path.open("w", encoding="utf-8") as fh:
+        for chunk in stream:
+            fh.write(chunk)
+            fh.flush()
+            tail.append(chunk)
+    stream.close()
+
+
+@functools.lru_cache(maxsize=16)
 def _resolve_command(command: str) -> str:
     if os.path.sep in command:
         return command
@@ -99,6 +174,12 @@ def _resolve_command(command: str) -> str:
     return command
 
 
+@functools.lru_cache(maxsize=16)
+def _command_args(raw_args: str) -> tuple[str, ...]:
+    args = _normalize_args(shlex.split(raw_args))
+    return tuple(_ensure_non_interactive_args(args))
+
+
 def _normalize_args(args: list[str]) -> list[str]:
     normalized: list[str] = []
     for token in args:
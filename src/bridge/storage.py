@@ -2,16 +2,33 @@
 
 from __future__ import annotations
 
+import atexit
 import json
+import os
+import time
+from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
 
 
 RUNS_DIR = Path("runs")
 STATUS_PATH = RUNS_DIR / "status.json"
 
+# Append handles, one per log file, kept in least-recently-used order. They are
+# closed with close_logs() when a run ends, on eviction, or at interpreter exit.
+_LOG_HANDLES: dict[Path, _LogHandle] = {}
+_LOG_HANDLES_MAX = 8
+# How often a cached handle is checked against the path for rotation/deletion.
+_LOG_RECHECK_SECONDS = 1.0
+
 
 @dataclass(frozen=True)
 class RunContext:
@@ -23,18 +40,24 @@ class RunContext:
     report_path: Path
 
 
+@dataclass
+class _LogHandle:
+    fh: TextIO
+    checked_at: float
+
+
 def create_run_context() -> RunContext:
     RUNS_DIR.mkdir(parents=True, exist_ok=True)
     run_dir: Path | None = None
     run_id = ""
+    base = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
     for attempt in range(100):
-        base = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
-        suffix = f"-{attempt:02d}" if attempt else ""
-        run_id = f"{base}{suffix}"
+        run_id = f"{base}-{attempt:02d}" if attempt else base
         candidate = RUNS_DIR / run_id
-        if candidate.exists():
+        try:
+            candidate.mkdir(exist_ok=False)
+        except FileExistsError:
             continue
-        candidate.mkdir(parents=True, exist_ok=False)
         run_dir = candidate
         break
     if run_dir is None:
@@ -50,17 +73,92 @@ def create_run_context() -> RunContext:
 
 
 def append_log(path: Path, message: str) -> None:
-    with path.open("a", encoding="utf-8") as fh:
-        fh.write(message.rstrip() + "\n")
+    handle = _LOG_HANDLES.pop(path, None)
+    now = time.monotonic()
+    if handle is not None and now - handle.checked_at >= _LOG_RECHECK_SECONDS:
+        # A rotated or deleted log leaves the handle on an unlinked inode; reopen then.
+        if not _handle_matches_path(handle.fh, path):
+            _close_handle(handle)
+            handle = None
+        else:
+            handle.checked_at = now
+    if handle is None:
+        handle = _open_log(path, now)
+    # Re-inserting keeps the dict in least-recently-used order for eviction.
+    _LOG_HANDLES[path] = handle
+    try:
+        handle.fh.write(message.rstrip() + "\n")
+    except (OSError, ValueError):
+        # Closed or failing handle: drop it and retry once on a fresh one.
+        close_log(path)
+        handle = _open_log(path, now)
+        _LOG_HANDLES[path] = handle
+        handle.fh.write(message.rstrip() + "\n")
+
+
+def _open_log(path: Path, now: float) -> _LogHandle:
+    while len(_LOG_HANDLES) >= _LOG_HANDLES_MAX:
+        close_log(next(iter(_LOG_HANDLES)))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Line-buffered O_APPEND writes keep each line visible to `bridge logs`/`live`.
+    return _LogHandle(fh=path.open("a", encoding="utf-8", buffering=1), checked_at=now)
+
+
+def _handle_matches_path(fh: TextIO, path: Path) -> bool:
+    try:
+        opened = os.fstat(fh.fileno())
+        current = path.stat()
+    except (OSError, ValueError):
+        return False
+    return (opened.st_dev, opened.st_ino) == (current.st_dev, current.st_ino)
+
+
+def _close_handle(handle: _LogHandle) -> None:
+    try:
+        handle.fh.close()
+    except OSError:
+        pass
+
+
+def close_log(path: Path) -> None:
+    handle = _LOG_HANDLES.pop(path, None)
+    if handle is not None:
+        _close_handle(handle)
+
+
+def close_logs() -> None:
+    for path in list(_LOG_HANDLES):
+        close_log(path)
+
+
+atexit.register(close_logs)
 
 
 def write_json(path: Path, payload: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        try:
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            data = None
+        if data is not None:
+            path.write_bytes(data)
+            return
     with path.open("w", encoding="utf-8") as fh:
         json.dump(payload, fh, indent=2, ensure_ascii=False)
         fh.write("\n")
 
 
+def json_line(payload: Any) -> str:
+    """Encode payload as one compact JSON line (no trailing newline)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(payload, ensure_ascii=False)
+
+
 def write_status(
     *,
     run_id: str,
@@ -94,6 +192,8 @@ def write_status(
 def status_payload() -> dict[str, Any]:
     if not STATUS_PATH.exists():
         return {"status": "no-runs"}
+    if orjson is not None:
+        return orjson.loads(STATUS_PATH.read_bytes())
     with STATUS_PATH.open("r", encoding="utf-8") as fh:
         return json.load(fh)
 
@@ -102,5 +202,9 @@ def tail_lines(path: Path, line_count: int) -> list[str]:
     if not path.exists():
         return []
     with path.open("r", encoding="utf-8") as fh:
-        lines = fh.readlines()
-    return [line.rstrip("\n") for line in lines[-line_count:]]
+        if line_count > 0:
+            # Stream the file and keep only the tail instead of materializing every line.
+            lines: Iterable[str] = deque(fh, maxlen=line_count)
+        else:
+            lines = fh.readlines()[-line_count:]
+    return [line.rstrip("\n") for line in lines]
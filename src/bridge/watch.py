@@ -1,39 +1,41 @@
-"""Real-time watcher for web session observer state (/state polling)."""
+"""Real-time watcher for web session observer state (/state long-poll)."""
 
 from __future__ import annotations
 
-import json
+import functools
 import sys
 import time
+from array import array
+from collections.abc import Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 
+from bridge.storage import json_line
 from bridge.web_session import (
+    AgentConnection,
     get_last_session,
     load_and_refresh_session,
     refresh_session_state,
     request_session_state,
+    request_session_state_since,
     session_agent_online,
     session_is_alive,
 )
 
 
+_SEVERITY_RANK = {"error": 3, "warn": 2, "info": 1}
+_ONLY_MIN_RANK = {"errors": 3, "warn": 2}
+
+
 def _severity_rank(severity: str) -> int:
-    s = (severity or "").strip().lower()
-    if s == "error":
-        return 3
-    if s == "warn":
-        return 2
-    return 1
+    return _SEVERITY_RANK.get(severity.lower(), 1) if severity else 1
 
 
 def _min_rank_from_only(only: str) -> int:
-    if only == "errors":
-        return 3
-    if only == "warn":
-        return 2
-    return 1
+    return _ONLY_MIN_RANK.get(only, 1)
 
 
+@functools.lru_cache(maxsize=1024)
 def _safe_time_hhmmss(iso_text: str) -> str:
     try:
         dt = datetime.fromisoformat(str(iso_text).replace("Z", "+00:00"))
@@ -42,61 +44,109 @@ def _safe_time_hhmmss(iso_text: str) -> str:
         return "--:--:--"
 
 
-def _format_event_line(evt: dict[str, object]) -> str:
-    t = _safe_time_hhmmss(str(evt.get("created_at", "")))
-    etype = str(evt.get("type", "") or "unknown").strip()
-    sev = str(evt.get("severity", "") or "info").strip().lower()
-    target = str(evt.get("target", "") or "").strip()
-    selector = str(evt.get("selector", "") or "").strip()
+def _text(evt: dict[str, object], key: str) -> str:
+    # Observer fields are almost always str already; only coerce the odd non-str value.
+    value = evt.get(key)
+    if value.__class__ is str:
+        return value.strip()
+    return str(value or "").strip()
+
+
+def _fmt_problem(t: str, label: str, etype: str, evt: dict[str, object]) -> str:
+    msg = _text(evt, "message")
+    if msg:
+        return f"{t} {label} {msg}"
+    url = _text(evt, "url")
+    status = int(evt.get("status", 0) or 0)
+    if status:
+        return f"{t} {label} http {status} url={url}"
+    return f"{t} {label} {etype} url={url}"
+
+
+def _fmt_click(t: str, evt: dict[str, object]) -> str:
+    parts = [f"{t} click"]
+    target = _text(evt, "target")
+    if target:
+        parts.append(f'target="{target}"')
+    selector = _text(evt, "selector")
+    if selector:
+        parts.append(f"selector={selector}")
+    url = _text(evt, "url")
+    if url:
+        parts.append(f"url={url}")
+    return " ".join(parts)
+
+
+def _fmt_mousemove(t: str, evt: dict[str, object]) -> str:
     x = int(evt.get("x", 0) or 0)
     y = int(evt.get("y", 0) or 0)
+    return f"{t} mousemove x={x} y={y}"
+
+
+def _fmt_scroll(t: str, evt: dict[str, object]) -> str:
     scroll_y = int(evt.get("scroll_y", 0) or 0)
-    url = str(evt.get("url", "") or "").strip()
-    msg = str(evt.get("message", "") or "").strip()
-    status = int(evt.get("status", 0) or 0)
+    return f"{t} scroll y={scroll_y}"
+
+
+_SEVERITY_LABELS = {"error": "ERROR", "warn": "WARN"}
+_INFO_FORMATTERS = {
+    "click": _fmt_click,
+    "mousemove": _fmt_mousemove,
+    "scroll": _fmt_scroll,
+}
+
+
+def _format_event_line(evt: dict[str, object]) -> str:
+    created_at = evt.get("created_at", "")
+    t = _safe_time_hhmmss(created_at if created_at.__class__ is str else str(created_at))
+    etype = _text(evt, "type") or "unknown"
+    sev = (_text(evt, "severity") or "info").lower()
+
+    label = _SEVERITY_LABELS.get(sev)
+    if label is not None:
+        return _fmt_problem(t, label, etype, evt)
 
-    if sev == "error":
-        if msg:
-            return f"{t} ERROR {msg}"
-        if status:
-            return f"{t} ERROR http {status} url={url}"
-        return f"{t} ERROR {etype} url={url}"
-
-    if sev == "warn":
-        if msg:
-            return f"{t} WARN {msg}"
-        if status:
-            return f"{t} WARN http {status} url={url}"
-        return f"{t} WARN {etype} url={url}"
-
-    if etype == "click":
-        parts = [f"{t} click"]
-        if target:
-            parts.append(f'target="{target}"')
-        if selector:
-            parts.append(f"selector={selector}")
-        if url:
-            parts.append(f"url={url}")
-        return " ".join(parts)
-    if etype == "mousemove":
-        return f"{t} mousemove x={x} y={y}"
-    if etype == "scroll":
-        return f"{t} scroll y={scroll_y}"
+    formatter = _INFO_FORMATTERS.get(etype)
+    if formatter is not None:
+        return formatter(t, evt)
 
+    msg = _text(evt, "message")
     if msg:
         return f"{t} {etype} {msg}"
+    url = _text(evt, "url")
     return f"{t} {etype} url={url}"
 
 
-def _event_key(evt: dict[str, object]) -> str:
-    return "|".join(
-        [
-            str(evt.get("created_at", "")),
-            str(evt.get("type", "")),
-            str(evt.get("message", "")),
-            str(evt.get("status", "")),
-        ]
-    )
+class _SeenCache:
+    """Fixed-size dedup cache: one hash per slot, collisions evict the older key.
+
+    A false miss only re-prints an event, so memory stays bounded for long watches.
+    """
+
+    def __init__(self, bits: int = 14) -> None:
+        self._mask = (1 << bits) - 1
+        self._slots = array("q", bytes(8 << bits))
+
+    def add(self, key: Hashable) -> None:
+        h = hash(key) or 1
+        self._slots[h & self._mask] = h
+
+    def __contains__(self, key: Hashable) -> bool:
+        h = hash(key) or 1
+        return self._slots[h & self._mask] == h
+
+
+def _seen_key(created_at: str, evt: dict[str, object]) -> tuple[str, str, str, str]:
+    # Agents may send a dict/list message or status; hash its text, not the raw value.
+    return (created_at, _text(evt, "type"), _text(evt, "message"), _text(evt, "status"))
+
+
+# Constant envelope around each event; only the event itself goes through the encoder.
+_EVENT_ENVELOPE_PREFIX = '{"type":"event","event":'
+
+
+def _event_json_line(evt: dict[str, object]) -> str:
+    return _EVENT_ENVELOPE_PREFIX + json_line(evt) + "}"
 
 
 def _watch_loop(
@@ -109,109 +159,228 @@ def _watch_loop(
     print_events: int,
     only: str,
     notify: bool,
+    max_interval_ms: int | None = None,
 ) -> None:
+    base_ms = max(50, int(interval_ms))
+    # Idle polls back off exponentially up to the cap; any activity snaps back to base_ms.
+    cap_ms = max(base_ms, int(max_interval_ms) if max_interval_ms else base_ms * 5)
+    idle_cycles = 0
     min_rank = _min_rank_from_only(only)
-    seen: set[str] = set()
+    seen = _SeenCache()
     cursor = ""
-    prev_incident = None
-    prev_ack_count = None
 
-    first = True
-    while True:
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+
+    # Pick the renderer once; text formatting never runs in JSON mode.
+    render = _event_json_line if json_mode else _format_event_line
+
+    def emit_and_sleep(lines: list[str], bell: str, active: bool) -> bool:
+        nonlocal idle_cycles
+        # One write per poll cycle instead of one print per event.
+        if lines:
+            write(bell + "\n".join(lines) + "\n")
+            flush()
+        if active or lines:
+            idle_cycles = 0
+        else:
+            idle_cycles += 1
+        delay_ms = min(base_ms << min(idle_cycles, 3), cap_ms)
+        try:
+            sleep_fn(delay_ms / 1000.0)
+        except KeyboardInterrupt:
+            return False
+        return True
+
+    # Initial poll: establish the cursor/baselines and optionally replay the tail.
+    try:
         state = fetch_state() or {}
+    except KeyboardInterrupt:
+        return
+    lines: list[str] = []
+    last_event_at = str(state.get("last_event_at", "") or "")
+    if since_last and last_event_at:
+        cursor = last_event_at
+    if print_events and not since_last:
+        events = state.get("recent_events") or ()
+        tail = [
+            evt
+            for evt in events[-int(print_events):]
+            if isinstance(evt, dict)
+            and (
+                min_rank == 1
+                or _severity_rank(str(evt.get("severity", "") or "info")) >= min_rank
+            )
+        ]
+        for evt in tail:
+            created_at = str(evt.get("created_at", "") or "")
+            seen.add(_seen_key(created_at, evt))
+        lines.extend(render(evt) for evt in tail)
+    prev_incident = bool(state.get("incident_open", False))
+    prev_ack_count = int(state.get("ack_count", 0) or 0)
+    if not emit_and_sleep(lines, "", False):
+        return
+
+    while True:
+        try:
+            state = fetch_state() or {}
+        except KeyboardInterrupt:
+            return
         incident_open = bool(state.get("incident_open", False))
         last_error = str(state.get("last_error", "") or "")
         ack_count = int(state.get("ack_count", 0) or 0)
-        events = list(state.get("recent_events", []) or [])
-
-        if first:
-            last_event_at = str(state.get("last_event_at", "") or "")
-            if since_last and last_event_at:
-                cursor = last_event_at
-            if print_events and not since_last:
-                tail = events[-int(print_events):]
-                for evt in tail:
-                    if not isinstance(evt, dict):
-                        continue
-                    sev = str(evt.get("severity", "") or "info")
-                    if _severity_rank(sev) < min_rank:
-                        continue
-                    key = _event_key(evt)
-                    seen.add(key)
-                    if json_mode:
-                        print(json.dumps({"type": "event", "event": evt}, ensure_ascii=False))
-                    else:
-                        print(_format_event_line(evt))
-            prev_incident = incident_open
-            prev_ack_count = ack_count
-            first = False
-        else:
-            if prev_incident is not None and incident_open != prev_incident:
-                if incident_open:
-                    if notify:
-                        sys.stdout.write("\a")
-                        sys.stdout.flush()
-                    if json_mode:
-                        print(
-                            json.dumps(
-                                {
-                                    "type": "incident_open",
-                                    "last_error": last_error,
-                                    "error_count": int(state.get("error_count", 0) or 0),
-                                },
-                                ensure_ascii=False,
-                            )
-                        )
-                    else:
-                        print(f"INCIDENT OPEN: {last_error}".rstrip())
-                else:
-                    if json_mode:
-                        print(
-                            json.dumps(
-                                {"type": "incident_cleared", "ack_count": ack_count},
-                                ensure_ascii=False,
-                            )
-                        )
-                    else:
-                        print(f"INCIDENT CLEARED (ack_count={ack_count})")
-
-            if prev_ack_count is not None and ack_count > prev_ack_count:
+        events = state.get("recent_events") or ()
+        lines = []
+        bell = ""
+        active = False
+
+        if incident_open != prev_incident:
+            if incident_open:
+                if notify:
+                    bell = "\a"
                 if json_mode:
-                    print(json.dumps({"type": "ack", "ack_count": ack_count}, ensure_ascii=False))
+                    error_count = int(state.get("error_count", 0) or 0)
+                    lines.append(
+                        f'{{"type":"incident_open","last_error":{json_line(last_error)},'
+                        f'"error_count":{error_count}}}'
+                    )
                 else:
-                    print(f"ACK (ack_count={ack_count})")
-
-            for evt in events:
-                if not isinstance(evt, dict):
-                    continue
-                created_at = str(evt.get("created_at", "") or "")
-                key = _event_key(evt)
-                if key in seen:
-                    continue
-                if cursor and created_at and created_at <= cursor:
-                    seen.add(key)
-                    continue
-                sev = str(evt.get("severity", "") or "info")
-                if _severity_rank(sev) < min_rank:
-                    seen.add(key)
-                    continue
-                seen.add(key)
-                if created_at and created_at > cursor:
-                    cursor = created_at
+                    lines.append(f"INCIDENT OPEN: {last_error}".rstrip())
+            else:
                 if json_mode:
-                    print(json.dumps({"type": "event", "event": evt}, ensure_ascii=False))
+                    lines.append(f'{{"type":"incident_cleared","ack_count":{ack_count}}}')
                 else:
-                    print(_format_event_line(evt))
+                    lines.append(f"INCIDENT CLEARED (ack_count={ack_count})")
 
-            prev_incident = incident_open
-            prev_ack_count = ack_count
+        if ack_count > prev_ack_count:
+            if json_mode:
+                lines.append(f'{{"type":"ack","ack_count":{ack_count}}}')
+            else:
+                lines.append(f"ACK (ack_count={ack_count})")
 
-        try:
-            sleep_fn(max(50, int(interval_ms)) / 1000.0)
-        except KeyboardInterrupt:
+        # Severity is the cheapest reject (most events are info), so it runs before the
+        # timestamp is pulled; with --only info it is skipped entirely. Dedup keys are only
+        # built for events that would actually be printed.
+        pairs = [
+            (str(evt.get("created_at", "") or ""), evt)
+            for evt in events
+            if isinstance(evt, dict)
+            and (
+                min_rank == 1
+                or _severity_rank(str(evt.get("severity", "") or "info")) >= min_rank
+            )
+        ]
+        for created_at, evt in pairs:
+            if cursor and created_at and created_at <= cursor:
+                continue
+            # Tuple keys hash the fields directly; no joined string per event.
+            key = _seen_key(created_at, evt)
+            if key in seen:
+                continue
+            seen.add(key)
+            active = True
+            if created_at > cursor:
+                cursor = created_at
+            lines.append(render(evt))
+
+        prev_incident = incident_open
+        prev_ack_count = ack_count
+        if not emit_and_sleep(lines, bell, active):
             return
 
 
+class _PrefetchingFetcher:
+    """Overlap the next /state request with the tail of the poll sleep.
+
+    The request is started one (smoothed) round-trip before the sleep ends, so a
+    poll cycle costs max(interval, latency) instead of interval + latency.
+    """
+
+    def __init__(self, fetch_state, sleep_fn=time.sleep) -> None:
+        self._fetch_state = fetch_state
+        self._sleep_fn = sleep_fn
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bridge-watch")
+        self._pending: Future | None = None
+        self._latency = 0.0
+
+    def _timed_fetch(self):
+        started = time.monotonic()
+        try:
+            return self._fetch_state()
+        finally:
+            elapsed = time.monotonic() - started
+            self._latency = elapsed if not self._latency else 0.7 * self._latency + 0.3 * elapsed
+
+    def fetch(self):
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return self._timed_fetch()
+        return pending.result()
+
+    def sleep(self, seconds: float) -> None:
+        lead = min(self._latency, seconds)
+        self._sleep_fn(seconds - lead)
+        self._pending = self._executor.submit(self._timed_fetch)
+        self._sleep_fn(lead)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _LongPollFetcher:
+    """Fetch observer deltas via /state long-poll; the agent blocks until something changes.
+
+    The first call returns the full state (needed for --print-events/--since-last).
+    Agents without long-poll support fall back to interval polling.
+    """
+
+    def __init__(self, session, wait_seconds: float) -> None:
+        self._session = session
+        self._client = AgentConnection(session.control_port)
+        self._wait_seconds = wait_seconds
+        self._version: int | None = None
+        self._cursor = ""
+        self._fallback: _PrefetchingFetcher | None = None
+
+    def fetch(self):
+        if self._fallback is not None:
+            return self._fallback.fetch()
+        if self._version is None:
+            state = self._plain_fetch()
+        else:
+            state = request_session_state_since(
+                self._session,
+                version=self._version,
+                cursor=self._cursor,
+                wait_seconds=self._wait_seconds,
+                client=self._client,
+            )
+            if state is None:
+                self._fallback = _PrefetchingFetcher(self._plain_fetch)
+                return self._fallback.fetch()
+        if "version" not in state:
+            self._fallback = _PrefetchingFetcher(self._plain_fetch)
+        self._version = int(state.get("version", 0) or 0)
+        for evt in state.get("recent_events", []) or []:
+            created_at = str(evt.get("created_at", "") or "") if isinstance(evt, dict) else ""
+            if created_at > self._cursor:
+                self._cursor = created_at
+        return state
+
+    def _plain_fetch(self):
+        return request_session_state(self._session, client=self._client)
+
+    def sleep(self, seconds: float) -> None:
+        # In long-poll mode the wait happens server-side inside fetch().
+        if self._fallback is not None:
+            self._fallback.sleep(seconds)
+
+    def close(self) -> None:
+        if self._fallback is not None:
+            self._fallback.close()
+        self._client.close()
+
+
 def watch_command(
     *,
     attach: str,
@@ -221,9 +390,12 @@ def watch_command(
     print_events: int,
     only: str,
     notify: bool,
+    max_interval_ms: int | None = None,
 ) -> None:
     if interval_ms < 50:
         raise SystemExit("--interval-ms must be >= 50")
+    if max_interval_ms is not None and max_interval_ms < interval_ms:
+        raise SystemExit("--max-interval-ms must be >= --interval-ms")
 
     if attach.strip().lower() == "last":
         session = get_last_session()
@@ -238,16 +410,18 @@ def watch_command(
     if not session_agent_online(session):
         raise SystemExit("Session control agent offline.")
 
-    def fetch_state():
-        return request_session_state(session)
-
-    _watch_loop(
-        fetch_state=fetch_state,
-        sleep_fn=time.sleep,
-        interval_ms=interval_ms,
-        since_last=since_last,
-        json_mode=json_mode,
-        print_events=print_events,
-        only=only,
-        notify=notify,
-    )
+    fetcher = _LongPollFetcher(session, wait_seconds=max(1.0, interval_ms / 1000.0 * 10))
+    try:
+        _watch_loop(
+            fetch_state=fetcher.fetch,
+            sleep_fn=fetcher.sleep,
+            interval_ms=interval_ms,
+            since_last=since_last,
+            json_mode=json_mode,
+            print_events=print_events,
+            only=only,
+            notify=notify,
+            max_interval_ms=max_interval_ms,
+        )
+    finally:
+        fetcher.close()
@@ -7,6 +7,7 @@ import re
 import socket
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable
 from urllib.parse import urlparse
@@ -99,6 +100,7 @@ from bridge.web_preflight import (
 from bridge.web_run_bootstrap import (
     apply_runtime_page_timeout as _bootstrap_apply_runtime_page_timeout,
     attach_page_observers as _bootstrap_attach_page_observers,
+    build_run_paths as _bootstrap_build_run_paths,
     install_visual_overlay_initial as _bootstrap_install_visual_overlay_initial,
     load_run_timing_config as _bootstrap_load_run_timing_config,
     setup_browser_page as _bootstrap_setup_browser_page,
@@ -128,8 +130,8 @@ from bridge.web_teaching import (
     write_teaching_artifacts as _teaching_write_artifacts,
 )
 from bridge.web_watchdog import (
+    WebWatchdogConfig,
     WebWatchdogState,
-    remaining_ms as watchdog_remaining_ms,
     update_step_signature,
 )
 from bridge.web_handoff_actions import (
@@ -163,6 +165,7 @@ from bridge.web_visual_runtime import (
 )
 from bridge.web_runtime_safety import (
     capture_timeout_evidence as _safety_capture_timeout_evidence,
+    count_useful_events as _safety_count_useful_events,
     is_page_closed_error as _safety_is_page_closed_error,
     page_is_closed as _safety_page_is_closed,
     runtime_closed as _safety_runtime_closed,
@@ -176,6 +179,7 @@ from bridge.web_session import (
 from bridge.web_session_overlay_ops import (
     destroy_session_top_bar as _ops_destroy_session_top_bar,
     ensure_session_top_bar as _ops_ensure_session_top_bar,
+    release_and_destroy_session_top_bar as _ops_release_and_destroy_session_top_bar,
     release_session_control_overlay as _ops_release_session_control_overlay,
 )
 from bridge.web_target_preflight import (
@@ -214,17 +218,25 @@ def run_web_task(
     keep_open: bool = False,
     teaching_mode: bool = False,
 ) -> OIReport:
-    url_match = _URL_RE.search(task)
+    # Cheap substring scan rejects URL-less tasks before the regex runs.
+    url_match = _URL_RE.search(task) if "http" in task else None
     if not url_match:
         raise SystemExit("Web mode requires an explicit URL in task.")
     url = _normalize_url(url_match.group(0))
     if not _is_valid_url(url):
         raise SystemExit(f"Web mode received invalid URL token: {url_match.group(0)}")
-    _preflight_target_reachable(url)
-    _preflight_stack_prereqs()
-    steps = _parse_steps(task)
+    # The TCP probe can sit on a connect timeout; overlap it with the stack
+    # checks and step parsing. Its error still wins, as when run first.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        reachable = pool.submit(_preflight_target_reachable, url)
+        try:
+            _preflight_stack_prereqs()
+            steps = _parse_steps(task)
+            playwright_ok = _playwright_available()
+        finally:
+            reachable.result()
 
-    if not _playwright_available():
+    if not playwright_ok:
         raise SystemExit(
             "Playwright Python package is not installed. "
             "Install it in the environment to use --mode web."
@@ -275,6 +287,7 @@ def run_web_task(
         _reporting_persist_report_and_status(
             report=report,
             run_dir=run_dir,
+            report_path=_bootstrap_build_run_paths(run_dir).report,
             task=task,
             write_json_fn=write_json,
             write_status_fn=write_status,
@@ -311,6 +324,16 @@ def destroy_session_top_bar(session: WebSession) -> None:
     _ops_destroy_session_top_bar(session, destroy_top_bar=_destroy_top_bar)
 
 
+def release_and_destroy_session_top_bar(session: WebSession) -> None:
+    _ops_release_and_destroy_session_top_bar(
+        session,
+        set_assistant_control_overlay=_set_assistant_control_overlay,
+        update_top_bar_state=_update_top_bar_state,
+        session_state_payload=_session_state_payload,
+        destroy_top_bar=_destroy_top_bar,
+    )
+
+
 def ensure_session_top_bar(session: WebSession) -> None:
     _ops_ensure_session_top_bar(
         session,
@@ -359,7 +382,8 @@ def _execute_playwright(
 ) -> OIReport:
     from playwright.sync_api import sync_playwright
 
-    evidence_dir = run_dir / "evidence"
+    run_paths = _bootstrap_build_run_paths(run_dir)
+    evidence_dir = run_paths.evidence
     evidence_dir.mkdir(parents=True, exist_ok=True)
 
     actions: list[str] = []
@@ -398,7 +422,7 @@ def _execute_playwright(
         browser = setup.browser
         page = setup.page
         attached = setup.attached
-        overlay_debug_path = evidence_dir / "step_overlay_debug.png"
+        overlay_debug_path = run_paths.overlay_debug
         _bootstrap_install_visual_overlay_initial(
             page=page,
             visual=visual,
@@ -426,6 +450,7 @@ def _execute_playwright(
         learning_window_seconds = timing_cfg.learning_window_seconds
         post_action_pause_ms = timing_cfg.post_action_pause_ms
         watchdog_cfg = timing_cfg.watchdog_cfg
+        movement_capture_mode = timing_cfg.movement_capture_mode
         _bootstrap_apply_runtime_page_timeout(
             page=page,
             timeout_seconds=timeout_seconds,
@@ -441,7 +466,7 @@ def _execute_playwright(
                 visual=visual,
                 visual_cursor=visual_cursor,
                 overlay_debug_path=overlay_debug_path,
-                evidence_dir=evidence_dir,
+                context_shot_path=run_paths.context_shot,
                 actions=actions,
                 observations=observations,
                 ui_findings=ui_findings,
@@ -463,9 +488,6 @@ def _execute_playwright(
             learning_context = preflight.learning_context
             run_state.control_enabled = preflight.control_enabled
 
-            def _remaining_ms(deadline_ts: float) -> int:
-                return watchdog_remaining_ms(deadline_ts, now_ts=time.monotonic())
-
             def _apply_handoff_decision(decision: HandoffDecision) -> bool:
                 return _state_apply_handoff_decision(run_state, decision)
 
@@ -552,9 +574,9 @@ def _execute_playwright(
                 console_errors=console_errors,
                 evidence_paths=evidence_paths,
                 learning_notes=learning_notes,
-                stuck_interactive_seconds=watchdog_cfg.stuck_interactive_seconds,
-                stuck_step_seconds=watchdog_cfg.stuck_step_seconds,
-                interactive_step_kinds=set(INTERACTIVE_STEP_KINDS),
+                watchdog_cfg=watchdog_cfg,
+                movement_capture_mode=movement_capture_mode,
+                interactive_step_kinds=INTERACTIVE_STEP_KINDS,
                 step_learning_target=_step_learning_target,
                 update_step_signature=update_step_signature,
                 apply_step_common_prechecks=_step_apply_common_prechecks,
@@ -579,7 +601,6 @@ def _execute_playwright(
                 append_interactive_timeout_findings=append_interactive_timeout_findings,
                 append_wait_timeout_findings=append_wait_timeout_findings,
                 ensure_visual_overlay_ready_best_effort=_ensure_visual_overlay_ready_best_effort,
-                remaining_ms=_remaining_ms,
                 trigger_timeout_handoff=_trigger_timeout_handoff,
                 watchdog_stuck_attempt=_watchdog_stuck_attempt,
                 apply_handoff_decision=_apply_handoff_decision,
@@ -676,19 +697,11 @@ def _observer_useful_event_count(session: WebSession | None) -> int:
         state = request_session_state(session)
     except BaseException:
         return 0
-    events = list(state.get("recent_events", []) or [])
-    noise_mode = str(state.get("observer_noise_mode", _observer_noise_mode())).strip().lower()
-    useful_types = {"click", "network_warn", "network_error", "console_error", "page_error"}
-    if noise_mode == "debug":
-        useful_types.update({"scroll", "mousemove"})
-    count = 0
-    for evt in events:
-        if not isinstance(evt, dict):
-            continue
-        etype = str(evt.get("type", "")).strip().lower()
-        if etype in useful_types:
-            count += 1
-    return count
+    # The agent reports its own mode; only fall back to the env when it doesn't.
+    noise_mode = state.get("observer_noise_mode")
+    if noise_mode is None:
+        noise_mode = _observer_noise_mode()
+    return _safety_count_useful_events(state.get("recent_events"), noise_mode)
 
 
 def _capture_timeout_evidence(
@@ -726,10 +739,10 @@ def _apply_interactive_step_with_retries(
     learning_selectors: list[str],
     session: WebSession | None,
     step_label: str,
-    stuck_interactive_seconds: float,
-    stuck_step_seconds: float,
+    watchdog_cfg: WebWatchdogConfig,
     step_deadline_ts: float,
     run_deadline_ts: float,
+    movement_capture_mode: str = "svg_and_png",
 ) -> _RetryResult:
     return _retries_apply_interactive_step_with_retries(
         page=page,
@@ -750,10 +763,10 @@ def _apply_interactive_step_with_retries(
         learning_selectors=learning_selectors,
         session=session,
         step_label=step_label,
-        stuck_interactive_seconds=stuck_interactive_seconds,
-        stuck_step_seconds=stuck_step_seconds,
+        watchdog_cfg=watchdog_cfg,
         step_deadline_ts=step_deadline_ts,
         run_deadline_ts=run_deadline_ts,
+        movement_capture_mode=movement_capture_mode,
         to_repo_rel=_to_repo_rel,
         observer_useful_event_count=_observer_useful_event_count,
         retry_scroll=_retry_scroll,
@@ -832,10 +845,9 @@ def _write_learning_audit(target: str, selector: str, context: dict[str, str], s
     )
 
 
-def _normalize_learning_target_key(raw: str, *, selector: str = "") -> str:
+def _normalize_learning_target_key(raw: str) -> str:
     return _learning_normalize_target_key(
         raw,
-        selector=selector,
         normalize_failed_target_label=_normalize_failed_target_label,
     )
 
@@ -969,11 +981,7 @@ def _restore_iframe_pointer_events(page: Any, token: dict[str, Any] | None) -> N
 
 
 def _force_main_frame_context(page: Any, max_seconds: float = 8.0) -> bool:
-    return _frame_force_main_frame_context(
-        page,
-        max_seconds=max_seconds,
-        iframe_focus_locked=_is_iframe_focus_locked,
-    )
+    return _frame_force_main_frame_context(page, max_seconds=max_seconds)
 
 
 def _show_learning_thanks_notice(page: Any, target: str) -> None:
@@ -1122,6 +1130,7 @@ def _apply_interactive_step(
     timeout_ms: int = 8000,
     movement_capture_dir: Path | None = None,
     evidence_paths: list[str] | None = None,
+    movement_capture_mode: str = "svg_and_png",
 ) -> None:
     _executor_apply_interactive_step(
         page=page,
@@ -1138,6 +1147,7 @@ def _apply_interactive_step(
         timeout_ms=timeout_ms,
         movement_capture_dir=movement_capture_dir,
         evidence_paths=evidence_paths,
+        movement_capture_mode=movement_capture_mode,
         disable_active_youtube_iframe_pointer_events=_disable_active_youtube_iframe_pointer_events,
         force_main_frame_context=_force_main_frame_context,
         restore_iframe_pointer_events=_restore_iframe_pointer_events,
@@ -2,17 +2,37 @@
 
 from __future__ import annotations
 
+import functools
 import importlib.util
+import sys
+from typing import Any, Callable
 from urllib.parse import urlparse
 
 
-def collapse_ws(value: object) -> str:
-    return " ".join(str(value or "").split())
+def collapse_ws(value: object, limit: int | None = None) -> str:
+    text = str(value or "")
+    if limit is None:
+        return " ".join(text.split())
+    # Any limit//2 + 1 words already span `limit` chars once joined, so split
+    # no further than that; the trailing remainder element is dropped.
+    words = limit // 2 + 1
+    return " ".join(text.split(None, words)[:words])[:limit]
+
+
+def compact_js(source: str) -> str:
+    """Strip indentation and blank lines from an inline page script.
+
+    Line breaks are kept, so `//` comments stay terminated; the only scripts
+    this would change are ones with multi-line string literals.
+    """
+    return "\n".join(line.strip() for line in source.strip().splitlines() if line.strip())
+
+
+_GENERIC_PLAY_LABELS = frozenset({"reproducir", "play", "play local"})
 
 
 def is_generic_play_label(value: str) -> bool:
-    low = str(value or "").strip().lower()
-    return low in {"reproducir", "play", "play local"}
+    return str(value or "").strip().lower() in _GENERIC_PLAY_LABELS
 
 
 def normalize_url(raw: str) -> str:
@@ -62,8 +82,29 @@ def same_origin_path(current_url: str, target_url: str) -> bool:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def playwright_available() -> bool:
-    return importlib.util.find_spec("playwright.sync_api") is not None
+    try:
+        return importlib.util.find_spec("playwright.sync_api") is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def sync_playwright_factory() -> Callable[[], Any] | None:
+    """Return ``playwright.sync_api.sync_playwright`` or None when missing.
+
+    An already-imported module is a plain ``sys.modules`` hit; a missing
+    install is only searched for once via the cached ``playwright_available``.
+    """
+    module = sys.modules.get("playwright.sync_api")
+    if module is None:
+        if not playwright_available():
+            return None
+        try:
+            import playwright.sync_api as module
+        except Exception:
+            return None
+    return getattr(module, "sync_playwright", None)
 
 
 def safe_page_title(page: object) -> str:
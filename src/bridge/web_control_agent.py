@@ -9,8 +9,9 @@ import time
 from collections import deque
 from datetime import datetime, timezone
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from threading import Lock
+from threading import Condition, Lock
 from typing import Any
+from urllib.parse import parse_qs, urlsplit
 
 from bridge.web_session import (
     close_session,
@@ -24,6 +25,9 @@ from bridge.web_session import (
 class _AgentRuntime:
     def __init__(self) -> None:
         self._lock = Lock()
+        # Notified on every observable change so /state long-polls wake up.
+        self._changed = Condition(self._lock)
+        self._version = 0
         self._events: deque[dict[str, Any]] = deque(maxlen=120)
         self._incident_open = False
         self._last_error = ""
@@ -76,6 +80,8 @@ class _AgentRuntime:
                 self._error_count += 1
                 reason = event["message"] or event["url"] or event_type
                 self._last_error = reason[:220]
+            self._version += 1
+            self._changed.notify_all()
 
     def set_learning_active(self, seconds: float) -> None:
         with self._lock:
@@ -116,6 +122,12 @@ class _AgentRuntime:
             self._ack_count += 1
             self._last_ack_at = datetime.now(timezone.utc).isoformat()
             self._last_ack_by = actor[:40]
+            self._version += 1
+            self._changed.notify_all()
+
+    def wait_for_change(self, version: int, timeout: float) -> None:
+        with self._changed:
+            self._changed.wait_for(lambda: self._version != version, timeout=timeout)
 
     def snapshot(self) -> dict[str, Any]:
         with self._lock:
@@ -135,10 +147,12 @@ class _AgentRuntime:
                 "observer_noise_mode": _observer_noise_mode(),
                 "last_event_at": last_event_at,
                 "recent_events": recent,
+                "version": self._version,
             }
 
 
 _RUNTIME = _AgentRuntime()
+_MAX_STATE_WAIT_SECONDS = 30.0
 
 
 def _observer_noise_mode() -> str:
@@ -255,6 +269,9 @@ def perform_session_action(session_id: str, action: str) -> tuple[dict[str, Any]
 
 class _ControlHandler(BaseHTTPRequestHandler):
     server_version = "BridgeControlAgent/1.1"
+    # Keep-alive so watch/live can reuse one connection; idle sockets are dropped after a minute.
+    protocol_version = "HTTP/1.1"
+    timeout = 60
 
     def _send_json(self, status_code: int, payload: dict[str, Any]) -> None:
         body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
@@ -275,13 +292,31 @@ class _ControlHandler(BaseHTTPRequestHandler):
         if self.path == "/health":
             self._send_json(200, {"ok": True, "session_id": self.server.session_id})
             return
-        if self.path == "/state":
+        url = urlsplit(self.path)
+        if url.path == "/state":
+            query = parse_qs(url.query)
+            try:
+                wait_seconds = float(query.get("wait", ["0"])[0] or 0)
+                version = int(query.get("version", ["-1"])[0] or -1)
+            except ValueError:
+                self._send_json(400, {"error": "invalid_query"})
+                return
+            since = query.get("since", [""])[0]
+            if wait_seconds > 0:
+                _RUNTIME.wait_for_change(version, min(wait_seconds, _MAX_STATE_WAIT_SECONDS))
             try:
                 session = refresh_session_state(load_session(self.server.session_id))
             except Exception as exc:  # pragma: no cover
                 self._send_json(409, {"error": str(exc)})
                 return
-            self._send_json(200, _session_payload(session))
+            payload = _session_payload(session)
+            if since:
+                payload["recent_events"] = [
+                    evt
+                    for evt in payload["recent_events"]
+                    if str(evt.get("created_at", "")) > since
+                ]
+            self._send_json(200, payload)
             return
         self._send_json(404, {"error": "not_found"})
 
@@ -2,33 +2,43 @@
 
 from __future__ import annotations
 
-INTERACTIVE_STEP_KINDS = {
-    "click_selector",
-    "click_text",
-    "maybe_click_text",
-    "bulk_click_in_cards",
-    "bulk_click_until_empty",
-    "fill_selector",
-    "select_label",
-    "select_value",
-}
-
-TEACHING_HANDOFF_KINDS = {
-    "click_text",
-    "click_selector",
-    "bulk_click_in_cards",
-    "bulk_click_until_empty",
-    "fill_selector",
-}
-
-LEARNING_TARGET_STEP_KINDS = {
-    "click_selector",
-    "click_text",
-    "maybe_click_text",
-    "fill_selector",
-    "select_label",
-    "select_value",
-}
+INTERACTIVE_STEP_KINDS = frozenset(
+    {
+        "click_selector",
+        "click_text",
+        "maybe_click_text",
+        "bulk_click_in_cards",
+        "bulk_click_until_empty",
+        "fill_selector",
+        "select_label",
+        "select_value",
+    }
+)
+
+TEACHING_HANDOFF_KINDS = frozenset(
+    {
+        "click_text",
+        "click_selector",
+        "bulk_click_in_cards",
+        "bulk_click_until_empty",
+        "fill_selector",
+    }
+)
+
+CLICK_STEP_KINDS = frozenset({"click_selector", "click_text"})
+
+TEXT_MATCH_STEP_KINDS = frozenset({"click_text", "maybe_click_text"})
+
+LEARNING_TARGET_STEP_KINDS = frozenset(
+    {
+        "click_selector",
+        "click_text",
+        "maybe_click_text",
+        "fill_selector",
+        "select_label",
+        "select_value",
+    }
+)
 
 
 def step_learning_target(step_kind: str, target: str) -> str:
@@ -37,12 +47,17 @@ def step_learning_target(step_kind: str, target: str) -> str:
     return ""
 
 
+_RUN_CRASH_FINDINGS = (
+    "what_failed=run_crash",
+    "where=web-run",
+    "why_likely=page_or_context_closed",
+    "attempted=executor run",
+    "next_best_action=reopen session and retry",
+)
+
+
 def append_run_crash_findings(ui_findings: list[str]) -> None:
-    ui_findings.append("what_failed=run_crash")
-    ui_findings.append("where=web-run")
-    ui_findings.append("why_likely=page_or_context_closed")
-    ui_findings.append("attempted=executor run")
-    ui_findings.append("next_best_action=reopen session and retry")
+    ui_findings.extend(_RUN_CRASH_FINDINGS)
 
 
 def append_iframe_focus_findings(
@@ -5,21 +5,102 @@ from __future__ import annotations
 import time
 from typing import Any, Callable
 
+from bridge.web_common import compact_js
+
+_JS_IFRAME_FOCUS_LOCKED = compact_js(
+    """
+    () => {
+      const active = document.activeElement;
+      if (!active) return false;
+      if (String(active.tagName || '').toUpperCase() === 'IFRAME') return true;
+      return !!document.querySelector('iframe:focus,iframe:focus-within');
+    }
+    """
+)
+
+_JS_DISABLE_YOUTUBE_IFRAME_PE = compact_js(
+    """
+    () => {
+      const active = document.activeElement;
+      let frame = null;
+      if (active && String(active.tagName || '').toUpperCase() === 'IFRAME') {
+        frame = active;
+      }
+      if (!frame) frame = document.querySelector('iframe:focus,iframe:focus-within');
+      if (!frame) return null;
+      const src = String(frame.getAttribute('src') || '').toLowerCase();
+      const isYoutube =
+        src.includes('youtube.com') ||
+        src.includes('youtube-nocookie.com') ||
+        src.includes('youtu.be');
+      if (!isYoutube) return null;
+      const prev = String(frame.style.pointerEvents || '');
+      frame.setAttribute('data-bridge-prev-pe', prev || '__EMPTY__');
+      frame.style.pointerEvents = 'none';
+      const all = Array.from(document.querySelectorAll('iframe'));
+      const idx = all.indexOf(frame);
+      return { idx, id: String(frame.id || ''), prev };
+    }
+    """
+)
+
+_JS_RESTORE_IFRAME_PE = compact_js(
+    """
+    ([tok]) => {
+      if (!tok || typeof tok !== 'object') return;
+      const all = Array.from(document.querySelectorAll('iframe'));
+      let frame = null;
+      if (tok.id) frame = document.getElementById(String(tok.id));
+      if (!frame && Number.isInteger(tok.idx) && tok.idx >= 0 && tok.idx < all.length) {
+        frame = all[tok.idx];
+      }
+      if (!frame) return;
+      const prevAttr = frame.getAttribute('data-bridge-prev-pe');
+      const prev = prevAttr === '__EMPTY__' ? '' : String(prevAttr || tok.prev || '');
+      frame.style.pointerEvents = prev;
+      frame.removeAttribute('data-bridge-prev-pe');
+    }
+    """
+)
+
+_JS_BLUR_ACTIVE_IFRAME = compact_js(
+    """
+    () => {
+      const active = document.activeElement;
+      if (active && String(active.tagName || '').toUpperCase() === 'IFRAME') {
+        try { active.blur(); } catch (_e) {}
+      }
+    }
+    """
+)
+
+# Focus the main document and report, in the same round-trip, whether the
+# page is now in the top frame with no iframe holding focus.
+_JS_FOCUS_BODY_AND_PROBE = compact_js(
+    """
+    () => {
+      const body = document.body;
+      if (body) {
+        if (typeof body.focus === 'function') body.focus();
+        try {
+          const evt = new MouseEvent('click', { bubbles: true, cancelable: true, view: window });
+          body.dispatchEvent(evt);
+        } catch (_e) {}
+      }
+      const active = document.activeElement;
+      const iframeFocus = !!active && (
+        String(active.tagName || '').toUpperCase() === 'IFRAME' ||
+        !!document.querySelector('iframe:focus,iframe:focus-within')
+      );
+      return { isMain: !!body && window === window.top, iframeFocus };
+    }
+    """
+)
+
 
 def is_iframe_focus_locked(page: Any) -> bool:
     try:
-        return bool(
-            page.evaluate(
-                """
-                () => {
-                  const active = document.activeElement;
-                  if (!active) return false;
-                  if (String(active.tagName || '').toUpperCase() === 'IFRAME') return true;
-                  return !!document.querySelector('iframe:focus,iframe:focus-within');
-                }
-                """
-            )
-        )
+        return bool(page.evaluate(_JS_IFRAME_FOCUS_LOCKED))
     except Exception:
         return False
 
@@ -32,31 +113,7 @@ def disable_active_youtube_iframe_pointer_events(
     if page_is_closed(page):
         return None
     try:
-        token = page.evaluate(
-            """
-            () => {
-              const active = document.activeElement;
-              let frame = null;
-              if (active && String(active.tagName || '').toUpperCase() === 'IFRAME') {
-                frame = active;
-              }
-              if (!frame) frame = document.querySelector('iframe:focus,iframe:focus-within');
-              if (!frame) return null;
-              const src = String(frame.getAttribute('src') || '').toLowerCase();
-              const isYoutube =
-                src.includes('youtube.com') ||
-                src.includes('youtube-nocookie.com') ||
-                src.includes('youtu.be');
-              if (!isYoutube) return null;
-              const prev = String(frame.style.pointerEvents || '');
-              frame.setAttribute('data-bridge-prev-pe', prev || '__EMPTY__');
-              frame.style.pointerEvents = 'none';
-              const all = Array.from(document.querySelectorAll('iframe'));
-              const idx = all.indexOf(frame);
-              return { idx, id: String(frame.id || ''), prev };
-            }
-            """
-        )
+        token = page.evaluate(_JS_DISABLE_YOUTUBE_IFRAME_PE)
     except Exception:
         return None
     return token if isinstance(token, dict) else None
@@ -71,48 +128,16 @@ def restore_iframe_pointer_events(
     if not token or page_is_closed(page):
         return
     try:
-        page.evaluate(
-            """
-            ([tok]) => {
-              if (!tok || typeof tok !== 'object') return;
-              const all = Array.from(document.querySelectorAll('iframe'));
-              let frame = null;
-              if (tok.id) frame = document.getElementById(String(tok.id));
-              if (!frame && Number.isInteger(tok.idx) && tok.idx >= 0 && tok.idx < all.length) {
-                frame = all[tok.idx];
-              }
-              if (!frame) return;
-              const prevAttr = frame.getAttribute('data-bridge-prev-pe');
-              const prev = prevAttr === '__EMPTY__' ? '' : String(prevAttr || tok.prev || '');
-              frame.style.pointerEvents = prev;
-              frame.removeAttribute('data-bridge-prev-pe');
-            }
-            """,
-            [token],
-        )
+        page.evaluate(_JS_RESTORE_IFRAME_PE, [token])
     except Exception:
         return
 
 
-def force_main_frame_context(
-    page: Any,
-    *,
-    max_seconds: float,
-    iframe_focus_locked: Callable[[Any], bool],
-) -> bool:
+def force_main_frame_context(page: Any, *, max_seconds: float) -> bool:
     deadline = time.monotonic() + max(0.1, float(max_seconds))
     while time.monotonic() <= deadline:
         try:
-            page.evaluate(
-                """
-                () => {
-                  const active = document.activeElement;
-                  if (active && String(active.tagName || '').toUpperCase() === 'IFRAME') {
-                    try { active.blur(); } catch (_e) {}
-                  }
-                }
-                """
-            )
+            page.evaluate(_JS_BLUR_ACTIVE_IFRAME)
         except Exception:
             pass
         try:
@@ -120,26 +145,10 @@ def force_main_frame_context(
         except Exception:
             pass
         try:
-            page.evaluate(
-                """
-                () => {
-                  if (!document.body) return false;
-                  if (typeof document.body.focus === 'function') document.body.focus();
-                  try {
-                    const evt = new MouseEvent('click', { bubbles: true, cancelable: true, view: window });
-                    document.body.dispatchEvent(evt);
-                  } catch (_e) {}
-                  return true;
-                }
-                """
-            )
-        except Exception:
-            pass
-        try:
-            is_main = bool(page.evaluate("() => !!document.body && window === window.top"))
+            probe = page.evaluate(_JS_FOCUS_BODY_AND_PROBE)
         except Exception:
-            is_main = False
-        if is_main and not iframe_focus_locked(page):
+            probe = None
+        if isinstance(probe, dict) and probe.get("isMain") and not probe.get("iframeFocus"):
             return True
         try:
             page.wait_for_timeout(120)
@@ -113,14 +113,19 @@ def trigger_stuck_handoff(
             pass
     if "cmd: playwright release control (teaching handoff)" not in actions:
         actions.append("cmd: playwright release control (teaching handoff)")
-    ui_findings.append(
+    findings = [
         notice_message or f"Me he atascado en: {where}. Te cedo el control para que me ayudes."
-    )
+    ]
     if "control released" not in ui_findings:
-        ui_findings.append("control released")
-    ui_findings.append(f"what_failed={what_failed}")
-    ui_findings.append(f"where={where}")
-    ui_findings.append(f"attempted={attempted or 'watchdog'}")
-    ui_findings.append("next_best_action=human_assist")
-    ui_findings.append(f"why_likely={why_likely}")
+        findings.append("control released")
+    findings.extend(
+        (
+            f"what_failed={what_failed}",
+            f"where={where}",
+            f"attempted={attempted or 'watchdog'}",
+            "next_best_action=human_assist",
+            f"why_likely={why_likely}",
+        )
+    )
+    ui_findings.extend(findings)
     return False
@@ -4,6 +4,21 @@ from __future__ import annotations
 
 from typing import Any, Callable
 
+from bridge.web_executor_steps import CLICK_STEP_KINDS
+
+
+# Fixed why/attempted/next findings for each target-not-found handoff flavour.
+_NO_EFFECT_CLICK_FINDINGS = (
+    "why_likely=no matching visible clickable targets found after card scan/scroll retries",
+    "attempted=card scan + container/page scroll retries",
+    "next_best_action=human_assist",
+)
+_TARGET_NOT_FOUND_FINDINGS = (
+    "why_likely=target text/selector changed, hidden, or not yet rendered",
+    "attempted=stable selector candidates + container/page scroll retries",
+    "next_best_action=human_assist",
+)
+
 
 def retry_stuck_handoff(
     *,
@@ -56,26 +71,20 @@ def target_not_found_handoff(
     show_teaching_notice: Callable[[Any, str], None],
     failure_message: str = "",
 ) -> dict[str, Any]:
-    if not (teaching_mode and step_kind in {"click_selector", "click_text"}):
+    if not (teaching_mode and step_kind in CLICK_STEP_KINDS):
         return {}
     learning_notes.append(f"failed target: {step_target}")
     failure_message_n = str(failure_message or "").strip().lower()
     is_no_effect_click = "bulk click in cards found no matching clickable targets" in failure_message_n
 
-    ui_findings.append(f"No encuentro el botón: {step_target}. Te cedo el control.")
-    ui_findings.append(f"what_failed={'no_effect_click' if is_no_effect_click else 'target_not_found'}")
-    ui_findings.append(f"where=step {interactive_step}:{step_kind}:{step_target}")
-    if is_no_effect_click:
-        ui_findings.append(
-            "why_likely=no matching visible clickable targets found after card scan/scroll retries"
+    ui_findings.extend(
+        (
+            f"No encuentro el botón: {step_target}. Te cedo el control.",
+            f"what_failed={'no_effect_click' if is_no_effect_click else 'target_not_found'}",
+            f"where=step {interactive_step}:{step_kind}:{step_target}",
+            *(_NO_EFFECT_CLICK_FINDINGS if is_no_effect_click else _TARGET_NOT_FOUND_FINDINGS),
         )
-        ui_findings.append("attempted=card scan + container/page scroll retries")
-    else:
-        ui_findings.append(
-            "why_likely=target text/selector changed, hidden, or not yet rendered"
-        )
-        ui_findings.append("attempted=stable selector candidates + container/page scroll retries")
-    ui_findings.append("next_best_action=human_assist")
+    )
     show_teaching_notice(page, step_target)
     return {
         "force_keep_open": True,
@@ -2,26 +2,33 @@
 
 from __future__ import annotations
 
+import functools
+import time
 from typing import Any, Callable
 
+from bridge.web_common import compact_js
+from bridge.web_step_applicability import is_timeout_error
 from bridge.web_steps import WebStep
 
+_JS_RETRY_SCROLL = compact_js(
+    """
+    (step) => {
+      const main = document.querySelector(
+        'main,[role="main"],#main,.main,#__next,.app,[data-testid="main"]'
+      );
+      if (main && typeof main.scrollBy === 'function') {
+        main.scrollBy(0, step);
+      }
+      window.scrollBy(0, step);
+    }
+    """
+)
+
 
 def retry_scroll(page: Any, *, amount: int = 180, pause_ms: int = 140) -> None:
     step = max(80, int(amount))
     try:
-        page.evaluate(
-            """
-            (step) => {
-              const main = document.querySelector('main,[role="main"],#main,.main,#__next,.app,[data-testid="main"]');
-              if (main && typeof main.scrollBy === 'function') {
-                main.scrollBy(0, step);
-              }
-              window.scrollBy(0, step);
-            }
-            """,
-            step,
-        )
+        page.evaluate(_JS_RETRY_SCROLL, step)
     except Exception:
         try:
             page.evaluate("([step]) => window.scrollBy(0, step)", [step])
@@ -33,30 +40,100 @@ def retry_scroll(page: Any, *, amount: int = 180, pause_ms: int = 140) -> None:
         pass
 
 
-def stable_selectors_for_target(target: str) -> list[str]:
+_SETTLE_QUIET_MS = 80
+
+# Resolves once the DOM has gone `quietMs` without mutations. The observer is
+# parked on window between polls and removed when the predicate succeeds.
+_SETTLE_JS = """
+(quietMs) => {
+  let s = window.__bridgeSettle;
+  if (!s) {
+    s = { last: performance.now() };
+    s.obs = new MutationObserver(() => { s.last = performance.now(); });
+    s.obs.observe(document.documentElement, {
+      subtree: true, childList: true, attributes: true, characterData: true,
+    });
+    window.__bridgeSettle = s;
+  }
+  if (performance.now() - s.last < quietMs) return false;
+  s.obs.disconnect();
+  delete window.__bridgeSettle;
+  return true;
+}
+"""
+
+
+_SETTLE_CLEANUP_JS = """
+() => {
+  const s = window.__bridgeSettle;
+  if (!s) return;
+  s.obs.disconnect();
+  delete window.__bridgeSettle;
+}
+"""
+
+
+def settle_after_action(page: Any, max_ms: int) -> None:
+    """Wait for the DOM and network to go quiet after an action, for at most `max_ms`."""
+    if max_ms <= 0:
+        return
+    deadline = time.monotonic() + max_ms / 1000.0
+    try:
+        page.wait_for_function(_SETTLE_JS, arg=min(_SETTLE_QUIET_MS, max_ms), timeout=max_ms)
+    except Exception as exc:
+        # The quiet path disconnects itself; on a timeout or error the observer
+        # would otherwise keep firing on busy pages for the rest of their life.
+        try:
+            page.evaluate(_SETTLE_CLEANUP_JS)
+        except Exception:
+            pass
+        if is_timeout_error(exc):
+            return
+    else:
+        # A click that starts a fetch often leaves the DOM quiet until the
+        # response re-renders; spend what is left of the budget on network idle.
+        remaining_ms = int((deadline - time.monotonic()) * 1000)
+        if remaining_ms > 0:
+            try:
+                page.wait_for_load_state("networkidle", timeout=remaining_ms)
+            except Exception:
+                pass
+        return
+    # No usable signal (navigation, old driver): fall back to the fixed pause.
+    try:
+        page.wait_for_timeout(max_ms)
+    except Exception:
+        pass
+
+
+# Both builders are pure and hit repeatedly for the same few targets within a
+# run; tuples keep the cached results immutable.
+@functools.lru_cache(maxsize=512)
+def stable_selectors_for_target(target: str) -> tuple[str, ...]:
     clean = str(target).strip()
     if not clean:
-        return []
+        return ()
     escaped = clean.replace('"', '\\"')
-    return [
+    return (
         f'button:has-text("{escaped}")',
         f'[role="button"]:has-text("{escaped}")',
         f'a:has-text("{escaped}")',
         f'[aria-label*="{escaped}" i]',
         f'[title*="{escaped}" i]',
-    ]
+    )
 
 
-def semantic_hints_for_selector(selector: str) -> list[str]:
+@functools.lru_cache(maxsize=512)
+def semantic_hints_for_selector(selector: str) -> tuple[str, ...]:
     low = str(selector or "").strip().lower()
     if not low:
-        return []
+        return ()
     hints: list[str] = []
     if "stop" in low:
         hints.append("Stop")
     if "play" in low or "reproducir" in low:
         hints.append("Reproducir")
-    return hints
+    return tuple(hints)
 
 
 def apply_wait_step(
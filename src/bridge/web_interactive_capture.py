@@ -5,6 +5,69 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Callable
 
+from bridge.web_common import compact_js
+
+_JS_DRAW_CAPTURE_PATH = compact_js(
+    """
+    () => {
+      const prev = document.getElementById('__bridge_capture_path');
+      if (prev) prev.remove();
+      const pts = window.__bridgeLastHumanRoute;
+      if (!Array.isArray(pts) || pts.length < 2) return;
+      const clean = pts
+        .map((p) => Array.isArray(p) ? { x: Number(p[0]), y: Number(p[1]) } : null)
+        .filter((p) => p && Number.isFinite(p.x) && Number.isFinite(p.y));
+      if (clean.length < 2) return;
+      const svgNS = 'http://www.w3.org/2000/svg';
+      const svg = document.createElementNS(svgNS, 'svg');
+      svg.id = '__bridge_capture_path';
+      svg.setAttribute('width', '100%');
+      svg.setAttribute('height', '100%');
+      svg.setAttribute(
+        'viewBox',
+        `0 0 ${Math.max(1, window.innerWidth || 1)} ${Math.max(1, window.innerHeight || 1)}`
+      );
+      svg.setAttribute('preserveAspectRatio', 'none');
+      svg.style.position = 'fixed';
+      svg.style.inset = '0';
+      svg.style.pointerEvents = 'none';
+      svg.style.zIndex = '2147483646';
+      const poly = document.createElementNS(svgNS, 'polyline');
+      poly.setAttribute('fill', 'none');
+      poly.setAttribute('stroke', 'rgba(0,180,255,1)');
+      poly.setAttribute('stroke-width', '8');
+      poly.setAttribute('stroke-linecap', 'round');
+      poly.setAttribute('stroke-linejoin', 'round');
+      poly.setAttribute('points', clean.map((p) => `${p.x},${p.y}`).join(' '));
+      svg.appendChild(poly);
+      document.documentElement.appendChild(svg);
+    }
+    """
+)
+
+_JS_COUNT_TRACK_PLAY_BUTTONS = compact_js(
+    """
+    () => document.querySelectorAll(
+      "[id^='track-play-'], [data-testid^='track-play-'], .track-card button"
+    ).length
+    """
+)
+
+_JS_SCROLL_PAGE_STEP = compact_js(
+    """
+    () => {
+      const maxY = Math.max(
+        0,
+        (document.documentElement?.scrollHeight || 0) - window.innerHeight
+      );
+      const prev = window.scrollY || 0;
+      const next = Math.min(maxY, prev + Math.max(130, Math.floor(window.innerHeight * 0.28)));
+      window.scrollTo(0, next);
+      return next > prev;
+    }
+    """
+)
+
 
 def capture_movement(
     *,
@@ -15,6 +78,7 @@ def capture_movement(
     visual: bool,
     movement_capture_dir: Path | None,
     evidence_paths: list[str] | None,
+    capture_mode: str = "svg_and_png",
     get_last_human_route: Callable[[], list[tuple[float, float]]],
     to_repo_rel: Callable[[Path], str],
 ) -> int:
@@ -24,6 +88,7 @@ def capture_movement(
         return move_capture_count
     move_capture_count += 1
     shot = movement_capture_dir / f"step_{step_num}_move_{move_capture_count}_{tag}.png"
+    svg_written = False
     try:
         pts = get_last_human_route()
         vw_vh = page.evaluate("() => ({w: window.innerWidth || 1280, h: window.innerHeight || 860})")
@@ -39,53 +104,25 @@ def capture_movement(
                         continue
             if len(clean_pts) >= 2:
                 svg_path = movement_capture_dir / f"step_{step_num}_move_{move_capture_count}_{tag}.svg"
-                points_attr = " ".join(f"{x:.2f},{y:.2f}" for x, y in clean_pts)
-                svg = (
-                    f'<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}" '
-                    f'viewBox="0 0 {w} {h}">'
-                    f'<polyline fill="none" stroke="rgb(0,180,255)" stroke-width="6" '
-                    f'stroke-linecap="round" stroke-linejoin="round" points="{points_attr}" />'
-                    "</svg>\n"
+                # The document is pure ASCII, so build it as bytes and skip the encode.
+                svg = b"".join(
+                    (
+                        b'<svg xmlns="http://www.w3.org/2000/svg" width="%d" height="%d" '
+                        b'viewBox="0 0 %d %d">' % (w, h, w, h),
+                        b'<polyline fill="none" stroke="rgb(0,180,255)" stroke-width="6" '
+                        b'stroke-linecap="round" stroke-linejoin="round" points="',
+                        b" ".join(b"%.2f,%.2f" % pt for pt in clean_pts),
+                        b'" /></svg>\n',
+                    )
                 )
-                svg_path.write_text(svg, encoding="utf-8")
+                svg_path.write_bytes(svg)
                 evidence_paths.append(to_repo_rel(svg_path))
-        page.evaluate(
-            """
-            () => {
-              const prev = document.getElementById('__bridge_capture_path');
-              if (prev) prev.remove();
-              const pts = window.__bridgeLastHumanRoute;
-              if (!Array.isArray(pts) || pts.length < 2) return;
-              const clean = pts
-                .map((p) => Array.isArray(p) ? { x: Number(p[0]), y: Number(p[1]) } : null)
-                .filter((p) => p && Number.isFinite(p.x) && Number.isFinite(p.y));
-              if (clean.length < 2) return;
-              const svgNS = 'http://www.w3.org/2000/svg';
-              const svg = document.createElementNS(svgNS, 'svg');
-              svg.id = '__bridge_capture_path';
-              svg.setAttribute('width', '100%');
-              svg.setAttribute('height', '100%');
-              svg.setAttribute(
-                'viewBox',
-                `0 0 ${Math.max(1, window.innerWidth || 1)} ${Math.max(1, window.innerHeight || 1)}`
-              );
-              svg.setAttribute('preserveAspectRatio', 'none');
-              svg.style.position = 'fixed';
-              svg.style.inset = '0';
-              svg.style.pointerEvents = 'none';
-              svg.style.zIndex = '2147483646';
-              const poly = document.createElementNS(svgNS, 'polyline');
-              poly.setAttribute('fill', 'none');
-              poly.setAttribute('stroke', 'rgba(0,180,255,1)');
-              poly.setAttribute('stroke-width', '8');
-              poly.setAttribute('stroke-linecap', 'round');
-              poly.setAttribute('stroke-linejoin', 'round');
-              poly.setAttribute('points', clean.map((p) => `${p.x},${p.y}`).join(' '));
-              svg.appendChild(poly);
-              document.documentElement.appendChild(svg);
-            }
-            """
-        )
+                svg_written = True
+        # In svg_only mode the SVG is the evidence, so skip the overlay redraw and
+        # screenshot. Without a route to draw, fall back to the single-frame capture.
+        if capture_mode == "svg_only" and svg_written:
+            return move_capture_count
+        page.evaluate(_JS_DRAW_CAPTURE_PATH)
         page.wait_for_timeout(50)
         page.screenshot(path=str(shot), full_page=False)
         page.evaluate("() => document.getElementById('__bridge_capture_path')?.remove()")
@@ -102,36 +139,20 @@ def scan_whole_page_for_play_buttons(page: Any) -> int:
         page.evaluate("() => window.scrollTo(0, 0)")
     except Exception:
         pass
+    stable_passes = 0
     for _ in range(18):
+        prev_total = total
         try:
-            total = int(
-                page.evaluate(
-                    """
-                    () => document.querySelectorAll(
-                      "[id^='track-play-'], [data-testid^='track-play-'], .track-card button"
-                    ).length
-                    """
-                )
-            )
+            total = int(page.evaluate(_JS_COUNT_TRACK_PLAY_BUTTONS))
         except Exception:
             total = 0
+        # Several buttons and no new ones over two scrolls in a row: lazy lists
+        # have settled. One unchanged pass can just be a slow append.
+        stable_passes = stable_passes + 1 if total >= 2 and total == prev_total else 0
+        if stable_passes >= 2:
+            break
         try:
-            moved = bool(
-                page.evaluate(
-                    """
-                    () => {
-                      const maxY = Math.max(
-                        0,
-                        (document.documentElement?.scrollHeight || 0) - window.innerHeight
-                      );
-                      const prev = window.scrollY || 0;
-                      const next = Math.min(maxY, prev + Math.max(130, Math.floor(window.innerHeight * 0.28)));
-                      window.scrollTo(0, next);
-                      return next > prev;
-                    }
-                    """
-                )
-            )
+            moved = bool(page.evaluate(_JS_SCROLL_PAGE_STEP))
         except Exception:
             moved = False
         if not moved:
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import random
 import time
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
 
+from bridge.web_runtime_safety import capture_screenshot
 from bridge.web_steps import WebStep
+from bridge.web_watchdog import WebWatchdogConfig
+
+_ATTEMPTED_PARTS_LIMIT = 18
+_RETRY_BACKOFF_BASE_SECONDS = 0.5
+_RETRY_BACKOFF_CAP_SECONDS = 2.0
 
 
 @dataclass(frozen=True)
@@ -38,18 +46,18 @@ def apply_interactive_step_with_retries(
     learning_selectors: list[str],
     session: Any | None,
     step_label: str,
-    stuck_interactive_seconds: float,
-    stuck_step_seconds: float,
+    watchdog_cfg: WebWatchdogConfig,
     step_deadline_ts: float,
     run_deadline_ts: float,
+    movement_capture_mode: str = "svg_and_png",
     to_repo_rel: Callable[[Path], str],
     observer_useful_event_count: Callable[[Any | None], int],
     retry_scroll: Callable[[Any], None],
     apply_interactive_step: Callable[..., None],
     is_generic_play_label: Callable[[str], bool],
-    stable_selectors_for_target: Callable[[str], list[str]],
+    stable_selectors_for_target: Callable[[str], tuple[str, ...]],
     is_specific_selector: Callable[[str], bool],
-    semantic_hints_for_selector: Callable[[str], list[str]],
+    semantic_hints_for_selector: Callable[[str], tuple[str, ...]],
 ) -> RetryResult:
     candidates: list[WebStep] = [step]
     if step.kind == "click_text":
@@ -71,29 +79,27 @@ def apply_interactive_step_with_retries(
     total_attempts = max(1, int(max_retries) + 1)
     started_at = time.monotonic()
     baseline_events = observer_useful_event_count(session)
-    attempted_parts: list[str] = []
+    deadline_ts = min(step_deadline_ts, run_deadline_ts)
+    # Only the most recent parts are ever reported.
+    attempted_parts: deque[str] = deque(maxlen=_ATTEMPTED_PARTS_LIMIT)
     for attempt in range(1, total_attempts + 1):
-        now = time.monotonic()
-        if now > step_deadline_ts or now > run_deadline_ts:
-            attempted = ", ".join((attempted_parts + ["deadline=step_or_run"])[:18])
-            return RetryResult(selector_used="", stuck=False, attempted=attempted, deadline_hit=True)
+        if time.monotonic() > deadline_ts:
+            return _deadline_hit(attempted_parts)
         attempted_parts.append(f"retry={attempt - 1}")
         if attempt > 1:
+            _retry_backoff(page, attempt, deadline_ts=deadline_ts)
             retry_scroll(page)
             attempted_parts.append("scroll=main+page")
             ui_findings.append(f"step {step_num} retry {attempt - 1}/{max_retries}: scrolled and re-attempting")
         before_retry = evidence_dir / f"step_{step_num}_retry_{attempt}_before.png"
         after_retry = evidence_dir / f"step_{step_num}_retry_{attempt}_after.png"
-        try:
-            page.screenshot(path=str(before_retry), full_page=False)
-            evidence_paths.append(to_repo_rel(before_retry))
-        except Exception:
-            pass
+        # The first attempt is already framed by the step's own before/after
+        # shots; only real retries need their own evidence.
+        if attempt > 1:
+            capture_screenshot(page, before_retry, evidence_paths, to_repo_rel=to_repo_rel)
         for candidate in candidates:
-            now = time.monotonic()
-            if now > step_deadline_ts or now > run_deadline_ts:
-                attempted = ", ".join((attempted_parts + ["deadline=step_or_run"])[:18])
-                return RetryResult(selector_used="", stuck=False, attempted=attempted, deadline_hit=True)
+            if time.monotonic() > deadline_ts:
+                return _deadline_hit(attempted_parts)
             try:
                 if candidate.kind == "click_selector":
                     attempted_parts.append(f"selector={candidate.target}")
@@ -112,12 +118,10 @@ def apply_interactive_step_with_retries(
                     timeout_ms=timeout_ms,
                     movement_capture_dir=evidence_dir,
                     evidence_paths=evidence_paths,
+                    movement_capture_mode=movement_capture_mode,
                 )
-                try:
-                    page.screenshot(path=str(after_retry), full_page=False)
-                    evidence_paths.append(to_repo_rel(after_retry))
-                except Exception:
-                    pass
+                if attempt > 1:
+                    capture_screenshot(page, after_retry, evidence_paths, to_repo_rel=to_repo_rel)
                 if candidate.kind == "click_selector" and candidate.target != step.target:
                     observations.append(
                         f"step {step_num} used stable selector fallback: {candidate.target}"
@@ -130,44 +134,57 @@ def apply_interactive_step_with_retries(
                     started_at=started_at,
                     session=session,
                     baseline_useful_events=baseline_events,
-                    stuck_interactive_seconds=stuck_interactive_seconds,
-                    stuck_step_seconds=stuck_step_seconds,
+                    watchdog_cfg=watchdog_cfg,
                     observer_useful_event_count=observer_useful_event_count,
                 ):
-                    attempted = ", ".join(attempted_parts[-18:])
+                    attempted = ", ".join(attempted_parts)
                     ui_findings.append(
-                        f"stuck detected on {step_label}: elapsed>{stuck_interactive_seconds}s "
+                        f"stuck detected on {step_label}: "
+                        f"elapsed>{watchdog_cfg.stuck_interactive_seconds}s "
                         "and no useful observer events"
                     )
                     return RetryResult(selector_used="", stuck=True, attempted=attempted)
                 continue
-        try:
-            page.screenshot(path=str(after_retry), full_page=False)
-            evidence_paths.append(to_repo_rel(after_retry))
-        except Exception:
-            pass
+        capture_screenshot(page, after_retry, evidence_paths, to_repo_rel=to_repo_rel)
     if last_exc is not None:
         raise last_exc
     raise RuntimeError(f"Failed interactive step after retries: {step.kind} {step.target}")
 
 
+def _retry_backoff(page: Any, attempt: int, *, deadline_ts: float) -> None:
+    # Full-jitter exponential backoff gives the page time to lay out before the
+    # next attempt, without ever eating the last 250 ms of the step budget.
+    ceiling = min(_RETRY_BACKOFF_BASE_SECONDS * (2 ** (attempt - 2)), _RETRY_BACKOFF_CAP_SECONDS)
+    delay = min(random.uniform(0.0, ceiling), deadline_ts - time.monotonic() - 0.25)
+    if delay <= 0:
+        return
+    try:
+        page.wait_for_timeout(int(delay * 1000))
+    except Exception:
+        pass
+
+
+def _deadline_hit(attempted_parts: deque[str]) -> RetryResult:
+    # Keep room for the deadline marker within the reported limit.
+    keep_from = 1 - _ATTEMPTED_PARTS_LIMIT
+    parts = list(attempted_parts)[keep_from:]
+    parts.append("deadline=step_or_run")
+    return RetryResult(selector_used="", stuck=False, attempted=", ".join(parts), deadline_hit=True)
+
+
 def _should_mark_stuck(
     *,
     started_at: float,
     session: Any | None,
     baseline_useful_events: int,
-    stuck_interactive_seconds: float,
-    stuck_step_seconds: float,
+    watchdog_cfg: WebWatchdogConfig,
     observer_useful_event_count: Callable[[Any | None], int],
 ) -> bool:
     elapsed = max(0.0, time.monotonic() - started_at)
-    no_useful_events = True
-    current_useful = observer_useful_event_count(session)
-    if current_useful > baseline_useful_events:
-        no_useful_events = False
-
-    if elapsed > max(0.1, float(stuck_step_seconds)):
-        return True
-    if elapsed > max(0.1, float(stuck_interactive_seconds)) and no_useful_events:
+    if elapsed > max(0.1, watchdog_cfg.stuck_step_seconds):
         return True
-    return False
+    if elapsed <= max(0.1, watchdog_cfg.stuck_interactive_seconds):
+        return False
+    # Only past the interactive threshold does the answer hinge on observer
+    # progress, so that is the only case worth a round-trip to the agent.
+    return observer_useful_event_count(session) <= baseline_useful_events
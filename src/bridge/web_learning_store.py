@@ -8,11 +8,52 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable
 
+from bridge.storage import append_log
+from bridge.web_executor_steps import CLICK_STEP_KINDS
+
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+# Parsed selector maps keyed by file path, valid while the (mtime_ns, size)
+# signatures of the base file and its append-only journal hold.
+_FileSignature = tuple[int, int] | None
+_SelectorMap = dict[str, dict[str, list[str]]]
+_SELECTOR_CACHE: dict[Path, tuple[tuple[_FileSignature, _FileSignature], _SelectorMap]] = {}
+# Journal size past which learned selectors are folded back into the base file.
+_JOURNAL_COMPACT_BYTES = 256 * 1024
+_SELECTORS_PER_TARGET = 6
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _journal_path(learning_json: Path) -> Path:
+    return learning_json.with_suffix(".jsonl")
+
 
 def load_learned_selectors(learning_json: Path) -> dict[str, dict[str, list[str]]]:
+    signature = (_file_signature(learning_json), _file_signature(_journal_path(learning_json)))
+    if signature == (None, None):
+        return {}
+    cached = _SELECTOR_CACHE.get(learning_json)
+    if cached is None or cached[0] != signature:
+        selector_map = _parse_learned_selectors(learning_json)
+        _replay_selector_journal(_journal_path(learning_json), selector_map)
+        cached = (signature, selector_map)
+        _SELECTOR_CACHE[learning_json] = cached
+    # Callers (store_learned_selector) mutate the map, so hand out copies.
+    return {
+        key: {tgt: list(sels) for tgt, sels in entry.items()} for key, entry in cached[1].items()
+    }
+
+
+def _parse_learned_selectors(learning_json: Path) -> dict[str, dict[str, list[str]]]:
     try:
-        if not learning_json.exists():
-            return {}
         payload = json.loads(learning_json.read_text(encoding="utf-8"))
     except Exception:
         return {}
@@ -31,6 +72,39 @@ def load_learned_selectors(learning_json: Path) -> dict[str, dict[str, list[str]
     return out
 
 
+def _merge_learned_selector(
+    selector_map: dict[str, dict[str, list[str]]],
+    state_key: str,
+    target_norm: str,
+    selector_norm: str,
+) -> bool:
+    selectors = selector_map.setdefault(state_key, {}).setdefault(target_norm, [])
+    if selector_norm in selectors:
+        return False
+    selectors.insert(0, selector_norm)
+    del selectors[_SELECTORS_PER_TARGET:]
+    return True
+
+
+def _replay_selector_journal(journal: Path, selector_map: dict[str, dict[str, list[str]]]) -> None:
+    try:
+        lines = journal.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return
+    for line in lines:
+        try:
+            rec = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(rec, dict):
+            continue
+        state_key = str(rec.get("state_key", "")).strip()
+        target_norm = str(rec.get("target", "")).strip()
+        selector_norm = str(rec.get("selector", "")).strip()
+        if state_key and target_norm and selector_norm:
+            _merge_learned_selector(selector_map, state_key, target_norm, selector_norm)
+
+
 def load_learned_scroll_hints(learning_json: Path) -> dict[str, dict[str, list[int]]]:
     try:
         if not learning_json.exists():
@@ -77,28 +151,19 @@ def write_learning_audit(
         f"- {now} target=`{target}` selector=`{selector}` source=`{source}`",
         f"  - context: {context.get('state_key', '')}",
     ]
-    with audit.open("a", encoding="utf-8") as fh:
-        fh.write("\n".join(lines) + "\n")
+    append_log(audit, "\n".join(lines))
 
 
 def normalize_learning_target_key(
     raw: str,
     *,
-    selector: str = "",
     normalize_failed_target_label: Callable[[str], str],
 ) -> str:
     text = str(raw or "").strip().lower()
-    sel = str(selector or "").strip().lower()
-    probe = normalize_failed_target_label(text).lower() or text
-    merged = " ".join([text, probe, sel]).strip()
-    if not merged:
-        return ""
-    if text.startswith("step ") and ("click_" in text or "wait_" in text):
-        return ""
-    cleaned = re.sub(r"[^a-z0-9]+", " ", probe).strip()
-    if not cleaned:
+    if not text or (text.startswith("step ") and ("click_" in text or "wait_" in text)):
         return ""
-    return cleaned[:48]
+    probe = normalize_failed_target_label(text).lower() or text
+    return _NON_ALNUM_RE.sub(" ", probe).strip()[:48]
 
 
 def is_learning_target_candidate(target: str) -> bool:
@@ -132,7 +197,6 @@ def store_learned_selector(
 ) -> None:
     target_norm = normalize_learning_target_key(
         target,
-        selector=selector,
         normalize_failed_target_label=normalize_failed_target_label,
     )
     selector_norm = str(selector).strip()
@@ -144,14 +208,18 @@ def store_learned_selector(
     state_key = str(context.get("state_key", "")).strip()
     if not state_key:
         return
-    state_bucket = all_map.setdefault(state_key, {})
-    selectors = state_bucket.setdefault(target_norm, [])
-    if selector_norm in selectors:
+    if not _merge_learned_selector(all_map, state_key, target_norm, selector_norm):
         return
-    selectors.insert(0, selector_norm)
-    state_bucket[target_norm] = selectors[:6]
     learning_dir.mkdir(parents=True, exist_ok=True)
-    learning_json.write_text(json.dumps(all_map, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    journal = _journal_path(learning_json)
+    if learning_json.exists():
+        record = {"state_key": state_key, "target": target_norm, "selector": selector_norm}
+        with journal.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+        if journal.stat().st_size > _JOURNAL_COMPACT_BYTES:
+            _compact_learned_selectors(learning_json, journal, all_map)
+    else:
+        _compact_learned_selectors(learning_json, journal, all_map)
     write_learning_audit(
         learning_dir=learning_dir,
         target=target_norm,
@@ -161,6 +229,17 @@ def store_learned_selector(
     )
 
 
+def _compact_learned_selectors(
+    learning_json: Path,
+    journal: Path,
+    selector_map: dict[str, dict[str, list[str]]],
+) -> None:
+    learning_json.write_text(
+        json.dumps(selector_map, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+    )
+    journal.unlink(missing_ok=True)
+
+
 def store_learned_scroll_hints(
     *,
     learning_dir: Path,
@@ -210,17 +289,33 @@ def learned_selectors_for_step(
     context: dict[str, str],
     normalize_failed_target_label: Callable[[str], str],
 ) -> list[str]:
-    if getattr(step, "kind", "") not in {"click_text", "click_selector"}:
+    if getattr(step, "kind", "") not in CLICK_STEP_KINDS:
         return []
     state_key = str(context.get("state_key", "")).strip()
     if not state_key:
         return []
-    bucket = selector_map.get(state_key, {})
-    raw_key = str(getattr(step, "target", "")).strip().lower()
+    return _learned_selectors_from_bucket(
+        step,
+        selector_map.get(state_key, {}),
+        normalize_failed_target_label=normalize_failed_target_label,
+    )
+
+
+def _learned_selectors_from_bucket(
+    step: Any,
+    bucket: dict[str, list[str]],
+    *,
+    normalize_failed_target_label: Callable[[str], str],
+) -> list[str]:
+    if not bucket:
+        return []
+    target = str(getattr(step, "target", ""))
+    raw_key = target.strip().lower()
     norm_key = normalize_learning_target_key(
-        str(getattr(step, "target", "")),
+        target,
         normalize_failed_target_label=normalize_failed_target_label,
     )
+    exact_target = target.strip() if getattr(step, "kind", "") == "click_selector" else ""
     out: list[str] = []
     for key in (norm_key, raw_key):
         if not key:
@@ -228,11 +323,7 @@ def learned_selectors_for_step(
         for selector in bucket.get(key, []):
             if not is_specific_selector(selector):
                 continue
-            if (
-                getattr(step, "kind", "") == "click_selector"
-                and str(getattr(step, "target", "")).strip()
-                and selector != str(getattr(step, "target", "")).strip()
-            ):
+            if exact_target and selector != exact_target:
                 continue
             if selector not in out:
                 out.append(selector)
@@ -246,7 +337,7 @@ def learned_scroll_hints_for_step(
     context: dict[str, str],
     normalize_failed_target_label: Callable[[str], str],
 ) -> list[int]:
-    if getattr(step, "kind", "") not in {"click_text", "click_selector"}:
+    if getattr(step, "kind", "") not in CLICK_STEP_KINDS:
         return []
     state_key = str(context.get("state_key", "")).strip()
     if not state_key:
@@ -281,18 +372,18 @@ def prioritize_steps_with_learned_selectors(
 ) -> list[Any]:
     if not steps:
         return steps
+    state_key = str(context.get("state_key", "")).strip()
+    bucket = selector_map.get(state_key, {}) if state_key else {}
+    if not bucket:
+        return list(steps)
     out: list[Any] = []
     for step in steps:
+        if getattr(step, "kind", "") == "click_text":
+            learned = _learned_selectors_from_bucket(
+                step,
+                bucket,
+                normalize_failed_target_label=normalize_failed_target_label,
+            )
+            out.extend(step_factory("click_selector", selector) for selector in learned)
         out.append(step)
-        learned = learned_selectors_for_step(
-            step=step,
-            selector_map=selector_map,
-            context=context,
-            normalize_failed_target_label=normalize_failed_target_label,
-        )
-        if getattr(step, "kind", "") == "click_text" and learned:
-            out.pop()
-            for selector in learned:
-                out.append(step_factory("click_selector", selector))
-            out.append(step)
     return out
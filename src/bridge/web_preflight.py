@@ -6,6 +6,15 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
 
+from bridge.web_runtime_safety import capture_screenshot
+
+
+_PAGE_SNAPSHOT_JS = """() => ({
+  url: location.href,
+  title: document.title,
+  body: document.body && document.body.innerText ? document.body.innerText.slice(0, 500) : '',
+})"""
+
 
 @dataclass(frozen=True)
 class PreflightResult:
@@ -13,6 +22,21 @@ class PreflightResult:
     control_enabled: bool
 
 
+def _page_snapshot(page: Any, safe_page_title: Callable[[Any], str]) -> tuple[str, str, str]:
+    """Read url, title and body text in one evaluate round-trip."""
+    try:
+        state = page.evaluate(_PAGE_SNAPSHOT_JS)
+    except Exception:
+        state = None
+    if isinstance(state, dict):
+        return (
+            str(state.get("url") or page.url),
+            str(state.get("title") or ""),
+            str(state.get("body") or ""),
+        )
+    return page.url, safe_page_title(page), ""
+
+
 def execute_preflight(
     *,
     page: Any,
@@ -20,7 +44,7 @@ def execute_preflight(
     visual: bool,
     visual_cursor: bool,
     overlay_debug_path: Path,
-    evidence_dir: Path,
+    context_shot_path: Path,
     actions: list[str],
     observations: list[str],
     ui_findings: list[str],
@@ -37,7 +61,7 @@ def execute_preflight(
     session_state_payload: Callable[..., dict[str, Any]],
     mark_controlled: Callable[..., None],
     to_repo_rel: Callable[[Path], str],
-    collapse_ws: Callable[[str], str],
+    collapse_ws: Callable[..., str],
 ) -> PreflightResult:
     learning_context = learning_context_fn(url, "")
     initial_url = page.url
@@ -63,6 +87,7 @@ def execute_preflight(
             )
 
     if visual:
+        # Reuses the check made after attach/goto unless the page navigated since.
         ensure_visual_overlay_ready(
             page,
             ui_findings,
@@ -70,7 +95,6 @@ def execute_preflight(
             retries=3,
             delay_ms=140,
             debug_screenshot_path=overlay_debug_path,
-            force_reinit=True,
         )
         set_assistant_control_overlay(page, True)
         control_enabled = True
@@ -78,26 +102,20 @@ def execute_preflight(
             page,
             session_state_payload(session, override_controlled=True),
         )
-    observations.append(f"Page title: {safe_page_title(page)}")
+    page_url, page_title, body_text = _page_snapshot(page, safe_page_title)
+    observations.append(f"Page title: {page_title}")
     if attached and session is not None:
-        mark_controlled(session, True, url=page.url, title=safe_page_title(page))
+        mark_controlled(session, True, url=page_url, title=page_title)
 
-    try:
-        context_path = evidence_dir / "step_0_context.png"
-        page.screenshot(path=str(context_path), full_page=True)
-        evidence_paths.append(to_repo_rel(context_path))
-    except Exception:
-        pass
-    try:
-        body_text = page.evaluate(
-            "() => (document.body && document.body.innerText ? document.body.innerText.slice(0, 500) : '')"
-        )
-    except Exception:
-        body_text = ""
-    body_snippet = collapse_ws(str(body_text or ""))[:500]
-    ui_findings.append(
-        f"context title={safe_page_title(page)} url={page.url} body[:500]={body_snippet}"
+    capture_screenshot(
+        page,
+        context_shot_path,
+        evidence_paths,
+        full_page=True,
+        to_repo_rel=to_repo_rel,
     )
+    body_snippet = collapse_ws(body_text, 500)
+    ui_findings.append(f"context title={page_title} url={page_url} body[:500]={body_snippet}")
     return PreflightResult(
         learning_context=learning_context,
         control_enabled=control_enabled,
@@ -19,7 +19,25 @@ class BrowserPageSetup:
     attached: bool
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class RunPaths:
+    evidence: Path
+    report: Path
+    overlay_debug: Path
+    context_shot: Path
+
+
+def build_run_paths(run_dir: Path) -> RunPaths:
+    evidence = run_dir / "evidence"
+    return RunPaths(
+        evidence=evidence,
+        report=run_dir / "report.json",
+        overlay_debug=evidence / "step_overlay_debug.png",
+        context_shot=evidence / "step_0_context.png",
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class RunTimingConfig:
     step_hard_timeout_seconds: float
     run_hard_timeout_seconds: float
@@ -29,6 +47,7 @@ class RunTimingConfig:
     learning_window_seconds: int
     post_action_pause_ms: int
     watchdog_cfg: WebWatchdogConfig
+    movement_capture_mode: str
 
 
 def load_run_timing_config() -> RunTimingConfig:
@@ -53,6 +72,8 @@ def load_run_timing_config() -> RunTimingConfig:
         stuck_step_seconds=float(os.getenv("BRIDGE_WEB_STUCK_STEP_SECONDS", "20")),
         stuck_iframe_seconds=float(os.getenv("BRIDGE_WEB_STUCK_IFRAME_SECONDS", "8")),
     )
+    raw_capture_mode = os.getenv("BRIDGE_WEB_MOVEMENT_CAPTURE", "svg_and_png").strip().lower()
+    movement_capture_mode = "svg_only" if raw_capture_mode == "svg_only" else "svg_and_png"
     return RunTimingConfig(
         step_hard_timeout_seconds=step_hard_timeout_seconds,
         run_hard_timeout_seconds=run_hard_timeout_seconds,
@@ -62,6 +83,7 @@ def load_run_timing_config() -> RunTimingConfig:
         learning_window_seconds=learning_window_seconds,
         post_action_pause_ms=post_action_pause_ms,
         watchdog_cfg=watchdog_cfg,
+        movement_capture_mode=movement_capture_mode,
     )
 
 
@@ -147,21 +169,28 @@ def attach_page_observers(
     console_errors: list[str],
     network_findings: list[str],
 ) -> None:
+    # The driver streams these events to the client regardless of handlers,
+    # so keep the handlers cheap rather than collecting in-page.
+    add_console_error = console_errors.append
+    add_network_finding = network_findings.append
+
     def on_console(msg: Any) -> None:
         if msg.type == "error":
-            console_errors.append(msg.text)
+            add_console_error(msg.text)
 
     def on_response(resp: Any) -> None:
+        # status/url/request are read from the response initializer, not over
+        # the wire, so only a malformed object can fail here.
         try:
             if resp.status >= 400:
-                network_findings.append(f"{resp.request.method} {resp.url} {resp.status}")
-        except Exception:
+                add_network_finding(f"{resp.request.method} {resp.url} {resp.status}")
+        except (AttributeError, TypeError):
             pass
 
     def on_failed(req: Any) -> None:
         failure = req.failure
         text = failure.get("errorText") if isinstance(failure, dict) else str(failure)
-        network_findings.append(f"FAILED {req.method} {req.url} {text}")
+        add_network_finding(f"FAILED {req.method} {req.url} {text}")
 
     page.on("console", on_console)
     page.on("response", on_response)
@@ -10,7 +10,9 @@ def ensure_structured_ui_findings(
     where_default: str,
 ) -> None:
     keys = ("what_failed=", "where=", "why_likely=", "attempted=", "next_best_action=")
-    has = {k: any(str(item).startswith(k) for item in ui_findings) for k in keys}
+    # One pass over the findings: an item "k=..." starts with key "k=" exactly
+    # when its text before the first "=" is "k".
+    present = {"".join(str(item).partition("=")[:2]) for item in ui_findings}
     if result == "success":
         defaults = {
             "what_failed=": "none",
@@ -28,9 +30,9 @@ def ensure_structured_ui_findings(
             "next_best_action=": "inspect report/logs and retry",
         }
     for key in keys:
-        if not has[key]:
+        if key not in present:
             ui_findings.append(f"{key}{defaults[key]}")
-    if not any(str(item).startswith("final_state=") for item in ui_findings):
+    if "final_state=" not in present:
         ui_findings.append(f"final_state={result}")
 
 
@@ -53,7 +53,7 @@ def evaluate_watchdog_handoff(
         watchdog_state,
         cfg=watchdog_cfg,
         now_ts=now,
-        iframe_focus_locked=is_iframe_focus_locked(page),
+        iframe_focus_locked=lambda: is_iframe_focus_locked(page),
     )
     if stuck_reason == "stuck_iframe_focus":
         handoff_where = watchdog_state.current_step_signature
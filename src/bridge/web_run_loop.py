@@ -2,17 +2,33 @@
 
 from __future__ import annotations
 
+import shutil
 import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
 
+from bridge.web_interaction_helpers import settle_after_action
+
+
+# A step's "before" shot may reuse the previous step's "after" shot when it is
+# this fresh and the page has not navigated in between.
+_BEFORE_SHOT_REUSE_SECONDS = 0.5
+
 
 @dataclass
 class StepLoopResult:
     step_outcomes: list[dict[str, Any]]
 
 
+@dataclass
+class _AfterShot:
+    path: Path
+    rel: str
+    url: str
+    ts: float
+
+
 def execute_steps_loop(
     *,
     page: Any,
@@ -45,9 +61,9 @@ def execute_steps_loop(
     console_errors: list[str],
     evidence_paths: list[str],
     learning_notes: list[str],
-    stuck_interactive_seconds: float,
-    stuck_step_seconds: float,
-    interactive_step_kinds: set[str],
+    watchdog_cfg: Any,
+    movement_capture_mode: str,
+    interactive_step_kinds: frozenset[str],
     step_learning_target: Callable[[str, str], str],
     update_step_signature: Callable[..., None],
     apply_step_common_prechecks: Callable[..., tuple[bool, bool]],
@@ -72,7 +88,6 @@ def execute_steps_loop(
     append_interactive_timeout_findings: Callable[..., None],
     append_wait_timeout_findings: Callable[..., None],
     ensure_visual_overlay_ready_best_effort: Callable[..., bool],
-    remaining_ms: Callable[[float], int],
     trigger_timeout_handoff: Callable[..., bool],
     watchdog_stuck_attempt: Callable[[str], bool],
     apply_handoff_decision: Callable[[Any], bool],
@@ -89,16 +104,49 @@ def execute_steps_loop(
     interactive_step = 0
     total = len(steps)
     step_outcomes: list[dict[str, Any]] = []
+    last_after: _AfterShot | None = None
+
+    def _capture_step_evidence(name: str) -> None:
+        nonlocal last_after
+        if name.endswith("_before.png") and last_after is not None:
+            fresh = (time.monotonic() - last_after.ts) < _BEFORE_SHOT_REUSE_SECONDS
+            if fresh and str(getattr(page, "url", "")) == last_after.url:
+                try:
+                    shutil.copyfile(last_after.path, evidence_dir / name)
+                except OSError:
+                    pass
+                else:
+                    evidence_paths.append(str(Path(last_after.rel).with_name(name)))
+                    return
+        if name.endswith("_after.png"):
+            # Shoot the settled page, so a before-shot that reuses this frame
+            # never shows pre-settle state.
+            settle_after_action(page, post_action_pause_ms)
+        captured = len(evidence_paths)
+        capture_timeout_evidence(
+            page=page,
+            evidence_dir=evidence_dir,
+            evidence_paths=evidence_paths,
+            name=name,
+        )
+        if name.endswith("_after.png") and len(evidence_paths) > captured:
+            last_after = _AfterShot(
+                path=evidence_dir / name,
+                rel=evidence_paths[-1],
+                url=str(getattr(page, "url", "")),
+                ts=time.monotonic(),
+            )
 
     for idx, step in enumerate(steps, start=1):
         attempted_hint = ""
         step_sig = f"step {idx}/{total} {step.kind}:{step.target}"
         step_learning = step_learning_target(step.kind, step.target)
+        step_started_ts = time.monotonic()
         update_step_signature(
             watchdog_state,
             step_signature=step_sig,
             learning_target=step_learning,
-            now_ts=time.monotonic(),
+            now_ts=step_started_ts,
         )
 
         should_break, crashed = apply_step_common_prechecks(
@@ -115,7 +163,7 @@ def execute_steps_loop(
             visual_cursor=visual_cursor,
             ui_findings=ui_findings,
             overlay_debug_path=overlay_debug_path,
-            remaining_ms=remaining_ms,
+            now_ts=step_started_ts,
             runtime_closed=runtime_closed,
             append_run_crash_findings=append_run_crash_findings,
             trigger_timeout_handoff=trigger_timeout_handoff,
@@ -177,7 +225,6 @@ def execute_steps_loop(
                 observations=observations,
                 ui_findings=ui_findings,
                 console_errors=console_errors,
-                remaining_ms=remaining_ms,
                 trigger_timeout_handoff=trigger_timeout_handoff,
                 force_main_frame_context=force_main_frame_context,
                 apply_iframe_precheck_handoff=lambda **kwargs: apply_handoff_decision(
@@ -192,12 +239,7 @@ def execute_steps_loop(
                         **kwargs,
                     )
                 ),
-                capture_evidence=lambda name: capture_timeout_evidence(
-                    page=page,
-                    evidence_dir=evidence_dir,
-                    evidence_paths=evidence_paths,
-                    name=name,
-                ),
+                capture_evidence=_capture_step_evidence,
                 apply_interactive_step_with_retries=lambda **kwargs: apply_interactive_step_with_retries(
                     page,
                     kwargs["step"],
@@ -219,10 +261,10 @@ def execute_steps_loop(
                     ),
                     session=session,
                     step_label=kwargs["step_label"],
-                    stuck_interactive_seconds=stuck_interactive_seconds,
-                    stuck_step_seconds=stuck_step_seconds,
+                    watchdog_cfg=watchdog_cfg,
                     step_deadline_ts=kwargs["step_deadline_ts"],
                     run_deadline_ts=kwargs["run_deadline_ts"],
+                    movement_capture_mode=movement_capture_mode,
                 ),
                 apply_interactive_step=lambda **kwargs: apply_interactive_step(
                     page,
@@ -239,6 +281,7 @@ def execute_steps_loop(
                     timeout_ms=kwargs["timeout_ms"],
                     movement_capture_dir=evidence_dir,
                     evidence_paths=evidence_paths,
+                    movement_capture_mode=movement_capture_mode,
                 ),
                 on_retry_stuck_handoff=lambda attempted, step_target: apply_handoff_updates(
                     retry_stuck_handoff(
@@ -302,8 +345,6 @@ def execute_steps_loop(
                     step=step,
                     status=interactive_result.recorded_status,
                 )
-            if post_action_pause_ms > 0:
-                page.wait_for_timeout(post_action_pause_ms)
             if visual:
                 ensure_visual_overlay_ready_best_effort(
                     page,
@@ -312,10 +353,11 @@ def execute_steps_loop(
                     retries=3,
                     delay_ms=120,
                     debug_screenshot_path=overlay_debug_path,
-                    force_reinit=True,
                 )
             continue
 
+        # Whatever a wait step waited for may have changed the page.
+        last_after = None
         wait_result = execute_wait_step(
             page=page,
             step=step,
@@ -329,7 +371,6 @@ def execute_steps_loop(
             observations=observations,
             ui_findings=ui_findings,
             console_errors=console_errors,
-            remaining_ms=remaining_ms,
             trigger_timeout_handoff=trigger_timeout_handoff,
             force_main_frame_context=force_main_frame_context,
             apply_iframe_precheck_handoff=lambda **kwargs: apply_handoff_decision(
@@ -393,7 +434,6 @@ def execute_steps_loop(
                 retries=3,
                 delay_ms=120,
                 debug_screenshot_path=overlay_debug_path,
-                force_reinit=True,
             )
         watchdog_state.last_progress_event_ts = time.monotonic()
         record_step_outcome(
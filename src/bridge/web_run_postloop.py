@@ -21,7 +21,7 @@ def process_post_loop_handoff_and_learning(
     teaching_release_control_for_handoff: Callable[..., bool],
     teaching_process_learning_window: Callable[..., None],
     capture_manual_learning: Callable[..., dict[str, Any] | None],
-    stable_selectors_for_target: Callable[..., list[str]],
+    stable_selectors_for_target: Callable[..., tuple[str, ...]],
     store_learned_selector: Callable[..., None],
     store_learned_scroll_hints: Callable[..., None],
     write_teaching_artifacts: Callable[..., list[str]],
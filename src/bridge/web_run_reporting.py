@@ -7,20 +7,26 @@ from typing import Any, Callable
 
 from bridge.models import OIReport
 
+_PERSIST_ERRORS = (OSError, TypeError, ValueError)
+
 
 def persist_report_and_status(
     *,
     report: OIReport | None,
     run_dir: Path,
+    report_path: Path,
     task: str,
     write_json_fn: Callable[[Path, dict[str, Any]], None],
     write_status_fn: Callable[..., None],
 ) -> None:
     if report is None:
         return
+    # The two writes stay independent so status.json is still refreshed when
+    # report.json cannot be written. Only I/O and encoding failures are
+    # swallowed; anything else is a bug and should surface.
     try:
-        write_json_fn(run_dir / "report.json", report.to_dict())
-    except Exception:
+        write_json_fn(report_path, report.to_dict())
+    except _PERSIST_ERRORS:
         pass
     try:
         write_status_fn(
@@ -29,10 +35,10 @@ def persist_report_and_status(
             task=task,
             result=report.result,
             state="completed",
-            report_path=run_dir / "report.json",
+            report_path=report_path,
             progress="web run finalized",
         )
-    except Exception:
+    except _PERSIST_ERRORS:
         pass
 
 
@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
+import functools
 import os
+import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from bridge.web_session import WebSession, request_session_state
 
+_CLOSED_RE = re.compile(
+    r"target page.*closed|closed.*target page|context or browser has been closed|page closed",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_USEFUL_EVENT_TYPES = frozenset(
+    {"click", "network_warn", "network_error", "console_error", "page_error"}
+)
+_USEFUL_EVENT_TYPES_DEBUG = _USEFUL_EVENT_TYPES | {"scroll", "mousemove"}
+
 
 def _observer_noise_mode() -> str:
     raw = str(os.getenv("BRIDGE_OBSERVER_NOISE_MODE", "minimal")).strip().lower()
@@ -27,10 +39,7 @@ def page_is_closed(page: Any | None) -> bool:
 
 
 def is_page_closed_error(exc: BaseException) -> bool:
-    msg = str(exc or "").lower()
-    return (
-        "target page" in msg and "closed" in msg
-    ) or "context or browser has been closed" in msg or "page closed" in msg
+    return _CLOSED_RE.search(str(exc or "")) is not None
 
 
 def runtime_closed(page: Any | None, session: WebSession | None) -> bool:
@@ -41,28 +50,40 @@ def runtime_closed(page: Any | None, session: WebSession | None) -> bool:
     return str(getattr(session, "state", "open")).strip().lower() == "closed"
 
 
-def observer_useful_event_count(session: WebSession | None) -> int:
-    if session is None:
-        return 0
-    try:
-        state = request_session_state(session)
-    except BaseException:
+def count_useful_events(events: Any, noise_mode: Any) -> int:
+    if not events:
         return 0
-    events = list(state.get("recent_events", []) or [])
-    noise_mode = str(state.get("observer_noise_mode", _observer_noise_mode())).strip().lower()
-    useful_types = {"click", "network_warn", "network_error", "console_error", "page_error"}
-    if noise_mode == "debug":
-        useful_types.update({"scroll", "mousemove"})
+    useful_types = (
+        _USEFUL_EVENT_TYPES_DEBUG
+        if str(noise_mode).strip().lower() == "debug"
+        else _USEFUL_EVENT_TYPES
+    )
     count = 0
     for evt in events:
         if not isinstance(evt, dict):
             continue
-        etype = str(evt.get("type", "")).strip().lower()
-        if etype in useful_types:
+        etype = evt.get("type", "")
+        if type(etype) is not str:
+            etype = str(etype)
+        if etype in useful_types or etype.strip().lower() in useful_types:
             count += 1
     return count
 
 
+def observer_useful_event_count(session: WebSession | None) -> int:
+    if session is None:
+        return 0
+    try:
+        state = request_session_state(session)
+    except BaseException:
+        return 0
+    # The agent reports its own mode; only fall back to the env when it doesn't.
+    noise_mode = state.get("observer_noise_mode")
+    if noise_mode is None:
+        noise_mode = _observer_noise_mode()
+    return count_useful_events(state.get("recent_events"), noise_mode)
+
+
 def capture_timeout_evidence(
     *,
     page: Any,
@@ -70,13 +91,31 @@ def capture_timeout_evidence(
     evidence_paths: list[str],
     name: str,
 ) -> None:
-    timeout_path = evidence_dir / name
-    try:
-        page.screenshot(path=str(timeout_path), full_page=False)
-        evidence_paths.append(to_repo_rel(timeout_path))
-    except Exception:
-        pass
+    capture_screenshot(page, evidence_dir / name, evidence_paths)
 
 
 def to_repo_rel(path: Path) -> str:
-    return str(path.resolve().relative_to(Path.cwd()))
+    return _repo_rel(str(path), os.getcwd())
+
+
+@functools.lru_cache(maxsize=4096)
+def _repo_rel(path: str, cwd: str) -> str:
+    # Keyed on cwd as well: relative evidence paths resolve against it.
+    return str(Path(path).resolve().relative_to(Path(cwd)))
+
+
+def capture_screenshot(
+    page: Any,
+    path: Path,
+    evidence_paths: list[str],
+    *,
+    full_page: bool = False,
+    to_repo_rel: Callable[[Path], str] = to_repo_rel,
+) -> bool:
+    """Screenshot to `path` and record it as evidence; False if the capture failed."""
+    try:
+        page.screenshot(path=str(path), full_page=full_page)
+        evidence_paths.append(to_repo_rel(path))
+    except Exception:
+        return False
+    return True
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import http.client
 import json
 import os
 import shutil
@@ -11,6 +12,7 @@ import subprocess
 import sys
 import time
 import urllib.error
+import urllib.parse
 import urllib.request
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
@@ -308,21 +310,113 @@ def _stop_control_agent(session: WebSession) -> None:
             return
 
 
-def request_session_state(session: WebSession, timeout_seconds: float = 3.0) -> dict[str, Any]:
+class AgentConnection:
+    """Keep-alive HTTP connection to a session control agent, reused across polls."""
+
+    def __init__(self, port: int) -> None:
+        self._port = int(port)
+        self._conn: http.client.HTTPConnection | None = None
+
+    def get(self, path: str, timeout_seconds: float) -> tuple[int, bytes]:
+        for attempt in (0, 1):
+            if self._conn is None:
+                self._conn = http.client.HTTPConnection(
+                    "127.0.0.1", self._port, timeout=timeout_seconds
+                )
+            conn = self._conn
+            conn.timeout = timeout_seconds
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout_seconds)
+            try:
+                conn.request("GET", path)
+                resp = conn.getresponse()
+                body = resp.read()
+            except (http.client.HTTPException, ConnectionError):
+                # The agent may have dropped an idle keep-alive socket; retry once fresh.
+                self.close()
+                if attempt:
+                    raise
+                continue
+            except OSError:
+                self.close()
+                raise
+            if resp.will_close:
+                self.close()
+            return resp.status, body
+        raise AssertionError("unreachable")
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def request_session_state(
+    session: WebSession,
+    timeout_seconds: float = 3.0,
+    *,
+    client: AgentConnection | None = None,
+) -> dict[str, Any]:
+    return _request_state_path(session, "/state", timeout_seconds, client)
+
+
+def request_session_state_since(
+    session: WebSession,
+    *,
+    version: int,
+    cursor: str = "",
+    wait_seconds: float = 10.0,
+    client: AgentConnection | None = None,
+) -> dict[str, Any] | None:
+    """Long-poll /state until the observer version moves past `version`.
+
+    Only events newer than `cursor` are returned. Returns None when the agent
+    predates long-poll support, so callers can fall back to plain polling.
+    """
+    query = urllib.parse.urlencode(
+        {"wait": f"{wait_seconds:g}", "version": version, "since": cursor}
+    )
+    try:
+        return _request_state_path(session, f"/state?{query}", wait_seconds + 3.0, client)
+    except _StateEndpointMissing:
+        return None
+
+
+class _StateEndpointMissing(SystemExit):
+    pass
+
+
+def _request_state_path(
+    session: WebSession,
+    path: str,
+    timeout_seconds: float,
+    client: AgentConnection | None,
+) -> dict[str, Any]:
     port = int(session.control_port or 0)
     if port <= 0:
         raise SystemExit("Session control agent offline: no control port configured.")
-    if not session_agent_online(session):
-        raise SystemExit("Session control agent offline.")
-    req = urllib.request.Request(f"http://127.0.0.1:{port}/state", method="GET")
+    if client is None:
+        if not session_agent_online(session):
+            raise SystemExit("Session control agent offline.")
+        client = AgentConnection(port)
+        one_shot = True
+    else:
+        # A reused connection is its own liveness probe; skip the extra /health round-trip.
+        if session.agent_pid <= 0 or not _pid_alive(session.agent_pid):
+            raise SystemExit("Session control agent offline.")
+        one_shot = False
     try:
-        with urllib.request.urlopen(req, timeout=timeout_seconds) as resp:
-            body = resp.read().decode("utf-8", errors="replace")
-    except urllib.error.HTTPError as exc:
-        reason = exc.read().decode("utf-8", errors="replace")
-        raise SystemExit(f"Session state request failed: {reason}") from exc
-    except (urllib.error.URLError, TimeoutError) as exc:
+        status, raw = client.get(path, timeout_seconds)
+    except (http.client.HTTPException, OSError) as exc:
         raise SystemExit(f"Session state request failed: {exc}") from exc
+    finally:
+        if one_shot:
+            client.close()
+    body = raw.decode("utf-8", errors="replace")
+    if status == 404:
+        raise _StateEndpointMissing(f"Session state request failed: {body}")
+    if status >= 400:
+        raise SystemExit(f"Session state request failed: {body}")
     try:
         parsed = json.loads(body)
     except json.JSONDecodeError as exc:
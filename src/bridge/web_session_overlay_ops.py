@@ -2,10 +2,47 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
 
+from bridge.web_common import sync_playwright_factory
 
-def release_session_control_overlay(
+
+@contextmanager
+def _attached_page(session: Any, *, create: bool = False) -> Iterator[Any | None]:
+    """Yield the first page of the session's browser over one CDP connection.
+
+    Yields None when playwright is missing, the connection fails, or there is
+    no page and ``create`` is False.
+    """
+    sync_playwright = sync_playwright_factory()
+    if sync_playwright is None:
+        yield None
+        return
+
+    with sync_playwright() as p:
+        try:
+            browser = p.chromium.connect_over_cdp(f"http://127.0.0.1:{session.port}")
+        except Exception:
+            yield None
+            return
+        if browser.contexts:
+            context = browser.contexts[0]
+        elif create:
+            context = browser.new_context()
+        else:
+            yield None
+            return
+        if context.pages:
+            yield context.pages[0]
+        elif create:
+            yield context.new_page()
+        else:
+            yield None
+
+
+def _release_control_overlay(
+    page: Any,
     session: Any,
     *,
     set_assistant_control_overlay: Callable[[Any, bool], None],
@@ -13,26 +50,29 @@ def release_session_control_overlay(
     session_state_payload: Callable[..., dict[str, Any]],
 ) -> None:
     try:
-        from playwright.sync_api import sync_playwright
+        set_assistant_control_overlay(page, False)
+        update_top_bar_state(page, session_state_payload(session, override_controlled=False))
     except Exception:
         return
 
-    with sync_playwright() as p:
-        try:
-            browser = p.chromium.connect_over_cdp(f"http://127.0.0.1:{session.port}")
-        except Exception:
-            return
-        context = browser.contexts[0] if browser.contexts else None
-        if context is None:
-            return
-        page = context.pages[0] if context.pages else None
+
+def release_session_control_overlay(
+    session: Any,
+    *,
+    set_assistant_control_overlay: Callable[[Any, bool], None],
+    update_top_bar_state: Callable[[Any, dict[str, Any]], None],
+    session_state_payload: Callable[..., dict[str, Any]],
+) -> None:
+    with _attached_page(session) as page:
         if page is None:
             return
-        try:
-            set_assistant_control_overlay(page, False)
-            update_top_bar_state(page, session_state_payload(session, override_controlled=False))
-        except Exception:
-            return
+        _release_control_overlay(
+            page,
+            session,
+            set_assistant_control_overlay=set_assistant_control_overlay,
+            update_top_bar_state=update_top_bar_state,
+            session_state_payload=session_state_payload,
+        )
 
 
 def destroy_session_top_bar(
@@ -40,22 +80,34 @@ def destroy_session_top_bar(
     *,
     destroy_top_bar: Callable[[Any], None],
 ) -> None:
-    try:
-        from playwright.sync_api import sync_playwright
-    except Exception:
-        return
-
-    with sync_playwright() as p:
+    with _attached_page(session) as page:
+        if page is None:
+            return
         try:
-            browser = p.chromium.connect_over_cdp(f"http://127.0.0.1:{session.port}")
+            destroy_top_bar(page)
         except Exception:
             return
-        context = browser.contexts[0] if browser.contexts else None
-        if context is None:
-            return
-        page = context.pages[0] if context.pages else None
+
+
+def release_and_destroy_session_top_bar(
+    session: Any,
+    *,
+    set_assistant_control_overlay: Callable[[Any, bool], None],
+    update_top_bar_state: Callable[[Any, dict[str, Any]], None],
+    session_state_payload: Callable[..., dict[str, Any]],
+    destroy_top_bar: Callable[[Any], None],
+) -> None:
+    """Release control and remove the top bar over a single CDP connection."""
+    with _attached_page(session) as page:
         if page is None:
             return
+        _release_control_overlay(
+            page,
+            session,
+            set_assistant_control_overlay=set_assistant_control_overlay,
+            update_top_bar_state=update_top_bar_state,
+            session_state_payload=session_state_payload,
+        )
         try:
             destroy_top_bar(page)
         except Exception:
@@ -70,18 +122,10 @@ def ensure_session_top_bar(
     update_top_bar_state: Callable[[Any, dict[str, Any]], None],
     session_state_payload: Callable[..., dict[str, Any]],
 ) -> None:
-    try:
-        from playwright.sync_api import sync_playwright
-    except Exception:
-        return
-
-    with sync_playwright() as p:
-        try:
-            browser = p.chromium.connect_over_cdp(f"http://127.0.0.1:{session.port}")
-        except Exception:
+    with _attached_page(session, create=True) as page:
+        if page is None:
             return
-        context = browser.contexts[0] if browser.contexts else browser.new_context()
-        page = context.pages[0] if context.pages else context.new_page()
+        payload = session_state_payload(session)
         try:
             install_visual_overlay(
                 page,
@@ -90,9 +134,9 @@ def ensure_session_top_bar(
                 scale=1.0,
                 color="#3BA7FF",
                 trace_enabled=False,
-                session_state=session_state_payload(session),
+                session_state=payload,
             )
             set_assistant_control_overlay(page, bool(session.controlled))
-            update_top_bar_state(page, session_state_payload(session))
+            update_top_bar_state(page, payload)
         except Exception:
             return
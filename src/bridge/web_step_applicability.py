@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from bridge.web_executor_steps import INTERACTIVE_STEP_KINDS
+from bridge.web_executor_steps import INTERACTIVE_STEP_KINDS, TEXT_MATCH_STEP_KINDS
 from bridge.web_steps import WebStep
 
 
@@ -13,7 +13,7 @@ def probe_step_target_state(page: Any, step: WebStep) -> dict[str, Any]:
     visible: bool | None = None
     enabled: bool | None = None
     try:
-        if step.kind in {"click_text", "maybe_click_text"}:
+        if step.kind in TEXT_MATCH_STEP_KINDS:
             node = page.locator("body").get_by_text(step.target, exact=False).first
         else:
             node = page.locator(step.target).first
@@ -44,7 +44,7 @@ def interactive_step_not_applicable_reason(page: Any, step: WebStep) -> str:
             f"(present={state['present']}, visible={state['visible']}, enabled={state['enabled']})"
         )
     if (
-        step.kind in {"click_text", "maybe_click_text"}
+        step.kind in TEXT_MATCH_STEP_KINDS
         and state.get("present") is False
         and state.get("visible") is False
     ):
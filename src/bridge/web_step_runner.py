@@ -8,6 +8,8 @@ from dataclasses import dataclass
 from typing import Any
 
 from bridge.web_steps import WebStep
+from bridge.web_watchdog import deadline_budget
+from bridge.web_watchdog import remaining_ms as watchdog_remaining_ms
 
 
 def record_step_outcome(
@@ -62,7 +64,7 @@ def apply_step_common_prechecks(
     visual_cursor: bool,
     ui_findings: list[str],
     overlay_debug_path: str,
-    remaining_ms: Any,
+    now_ts: float,
     runtime_closed: Any,
     append_run_crash_findings: Any,
     trigger_timeout_handoff: Any,
@@ -73,7 +75,7 @@ def apply_step_common_prechecks(
     if runtime_closed(page, session):
         append_run_crash_findings(ui_findings)
         return True, True
-    if time.monotonic() > run_deadline_ts:
+    if now_ts > run_deadline_ts:
         if trigger_timeout_handoff(
             what_failed="run_timeout",
             where=watchdog_step_signature or "web-run",
@@ -90,7 +92,7 @@ def apply_step_common_prechecks(
             800,
             min(
                 int(step_hard_timeout_seconds * 1000),
-                remaining_ms(run_deadline_ts),
+                watchdog_remaining_ms(run_deadline_ts, now_ts=now_ts),
             ),
         )
         page.set_default_timeout(step_budget_ms)
@@ -108,11 +110,32 @@ def apply_step_common_prechecks(
             retries=3,
             delay_ms=120,
             debug_screenshot_path=overlay_debug_path,
-            force_reinit=True,
         )
     return False, False
 
 
+def _main_frame_or_handoff(
+    page: Any,
+    *,
+    step: WebStep,
+    step_kind_label: str,
+    action_label: str,
+    watchdog_step_signature: str,
+    force_main_frame_context: Any,
+    apply_iframe_precheck_handoff: Any,
+) -> bool:
+    """Return focus to the main frame; True means a handoff took over the run."""
+    if force_main_frame_context(page):
+        return False
+    if apply_iframe_precheck_handoff(
+        where=watchdog_step_signature,
+        learning_target=step.target,
+        why_likely=f"unable to return focus/context to main frame before {action_label}",
+    ):
+        return True
+    raise RuntimeError(f"Unable to return to main frame context before {step_kind_label}")
+
+
 @dataclass(frozen=True)
 class WaitStepResult:
     should_break: bool = False
@@ -150,7 +173,6 @@ def execute_interactive_step(
     observations: list[str],
     ui_findings: list[str],
     console_errors: list[str],
-    remaining_ms: Any,
     trigger_timeout_handoff: Any,
     force_main_frame_context: Any,
     apply_iframe_precheck_handoff: Any,
@@ -167,7 +189,7 @@ def execute_interactive_step(
 ) -> InteractiveStepResult:
     step_started_at = time.monotonic()
     step_deadline_ts = step_started_at + step_hard_timeout_seconds
-    if min(remaining_ms(step_deadline_ts), remaining_ms(run_deadline_ts)) <= 0:
+    if watchdog_remaining_ms(run_deadline_ts, now_ts=step_started_at) <= 0:
         if trigger_timeout_handoff(
             what_failed="interactive_timeout",
             where=watchdog_step_signature or f"step {idx}/{total}",
@@ -179,14 +201,16 @@ def execute_interactive_step(
             notice_message="El paso interactivo superó el tiempo límite. Te cedo el control.",
         ):
             return InteractiveStepResult(should_break=True)
-    if not force_main_frame_context(page):
-        if apply_iframe_precheck_handoff(
-            where=watchdog_step_signature,
-            learning_target=step.target,
-            why_likely="unable to return focus/context to main frame before interactive action",
-        ):
-            return InteractiveStepResult(should_break=True)
-        raise RuntimeError("Unable to return to main frame context before interactive step")
+    if _main_frame_or_handoff(
+        page,
+        step=step,
+        step_kind_label="interactive step",
+        action_label="interactive action",
+        watchdog_step_signature=watchdog_step_signature,
+        force_main_frame_context=force_main_frame_context,
+        apply_iframe_precheck_handoff=apply_iframe_precheck_handoff,
+    ):
+        return InteractiveStepResult(should_break=True)
 
     interactive_step = int(current_interactive_step) + 1
     capture_evidence(f"step_{interactive_step}_before.png")
@@ -194,14 +218,13 @@ def execute_interactive_step(
     attempted_hint = ""
     learning_selector_used = ""
     try:
-        effective_timeout_ms = min(
+        effective_timeout_ms, exhausted = deadline_budget(
             interactive_timeout_ms,
-            max(250, remaining_ms(step_deadline_ts)),
-            max(250, remaining_ms(run_deadline_ts)),
+            step_deadline_ts,
+            run_deadline_ts,
+            now_ts=time.monotonic(),
         )
-        if effective_timeout_ms <= 250 and (
-            remaining_ms(step_deadline_ts) <= 0 or remaining_ms(run_deadline_ts) <= 0
-        ):
+        if exhausted:
             if trigger_timeout_handoff(
                 what_failed="interactive_timeout",
                 where=watchdog_step_signature or f"step {idx}/{total}",
@@ -305,7 +328,6 @@ def execute_wait_step(
     observations: list[str],
     ui_findings: list[str],
     console_errors: list[str],
-    remaining_ms: Any,
     trigger_timeout_handoff: Any,
     force_main_frame_context: Any,
     apply_iframe_precheck_handoff: Any,
@@ -321,14 +343,13 @@ def execute_wait_step(
     try:
         step_started_at = time.monotonic()
         step_deadline_ts = step_started_at + step_hard_timeout_seconds
-        effective_wait_timeout_ms = min(
+        effective_wait_timeout_ms, exhausted = deadline_budget(
             wait_timeout_ms,
-            max(250, remaining_ms(step_deadline_ts)),
-            max(250, remaining_ms(run_deadline_ts)),
+            step_deadline_ts,
+            run_deadline_ts,
+            now_ts=step_started_at,
         )
-        if effective_wait_timeout_ms <= 250 and (
-            remaining_ms(step_deadline_ts) <= 0 or remaining_ms(run_deadline_ts) <= 0
-        ):
+        if exhausted:
             if trigger_timeout_handoff(
                 what_failed="interactive_timeout",
                 where=watchdog_step_signature or f"step {idx}/{total}",
@@ -338,14 +359,16 @@ def execute_wait_step(
                 notice_message="El paso superó el tiempo límite. Te cedo el control.",
             ):
                 return WaitStepResult(should_break=True)
-        if not force_main_frame_context(page):
-            if apply_iframe_precheck_handoff(
-                where=watchdog_step_signature,
-                learning_target=step.target,
-                why_likely="unable to return focus/context to main frame before wait step",
-            ):
-                return WaitStepResult(should_break=True)
-            raise RuntimeError("Unable to return to main frame context before wait step")
+        if _main_frame_or_handoff(
+            page,
+            step=step,
+            step_kind_label="wait step",
+            action_label="wait step",
+            watchdog_step_signature=watchdog_step_signature,
+            force_main_frame_context=force_main_frame_context,
+            apply_iframe_precheck_handoff=apply_iframe_precheck_handoff,
+        ):
+            return WaitStepResult(should_break=True)
         apply_wait_step(
             page,
             step,
@@ -8,6 +8,11 @@ import urllib.error
 import urllib.request
 from urllib.parse import urlparse
 
+# Hosts served by IPv4 loopback. "::1" is not here: an IPv6-only target must
+# be probed on its own family, so it goes through getaddrinfo below.
+_LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "0.0.0.0"})
+_LOCAL_FAST_TIMEOUT = 0.2
+
 
 def preflight_target_reachable(
     url: str,
@@ -23,15 +28,42 @@ def preflight_target_reachable(
     if not host or port <= 0:
         raise SystemExit(f"Web target not reachable: {url}")
 
-    # Many dev servers bind IPv4 only; prefer 127.0.0.1 first for localhost.
-    candidates: list[str] = [host]
-    if host in {"localhost", "0.0.0.0"}:
-        candidates = ["127.0.0.1", "localhost", "::1"]
+    # Local dev stacks are the common case: try IPv4 loopback directly with a
+    # short timeout before resolving anything.
+    refused: tuple[str, int] | None = None
+    if host in _LOCAL_HOSTS:
+        loopback = ("127.0.0.1", int(port))
+        try:
+            with create_connection_fn(loopback, timeout=min(_LOCAL_FAST_TIMEOUT, timeout_seconds)):
+                return
+        except ConnectionRefusedError:
+            refused = loopback
+        except Exception:
+            pass
+
+    # 0.0.0.0 is a bind address; probe it through localhost instead.
+    lookup_host = "localhost" if host == "0.0.0.0" else host
+    try:
+        infos = socket.getaddrinfo(lookup_host, int(port), type=socket.SOCK_STREAM)
+    except OSError as exc:
+        raise SystemExit(f"Web target not reachable: {url}") from exc
+
+    # Resolve once and connect to numeric addresses. Many dev servers bind
+    # IPv4 only, so try IPv4 addresses first.
+    candidates: list[tuple[str, int]] = []
+    for family, _type, _proto, _canon, sockaddr in sorted(
+        infos, key=lambda info: info[0] != socket.AF_INET
+    ):
+        addr = (str(sockaddr[0]), int(sockaddr[1]))
+        if family not in (socket.AF_INET, socket.AF_INET6):
+            continue
+        if addr != refused and addr not in candidates:
+            candidates.append(addr)
 
     last_exc: Exception | None = None
     for cand in candidates:
         try:
-            with create_connection_fn((cand, int(port)), timeout=timeout_seconds):
+            with create_connection_fn(cand, timeout=timeout_seconds):
                 return
         except Exception as exc:  # pragma: no cover (covered via raised SystemExit)
             last_exc = exc
@@ -9,6 +9,9 @@ from pathlib import Path
 from typing import Any, Callable
 
 
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
 def show_teaching_handoff_notice(page: Any, target: str) -> None:
     msg = f"No encuentro el botón: {target}. Te cedo el control."
     try:
@@ -84,7 +87,7 @@ def normalize_failed_target_label(raw: str) -> str:
 
 
 def show_wrong_manual_click_notice(
-    page: Any, failed_target: str, stable_selectors_for_target: Callable[[str], list[str]]
+    page: Any, failed_target: str, stable_selectors_for_target: Callable[[str], tuple[str, ...]]
 ) -> None:
     label = normalize_failed_target_label(failed_target) or "objetivo esperado"
     suggestion = stable_selectors_for_target(label)
@@ -140,7 +143,7 @@ def is_relevant_manual_learning_event(evt: dict[str, Any], failed_target: str) -
         return True
     if probe.startswith("#") and probe in selector:
         return True
-    token = re.sub(r"[^a-z0-9]+", " ", probe).strip()
+    token = _NON_ALNUM_RE.sub(" ", probe).strip()
     if not token:
         return True
     if token in selector or token in target or token in text or token in message:
@@ -301,7 +304,7 @@ def process_learning_window(
     ui_findings: list[str],
     evidence_paths: list[str],
     capture_manual_learning: Callable[..., dict[str, Any] | None],
-    stable_selectors_for_target: Callable[[str], list[str]],
+    stable_selectors_for_target: Callable[[str], tuple[str, ...]],
     store_learned_selector: Callable[..., None],
     write_teaching_artifacts: Callable[[dict[str, Any]], list[str]],
     show_learning_thanks_notice: Callable[[Any, str], None],
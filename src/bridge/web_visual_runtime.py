@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import time
+import weakref
 from pathlib import Path
 from typing import Any, Callable
 
@@ -12,6 +14,41 @@ from bridge.web_visual_overlay import (
 )
 
 
+# When each page's overlay was last verified; cleared on main-frame navigation.
+_OVERLAY_READY: weakref.WeakKeyDictionary[Any, float] = weakref.WeakKeyDictionary()
+# Re-verify at least this often: in-page scripts can still drop the overlay
+# nodes without navigating.
+_OVERLAY_READY_MAX_AGE_SECONDS = 30.0
+
+
+def _mark_overlay_ready(page: Any) -> None:
+    try:
+        known = page in _OVERLAY_READY
+        _OVERLAY_READY[page] = time.monotonic()
+    except TypeError:
+        return
+    if known:
+        return
+
+    def _on_navigated(frame: Any) -> None:
+        if getattr(frame, "parent_frame", None) is None:
+            _OVERLAY_READY[page] = 0.0
+
+    try:
+        page.on("framenavigated", _on_navigated)
+    except Exception:
+        # Without a navigation signal the cached state could go stale.
+        _OVERLAY_READY.pop(page, None)
+
+
+def overlay_ready(page: Any) -> bool:
+    try:
+        verified_at = _OVERLAY_READY.get(page, 0.0)
+    except TypeError:
+        return False
+    return bool(verified_at) and (time.monotonic() - verified_at) < _OVERLAY_READY_MAX_AGE_SECONDS
+
+
 def force_visual_overlay_reinstall(page: Any) -> None:
     page.evaluate(
         """
@@ -61,6 +98,8 @@ def ensure_visual_overlay_ready_best_effort(
     force_reinit: bool = False,
     to_repo_rel: Callable[[Path], str],
 ) -> bool:
+    if not force_reinit and overlay_ready(page):
+        return True
     # Force re-injection / re-enable in attach flows and after navigations.
     last_error: BaseException | None = None
     for attempt in range(1, max(1, retries) + 1):
@@ -74,6 +113,7 @@ def ensure_visual_overlay_ready_best_effort(
             if cursor_expected:
                 try:
                     _verify_visual_overlay_visible(page)
+                    _mark_overlay_ready(page)
                     return True
                 except BaseException as exc:
                     last_error = exc
@@ -82,6 +122,7 @@ def ensure_visual_overlay_ready_best_effort(
                     except BaseException as reinstall_exc:
                         last_error = reinstall_exc
             else:
+                _mark_overlay_ready(page)
                 return True
         except BaseException as exc:
             last_error = exc
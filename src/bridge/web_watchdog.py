@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Callable
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WebWatchdogConfig:
     stuck_iframe_seconds: float
     stuck_step_seconds: float
@@ -46,14 +47,16 @@ def evaluate_stuck_reason(
     *,
     cfg: WebWatchdogConfig,
     now_ts: float,
-    iframe_focus_locked: bool,
+    iframe_focus_locked: Callable[[], bool],
 ) -> str:
     sig = state.current_step_signature
     if not sig:
         return ""
+    # The iframe probe is a page round-trip; only pay for it once the
+    # progress window has actually elapsed.
     if (
         (now_ts - state.last_progress_event_ts) > max(0.1, cfg.stuck_iframe_seconds)
-        and iframe_focus_locked
+        and iframe_focus_locked()
     ):
         return "stuck_iframe_focus"
     if (now_ts - state.last_step_change_ts) > max(0.1, cfg.stuck_step_seconds):
@@ -65,3 +68,13 @@ def evaluate_stuck_reason(
 
 def remaining_ms(deadline_ts: float, *, now_ts: float) -> int:
     return int(max(0.0, deadline_ts - now_ts) * 1000)
+
+
+def deadline_budget(cap_ms: int, *deadlines: float, now_ts: float) -> tuple[int, bool]:
+    """Return (timeout_ms, exhausted) for an operation bounded by `deadlines`.
+
+    The timeout is floored at 250 ms so a nearly spent budget still gets one
+    short attempt; `exhausted` is set once any deadline has passed.
+    """
+    left_ms = min(remaining_ms(ts, now_ts=now_ts) for ts in deadlines)
+    return min(cap_ms, max(250, left_ms)), left_ms <= 0
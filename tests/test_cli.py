@@ -534,12 +534,13 @@ class CLITests(unittest.TestCase):
         out = io.StringIO()
         with patch("bridge.cli.load_and_refresh_session", return_value=session), patch(
             "bridge.cli.session_is_alive", return_value=True
-        ), patch("bridge.cli.release_session_control_overlay"), patch(
+        ), patch("bridge.cli.release_and_destroy_session_top_bar") as close_overlays, patch(
             "bridge.cli.close_session"
         ):
             with redirect_stdout(out):
                 web_close_command("s1")
         self.assertIn('"state": "closed"', out.getvalue())
+        close_overlays.assert_called_once_with(session)
 
     def test_keep_open_does_not_close_persistent_browser(self) -> None:
         with tempfile.TemporaryDirectory(dir=".") as tmp:
@@ -666,17 +667,21 @@ class CLITests(unittest.TestCase):
             last_seen_at="2026-01-01T00:00:00+00:00",
             state="closed",
         )
-        with patch("bridge.cli.load_and_refresh_session", return_value=dead), patch(
-            "bridge.cli.session_is_alive", return_value=False
-        ), patch("bridge.cli._preflight_runtime"), patch(
-            "bridge.cli.require_sensitive_confirmation"
-        ), self.assertRaises(SystemExit) as ctx:
-            run_command(
-                "abre http://localhost:5173",
-                confirm_sensitive=True,
-                mode="web",
-                attach_session_id="dead1",
-            )
+        with tempfile.TemporaryDirectory() as tmp:
+            runs_dir = Path(tmp) / "runs"
+            with patch("bridge.storage.RUNS_DIR", runs_dir), patch(
+                "bridge.storage.STATUS_PATH", runs_dir / "status.json"
+            ), patch("bridge.cli.load_and_refresh_session", return_value=dead), patch(
+                "bridge.cli.session_is_alive", return_value=False
+            ), patch("bridge.cli._preflight_runtime"), patch(
+                "bridge.cli.require_sensitive_confirmation"
+            ), self.assertRaises(SystemExit) as ctx:
+                run_command(
+                    "abre http://localhost:5173",
+                    confirm_sensitive=True,
+                    mode="web",
+                    attach_session_id="dead1",
+                )
         self.assertIn("run web-open again", str(ctx.exception))
 
 
@@ -1,4 +1,5 @@
 import io
+import json
 import tempfile
 import unittest
 from contextlib import redirect_stdout
@@ -67,6 +68,76 @@ class LiveCommandTests(unittest.TestCase):
             # quiet mode: same snapshot should not spam multiple blocks
             self.assertEqual(text.count("run=r1"), 1)
 
+    def test_live_log_only_updates_skip_status_header(self) -> None:
+        with tempfile.TemporaryDirectory(dir=".") as tmp:
+            run_dir = Path(tmp) / "runs" / "r1"
+            run_dir.mkdir(parents=True)
+            bridge_log = run_dir / "bridge.log"
+            bridge_log.write_text("line-1\n", encoding="utf-8")
+
+            session = self._session()
+            payload = {"run_id": "r1", "run_dir": str(run_dir), "state": "running"}
+            sleep_calls = {"n": 0}
+
+            def fake_sleep(_sec: float) -> None:
+                sleep_calls["n"] += 1
+                if sleep_calls["n"] >= 2:
+                    raise KeyboardInterrupt()
+                with bridge_log.open("a", encoding="utf-8") as fh:
+                    fh.write("line-2\n")
+
+            out = io.StringIO()
+            with patch("bridge.live.get_last_session", return_value=session), patch(
+                "bridge.live.refresh_session_state", side_effect=lambda s: s
+            ), patch("bridge.live.session_is_alive", return_value=True), patch(
+                "bridge.live.session_agent_online", return_value=False
+            ), patch("bridge.live.status_payload", return_value=payload), patch(
+                "bridge.live.time.sleep", side_effect=fake_sleep
+            ):
+                with redirect_stdout(out):
+                    live_command(attach="last", interval_ms=100, tail=10, json_mode=True)
+
+            records = [json.loads(line) for line in out.getvalue().splitlines()]
+            self.assertEqual([r["kind"] for r in records], ["status", "logs", "logs"])
+            self.assertEqual(records[1]["lines"], ["line-1"])
+            self.assertEqual(records[2]["lines"], ["line-2"])
+
+    def test_live_prints_each_observer_event_once(self) -> None:
+        session = self._session()
+        first = {"type": "click", "target": "Play", "created_at": "2026-01-01T00:00:01+00:00"}
+        twin = {"type": "scroll", "message": "moved", "created_at": "2026-01-01T00:00:01+00:00"}
+        later = {"type": "console_error", "severity": "error", "message": "boom",
+                 "created_at": "2026-01-01T00:00:02+00:00"}
+        states = iter(
+            [
+                {"recent_events": [first]},
+                {"recent_events": [first, twin]},
+                {"recent_events": [first, twin, later]},
+            ]
+        )
+        sleep_calls = {"n": 0}
+
+        def fake_sleep(_sec: float) -> None:
+            sleep_calls["n"] += 1
+            if sleep_calls["n"] >= 3:
+                raise KeyboardInterrupt()
+
+        out = io.StringIO()
+        with patch("bridge.live.get_last_session", return_value=session), patch(
+            "bridge.live.refresh_session_state", side_effect=lambda s: s
+        ), patch("bridge.live.session_is_alive", return_value=True), patch(
+            "bridge.live.session_agent_online", return_value=True
+        ), patch("bridge.live.request_session_state", side_effect=lambda _s: next(states)), patch(
+            "bridge.live.status_payload", return_value={"run_id": "r1"}
+        ), patch("bridge.live.time.sleep", side_effect=fake_sleep):
+            with redirect_stdout(out):
+                live_command(attach="last", interval_ms=100, tail=10, json_mode=False)
+
+        text = out.getvalue()
+        self.assertEqual(text.count('click target="Play"'), 1)
+        self.assertEqual(text.count("[info] moved"), 1)
+        self.assertEqual(text.count("[error] boom"), 1)
+
     def test_live_exits_cleanly_on_keyboard_interrupt_during_fetch(self) -> None:
         session = self._session()
         out = io.StringIO()
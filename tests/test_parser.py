@@ -1,6 +1,6 @@
 import unittest
 
-from bridge.parser import parse_oi_report
+from bridge.parser import _coerce_result, parse_oi_report
 
 
 class ParserTests(unittest.TestCase):
@@ -89,6 +89,12 @@ more text
         self.assertEqual(report.task_id, "x-2")
         self.assertEqual(report.result, "success")
 
+    def test_coerce_result_keyword_precedence(self) -> None:
+        self.assertEqual(_coerce_result("done, but one error was logged"), "failed")
+        self.assertEqual(_coerce_result("completed with missing evidence"), "partial")
+        self.assertEqual(_coerce_result("Completed"), "success")
+        self.assertEqual(_coerce_result("???"), "partial")
+
     def test_parse_coerces_action_objects_and_result_text(self) -> None:
         raw = """
 {
@@ -1,8 +1,12 @@
+import os
+import stat
 import tempfile
+import time
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
-from bridge.runner import _build_runner_env
+from bridge.runner import _build_runner_env, run_open_interpreter
 
 
 class RunnerTests(unittest.TestCase):
@@ -17,6 +21,58 @@ class RunnerTests(unittest.TestCase):
             self.assertEqual(env["XDG_CACHE_HOME"], str(run_dir / ".oi_home" / ".cache"))
             self.assertEqual(env["XDG_CONFIG_HOME"], str(run_dir / ".oi_home" / ".config"))
 
+    def test_run_open_interpreter_streams_output_to_run_logs(self) -> None:
+        with tempfile.TemporaryDirectory(dir=".") as tmp:
+            run_dir = Path(tmp).resolve() / "runs" / "r1"
+            run_dir.mkdir(parents=True)
+            script = Path(tmp).resolve() / "fake-oi"
+            script.write_text(
+                "#!/bin/sh\nread line\necho \"got: $line\"\necho oops >&2\n",
+                encoding="utf-8",
+            )
+            script.chmod(script.stat().st_mode | stat.S_IXUSR)
+            with patch.dict(os.environ, {"OI_BRIDGE_COMMAND": str(script), "OI_BRIDGE_ARGS": ""}):
+                result = run_open_interpreter("hello\nworld", timeout_seconds=10, run_dir=run_dir)
+
+            self.assertEqual(result.returncode, 0)
+            self.assertFalse(result.timed_out)
+            self.assertEqual(result.stdout, "got: hello world\n")
+            self.assertEqual(result.stderr, "oops\n")
+            self.assertEqual((run_dir / "oi_stdout.log").read_text(encoding="utf-8"), result.stdout)
+            self.assertEqual((run_dir / "oi_stderr.log").read_text(encoding="utf-8"), "oops\n")
+
+    def _fake_oi(self, tmp: str, body: str) -> tuple[Path, Path]:
+        run_dir = Path(tmp).resolve() / "runs" / "r1"
+        run_dir.mkdir(parents=True)
+        script = Path(tmp).resolve() / "fake-oi"
+        script.write_text("#!/bin/sh\n" + body, encoding="utf-8")
+        script.chmod(script.stat().st_mode | stat.S_IXUSR)
+        return run_dir, script
+
+    def test_run_open_interpreter_does_not_wait_on_grandchild_pipes(self) -> None:
+        with tempfile.TemporaryDirectory(dir=".") as tmp:
+            run_dir, script = self._fake_oi(tmp, "sleep 30 &\necho done\n")
+            started = time.monotonic()
+            env = {"OI_BRIDGE_COMMAND": str(script), "OI_BRIDGE_ARGS": ""}
+            with patch.dict(os.environ, env), patch("bridge.runner._READER_GRACE_SECONDS", 0.3):
+                result = run_open_interpreter("hello", timeout_seconds=10, run_dir=run_dir)
+
+            self.assertLess(time.monotonic() - started, 5.0)
+            self.assertEqual(result.returncode, 0)
+            self.assertEqual(result.stdout, "done\n")
+
+    def test_run_open_interpreter_times_out_when_child_never_reads_stdin(self) -> None:
+        with tempfile.TemporaryDirectory(dir=".") as tmp:
+            run_dir, script = self._fake_oi(tmp, "sleep 30\n")
+            started = time.monotonic()
+            env = {"OI_BRIDGE_COMMAND": str(script), "OI_BRIDGE_ARGS": ""}
+            with patch.dict(os.environ, env), patch("bridge.runner._READER_GRACE_SECONDS", 0.3):
+                result = run_open_interpreter("x" * 512 * 1024, timeout_seconds=1, run_dir=run_dir)
+
+            self.assertLess(time.monotonic() - started, 5.0)
+            self.assertTrue(result.timed_out)
+            self.assertEqual(result.returncode, 124)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,61 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from bridge import storage
+from bridge.storage import append_log, close_log, close_logs
+
+
+class AppendLogTests(unittest.TestCase):
+    def tearDown(self) -> None:
+        close_logs()
+
+    def test_append_reuses_handle_and_close_releases_it(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            log = Path(td) / "run" / "bridge.log"
+            append_log(log, "first")
+            handle = storage._LOG_HANDLES[log]
+            append_log(log, "second  ")
+            self.assertIs(storage._LOG_HANDLES[log], handle)
+            self.assertEqual(log.read_text(encoding="utf-8"), "first\nsecond\n")
+
+            close_log(log)
+            self.assertTrue(handle.fh.closed)
+            append_log(log, "third")
+            self.assertEqual(log.read_text(encoding="utf-8"), "first\nsecond\nthird\n")
+            close_log(log)
+
+    def test_append_reopens_deleted_log_on_recheck(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            log = Path(td) / "bridge.log"
+            with patch("bridge.storage._LOG_RECHECK_SECONDS", 0.0):
+                append_log(log, "first")
+                log.unlink()
+                append_log(log, "second")
+            self.assertEqual(log.read_text(encoding="utf-8"), "second\n")
+            close_log(log)
+
+    def test_append_skips_identity_check_within_recheck_window(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            log = Path(td) / "bridge.log"
+            with patch("bridge.storage._LOG_RECHECK_SECONDS", 3600.0):
+                append_log(log, "first")
+                with patch("bridge.storage._handle_matches_path") as matches:
+                    append_log(log, "second")
+            matches.assert_not_called()
+            close_log(log)
+
+    def test_handle_cache_is_bounded(self) -> None:
+        with tempfile.TemporaryDirectory() as td, patch("bridge.storage._LOG_HANDLES_MAX", 2):
+            logs = [Path(td) / f"{i}.log" for i in range(3)]
+            for log in logs:
+                append_log(log, "line")
+            self.assertEqual(list(storage._LOG_HANDLES), logs[1:])
+            self.assertEqual(logs[0].read_text(encoding="utf-8"), "line\n")
+            close_logs()
+            self.assertEqual(storage._LOG_HANDLES, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
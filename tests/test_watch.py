@@ -1,8 +1,9 @@
 import io
+import json
 import unittest
 from contextlib import redirect_stdout
 
-from bridge.watch import _watch_loop
+from bridge.watch import _PrefetchingFetcher, _watch_loop
 
 
 class WatchTests(unittest.TestCase):
@@ -81,6 +82,45 @@ class WatchTests(unittest.TestCase):
         self.assertIn("ERROR http 502", text)
         self.assertNotIn('target="Play"', text)
 
+    def test_dedups_events_with_structured_message_and_status(self) -> None:
+        evt = {
+            "type": "agent_note",
+            "severity": "info",
+            "message": {"text": "step done", "step": 2},
+            "status": ["ok", 200],
+            "created_at": "2026-02-15T10:00:01+00:00",
+        }
+        state = {
+            "incident_open": False,
+            "ack_count": 0,
+            "last_event_at": evt["created_at"],
+            "recent_events": [evt],
+        }
+        sleep_calls = {"n": 0}
+
+        def sleep_fn(_seconds: float) -> None:
+            sleep_calls["n"] += 1
+            if sleep_calls["n"] >= 3:
+                raise KeyboardInterrupt
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            _watch_loop(
+                fetch_state=lambda: state,
+                sleep_fn=sleep_fn,
+                interval_ms=50,
+                since_last=False,
+                json_mode=True,
+                print_events=0,
+                only="info",
+                notify=False,
+            )
+
+        events = [json.loads(line) for line in out.getvalue().splitlines()]
+        events = [item for item in events if item.get("type") == "event"]
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["event"]["message"], {"text": "step done", "step": 2})
+
     def test_detects_incident_transition(self) -> None:
         states = [
             {
@@ -237,6 +277,112 @@ class WatchTests(unittest.TestCase):
         self.assertIn("mousemove x=10 y=20", text)
         self.assertIn("scroll y=400", text)
 
+    def test_idle_polls_back_off_and_reset_on_new_event(self) -> None:
+        quiet = {"incident_open": False, "ack_count": 0, "last_event_at": "", "recent_events": []}
+        busy = {
+            "incident_open": False,
+            "ack_count": 0,
+            "last_event_at": "",
+            "recent_events": [
+                {"type": "click", "severity": "info", "created_at": "2026-02-15T10:00:00+00:00"}
+            ],
+        }
+        states = iter([quiet, quiet, quiet, quiet, quiet, busy, quiet])
+        delays: list[float] = []
+
+        def sleep_fn(seconds: float) -> None:
+            delays.append(seconds)
+            if len(delays) >= 7:
+                raise KeyboardInterrupt
+
+        with redirect_stdout(io.StringIO()):
+            _watch_loop(
+                fetch_state=lambda: next(states),
+                sleep_fn=sleep_fn,
+                interval_ms=100,
+                since_last=False,
+                json_mode=False,
+                print_events=0,
+                only="info",
+                notify=False,
+            )
+
+        self.assertEqual(delays, [0.2, 0.4, 0.5, 0.5, 0.5, 0.1, 0.2])
+
+    def test_json_mode_emits_one_object_per_line(self) -> None:
+        states = [
+            {"incident_open": False, "ack_count": 0, "last_event_at": "", "recent_events": []},
+            {
+                "incident_open": True,
+                "ack_count": 1,
+                "last_error": "http 502 ñ",
+                "error_count": 1,
+                "last_event_at": "2026-02-15T10:00:01+00:00",
+                "recent_events": [
+                    {
+                        "type": "network_error",
+                        "severity": "error",
+                        "message": "http 502 ñ",
+                        "status": 502,
+                        "created_at": "2026-02-15T10:00:01+00:00",
+                    }
+                ],
+            },
+        ]
+        idx = {"i": 0}
+
+        def fetch_state():
+            i = idx["i"]
+            idx["i"] = min(i + 1, len(states) - 1)
+            return states[i]
+
+        def sleep_fn(_seconds: float) -> None:
+            sleep_fn.calls += 1
+            if sleep_fn.calls >= 2:
+                raise KeyboardInterrupt
+
+        sleep_fn.calls = 0
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            _watch_loop(
+                fetch_state=fetch_state,
+                sleep_fn=sleep_fn,
+                interval_ms=50,
+                since_last=False,
+                json_mode=True,
+                print_events=0,
+                only="info",
+                notify=False,
+            )
+
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([r["type"] for r in records], ["incident_open", "ack", "event"])
+        self.assertEqual(records[0]["last_error"], "http 502 ñ")
+        self.assertEqual(records[1]["ack_count"], 1)
+        self.assertEqual(records[2]["event"]["status"], 502)
+
+    def test_prefetching_fetcher_starts_next_fetch_during_sleep(self) -> None:
+        calls: list[str] = []
+
+        def fetch_state():
+            calls.append("fetch")
+            return {"n": len(calls)}
+
+        fetcher = _PrefetchingFetcher(
+            fetch_state, sleep_fn=lambda s: calls.append(f"sleep {s:.1f}")
+        )
+        try:
+            self.assertEqual(fetcher.fetch(), {"n": 1})
+            fetcher.sleep(0.5)
+            self.assertEqual(calls[:2], ["fetch", "sleep 0.5"])
+            fetcher.fetch()
+        finally:
+            fetcher.close()
+        # The second fetch was issued by sleep(), not by the fetch() call after it.
+        self.assertEqual(calls.count("fetch"), 2)
+        self.assertEqual(len(calls), 4)
+
 
 if __name__ == "__main__":
     unittest.main()
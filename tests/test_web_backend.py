@@ -1,18 +1,51 @@
+import contextlib
+import socket
 import tempfile
+import types
 import unittest
+from collections import deque
 from pathlib import Path
 from unittest.mock import patch
 
-from bridge.web_backend import _highlight_target, _preflight_target_reachable
+from bridge.models import OIReport
+from bridge.web_backend import _highlight_target, _preflight_target_reachable, run_web_task
+from bridge.web_frame_guard import force_main_frame_context
 from bridge.web_handoff_actions import target_not_found_handoff
 from bridge.web_interaction_executor import apply_interactive_step
+from bridge.web_interaction_helpers import (
+    semantic_hints_for_selector,
+    settle_after_action,
+    stable_selectors_for_target,
+)
+from bridge.web_interactive_capture import capture_movement, scan_whole_page_for_play_buttons
+from bridge.web_interactive_retries import (
+    _deadline_hit,
+    _retry_backoff,
+    _should_mark_stuck,
+    apply_interactive_step_with_retries,
+)
 from bridge.web_learning_store import (
     learned_scroll_hints_for_step,
     load_learned_scroll_hints,
+    load_learned_selectors,
+    prioritize_steps_with_learned_selectors,
     store_learned_scroll_hints,
+    store_learned_selector,
 )
+from bridge.web_preflight import _page_snapshot
+from bridge.web_run_bootstrap import attach_page_observers, load_run_timing_config
+from bridge.web_run_finalize import ensure_structured_ui_findings
+from bridge.web_run_reporting import persist_report_and_status
 from bridge.web_steps import WebStep
+from bridge.web_target_preflight import preflight_target_reachable
 from bridge.web_teaching import capture_manual_learning
+from bridge.web_visual_runtime import ensure_visual_overlay_ready_best_effort
+from bridge.web_watchdog import (
+    WebWatchdogConfig,
+    WebWatchdogState,
+    deadline_budget,
+    evaluate_stuck_reason,
+)
 
 
 class _FakePage:
@@ -62,6 +95,78 @@ class WebBackendPreflightTests(unittest.TestCase):
             with self.assertRaises(SystemExit):
                 _preflight_target_reachable("http://127.0.0.1:65500/")
 
+    def test_preflight_resolves_once_and_tries_ipv4_first(self) -> None:
+        infos = [
+            (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("fd00::5", 5173, 0, 0)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.5", 5173)),
+        ]
+        attempts: list[tuple[str, int]] = []
+
+        def _connect(addr, timeout):
+            attempts.append(addr)
+            raise OSError("refused")
+
+        with patch("bridge.web_target_preflight.socket.getaddrinfo", return_value=infos) as resolve:
+            with self.assertRaises(SystemExit):
+                preflight_target_reachable(
+                    "http://dev.internal:5173/", create_connection_fn=_connect
+                )
+        resolve.assert_called_once()
+        self.assertEqual(attempts, [("10.0.0.5", 5173), ("fd00::5", 5173)])
+
+    def test_preflight_local_target_skips_resolution_when_loopback_answers(self) -> None:
+        attempts: list[tuple[tuple[str, int], float]] = []
+
+        def _connect(addr, timeout):
+            attempts.append((addr, timeout))
+            return contextlib.nullcontext()
+
+        with patch("bridge.web_target_preflight.socket.getaddrinfo") as resolve:
+            preflight_target_reachable("http://localhost:5173/", create_connection_fn=_connect)
+        resolve.assert_not_called()
+        self.assertEqual(attempts, [(("127.0.0.1", 5173), 0.2)])
+
+    def test_preflight_local_refused_loopback_is_not_retried(self) -> None:
+        infos = [
+            (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("::1", 5173, 0, 0)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", 5173)),
+        ]
+        attempts: list[tuple[str, int]] = []
+
+        def _connect(addr, timeout):
+            attempts.append(addr)
+            raise ConnectionRefusedError("refused")
+
+        with patch("bridge.web_target_preflight.socket.getaddrinfo", return_value=infos):
+            with self.assertRaises(SystemExit):
+                preflight_target_reachable("http://localhost:5173/", create_connection_fn=_connect)
+        self.assertEqual(attempts, [("127.0.0.1", 5173), ("::1", 5173)])
+
+    def test_preflight_ipv6_loopback_skips_ipv4_fast_path(self) -> None:
+        infos = [(socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("::1", 5173, 0, 0))]
+        attempts: list[tuple[str, int]] = []
+
+        def _connect(addr, timeout):
+            attempts.append(addr)
+            return contextlib.nullcontext()
+
+        with patch("bridge.web_target_preflight.socket.getaddrinfo", return_value=infos):
+            preflight_target_reachable("http://[::1]:5173/", create_connection_fn=_connect)
+        self.assertEqual(attempts, [("::1", 5173)])
+
+    def test_target_probe_error_wins_over_concurrent_stack_check(self) -> None:
+        with patch(
+            "bridge.web_backend._preflight_target_reachable",
+            side_effect=SystemExit("Web target not reachable: http://127.0.0.1:65500/"),
+        ), patch(
+            "bridge.web_backend._preflight_stack_prereqs",
+            side_effect=SystemExit("Start your stack first"),
+        ):
+            with tempfile.TemporaryDirectory() as td:
+                with self.assertRaises(SystemExit) as ctx:
+                    run_web_task("abre http://127.0.0.1:65500/", Path(td), 30)
+        self.assertIn("not reachable", str(ctx.exception))
+
 
 class WebBackendOcclusionTests(unittest.TestCase):
     def test_occluded_target_retries_scroll_and_returns_none(self) -> None:
@@ -129,6 +234,90 @@ class WebTeachingScrollLearningTests(unittest.TestCase):
             )
             self.assertEqual(hints, [220, 480])
 
+    def test_learned_selectors_reload_only_when_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            learning_json = Path(td) / "web_teaching_selectors.json"
+            learning_json.write_text('{"k": {"play": ["#a"]}}', encoding="utf-8")
+            first = load_learned_selectors(learning_json)
+            first["k"]["play"].append("#mutated")
+            with patch("bridge.web_learning_store._parse_learned_selectors") as parse:
+                self.assertEqual(load_learned_selectors(learning_json), {"k": {"play": ["#a"]}})
+            parse.assert_not_called()
+            learning_json.write_text('{"k": {"play": ["#b", "#c"]}}', encoding="utf-8")
+            self.assertEqual(load_learned_selectors(learning_json), {"k": {"play": ["#b", "#c"]}})
+
+    def test_learned_selectors_append_to_journal_and_compact(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            learning_json = root / "web_teaching_selectors.json"
+            journal = root / "web_teaching_selectors.jsonl"
+            ctx = {"state_key": "k"}
+
+            def _store(target: str, selector: str) -> None:
+                store_learned_selector(
+                    learning_dir=root,
+                    learning_json=learning_json,
+                    target=target,
+                    selector=selector,
+                    context=ctx,
+                    source="test",
+                    normalize_failed_target_label=lambda raw: raw,
+                )
+
+            _store("play", "#a")
+            base = learning_json.read_text(encoding="utf-8")
+            self.assertFalse(journal.exists())
+            _store("play", "#b")
+            _store("stop", "#s")
+            self.assertEqual(learning_json.read_text(encoding="utf-8"), base)
+            self.assertEqual(len(journal.read_text(encoding="utf-8").splitlines()), 2)
+            self.assertEqual(
+                load_learned_selectors(learning_json),
+                {"k": {"play": ["#b", "#a"], "stop": ["#s"]}},
+            )
+
+            with patch("bridge.web_learning_store._JOURNAL_COMPACT_BYTES", 0):
+                _store("play", "#c")
+            self.assertFalse(journal.exists())
+            self.assertEqual(
+                load_learned_selectors(learning_json),
+                {"k": {"play": ["#c", "#b", "#a"], "stop": ["#s"]}},
+            )
+
+    def test_prioritize_expands_only_click_text_steps_from_state_bucket(self) -> None:
+        steps = [
+            WebStep("click_text", "Play"),
+            WebStep("click_selector", "#play"),
+            WebStep("wait_text", "Play"),
+        ]
+        selector_map = {"k": {"play": ["#play", "#alt-play"]}, "other": {"play": ["#nope"]}}
+        out = prioritize_steps_with_learned_selectors(
+            steps=steps,
+            selector_map=selector_map,
+            context={"state_key": "k"},
+            normalize_failed_target_label=lambda raw: raw,
+            step_factory=WebStep,
+        )
+        self.assertEqual(
+            [(s.kind, s.target) for s in out],
+            [
+                ("click_selector", "#play"),
+                ("click_selector", "#alt-play"),
+                ("click_text", "Play"),
+                ("click_selector", "#play"),
+                ("wait_text", "Play"),
+            ],
+        )
+        unchanged = prioritize_steps_with_learned_selectors(
+            steps=steps,
+            selector_map=selector_map,
+            context={"state_key": "missing"},
+            normalize_failed_target_label=lambda raw: raw,
+            step_factory=WebStep,
+        )
+        self.assertEqual(unchanged, steps)
+        self.assertIsNot(unchanged, steps)
+
 
 class WebInteractionExecutorHardeningTests(unittest.TestCase):
     def test_bulk_click_in_cards_raises_when_no_clicks_happen(self) -> None:
@@ -188,5 +377,465 @@ class WebInteractionExecutorHardeningTests(unittest.TestCase):
         self.assertTrue(any("card scan" in item for item in ui_findings))
 
 
+class WebInteractionHelpersTests(unittest.TestCase):
+    def test_settle_returns_on_dom_quiet_without_fixed_pause(self) -> None:
+        page = _FakePage()
+        calls: list[dict[str, object]] = []
+        loads: list[tuple[str, int]] = []
+        page.wait_for_function = lambda script, **kwargs: calls.append(kwargs)
+        page.wait_for_load_state = lambda state, timeout: loads.append((state, timeout))
+        settle_after_action(page, 250)
+        self.assertEqual(calls, [{"arg": 80, "timeout": 250}])
+        self.assertEqual(page.wait_calls, 0)
+        # The rest of the budget waits for in-flight requests to finish.
+        self.assertEqual([state for state, _ in loads], ["networkidle"])
+        self.assertTrue(0 < loads[0][1] <= 250)
+
+    def test_selector_builders_are_memoized_and_immutable(self) -> None:
+        first = stable_selectors_for_target("Entrar")
+        self.assertIs(stable_selectors_for_target("Entrar"), first)
+        self.assertIsInstance(first, tuple)
+        self.assertEqual(semantic_hints_for_selector("#play-stop"), ("Stop", "Reproducir"))
+
+    def test_settle_disconnects_observer_when_dom_never_quiets(self) -> None:
+        class TimeoutError(Exception):
+            pass
+
+        scripts: list[str] = []
+
+        def _wait_for_function(script, **kwargs):
+            raise TimeoutError("still mutating")
+
+        page = types.SimpleNamespace(
+            wait_for_function=_wait_for_function,
+            evaluate=scripts.append,
+            wait_for_timeout=lambda _ms: self.fail("timeout path must not add a fixed pause"),
+        )
+        settle_after_action(page, 250)
+        self.assertEqual(len(scripts), 1)
+        self.assertIn("obs.disconnect()", scripts[0])
+        self.assertIn("delete window.__bridgeSettle", scripts[0])
+
+    def test_settle_falls_back_to_fixed_pause_without_signal(self) -> None:
+        page = _FakePage()
+        settle_after_action(page, 250)
+        self.assertEqual(page.wait_calls, 1)
+        settle_after_action(page, 0)
+        self.assertEqual(page.wait_calls, 1)
+
+
+class InteractiveRetryAttemptedTests(unittest.TestCase):
+    def _run_retries(self, page, apply_step):
+        return apply_interactive_step_with_retries(
+            page=page,
+            step=WebStep("click_selector", "#go"),
+            step_num=1,
+            evidence_dir=Path("evidence"),
+            actions=[],
+            observations=[],
+            ui_findings=[],
+            evidence_paths=[],
+            visual=False,
+            click_pulse_enabled=False,
+            visual_human_mouse=False,
+            visual_mouse_speed=1.0,
+            visual_click_hold_ms=0,
+            timeout_ms=1000,
+            max_retries=1,
+            learning_selectors=[],
+            session=None,
+            step_label="web step 1/1",
+            watchdog_cfg=WebWatchdogConfig(
+                stuck_interactive_seconds=60.0, stuck_step_seconds=60.0, stuck_iframe_seconds=8.0
+            ),
+            step_deadline_ts=float("inf"),
+            run_deadline_ts=float("inf"),
+            to_repo_rel=str,
+            observer_useful_event_count=lambda _session: 0,
+            retry_scroll=lambda _page: None,
+            apply_interactive_step=apply_step,
+            is_generic_play_label=lambda _value: False,
+            stable_selectors_for_target=lambda _target: (),
+            is_specific_selector=lambda _selector: True,
+            semantic_hints_for_selector=lambda _selector: (),
+        )
+
+    def test_first_attempt_success_takes_no_retry_screenshots(self) -> None:
+        shots: list[str] = []
+        page = types.SimpleNamespace(
+            screenshot=lambda path, full_page: shots.append(Path(path).name)
+        )
+        self._run_retries(page, lambda *args, **kwargs: None)
+        self.assertEqual(shots, [])
+
+    def test_real_retry_is_framed_by_retry_screenshots(self) -> None:
+        shots: list[str] = []
+        page = types.SimpleNamespace(
+            screenshot=lambda path, full_page: shots.append(Path(path).name)
+        )
+        calls = {"n": 0}
+
+        def _apply(*args, **kwargs):
+            calls["n"] += 1
+            if calls["n"] == 1:
+                raise RuntimeError("not yet")
+
+        self._run_retries(page, _apply)
+        self.assertEqual(
+            shots,
+            ["step_1_retry_1_after.png", "step_1_retry_2_before.png", "step_1_retry_2_after.png"],
+        )
+
+    def test_retry_backoff_is_jittered_capped_and_deadline_bounded(self) -> None:
+        waits: list[int] = []
+        page = types.SimpleNamespace(wait_for_timeout=waits.append)
+        with patch(
+            "bridge.web_interactive_retries.random.uniform", side_effect=lambda _lo, hi: hi
+        ), patch("bridge.web_interactive_retries.time.monotonic", return_value=100.0):
+            _retry_backoff(page, 2, deadline_ts=200.0)
+            _retry_backoff(page, 6, deadline_ts=200.0)
+            _retry_backoff(page, 6, deadline_ts=101.0)
+            _retry_backoff(page, 6, deadline_ts=100.1)
+        self.assertEqual(waits, [500, 2000, 750])
+
+    def test_deadline_report_keeps_latest_parts_and_marker(self) -> None:
+        parts = deque((f"selector=#c{i}" for i in range(40)), maxlen=18)
+        result = _deadline_hit(parts)
+        attempted = result.attempted.split(", ")
+        self.assertTrue(result.deadline_hit)
+        self.assertEqual(len(attempted), 18)
+        self.assertEqual(attempted[-2:], ["selector=#c39", "deadline=step_or_run"])
+
+    def test_stuck_check_only_queries_observer_past_interactive_threshold(self) -> None:
+        cfg = WebWatchdogConfig(
+            stuck_interactive_seconds=5.0, stuck_step_seconds=20.0, stuck_iframe_seconds=8.0
+        )
+        queries: list[object] = []
+
+        def _count(session):
+            queries.append(session)
+            return 3
+
+        def _check(now: float, baseline: int) -> bool:
+            with patch("bridge.web_interactive_retries.time.monotonic", return_value=now):
+                return _should_mark_stuck(
+                    started_at=100.0,
+                    session="s",
+                    baseline_useful_events=baseline,
+                    watchdog_cfg=cfg,
+                    observer_useful_event_count=_count,
+                )
+
+        self.assertFalse(_check(102.0, 3))
+        self.assertTrue(_check(130.0, 0))
+        self.assertEqual(queries, [])
+        self.assertTrue(_check(110.0, 3))
+        self.assertFalse(_check(110.0, 2))
+        self.assertEqual(len(queries), 2)
+
+
+class WebFrameGuardTests(unittest.TestCase):
+    def test_force_main_frame_probes_focus_and_frame_in_one_evaluate(self) -> None:
+        probes = iter(
+            [{"isMain": True, "iframeFocus": True}, {"isMain": True, "iframeFocus": False}]
+        )
+        scripts: list[str] = []
+
+        def _evaluate(script):
+            scripts.append(script)
+            return next(probes) if "window === window.top" in script else None
+
+        page = types.SimpleNamespace(
+            evaluate=_evaluate,
+            keyboard=types.SimpleNamespace(press=lambda _key: None),
+            wait_for_timeout=lambda _ms: None,
+        )
+        self.assertTrue(force_main_frame_context(page, max_seconds=5.0))
+        self.assertEqual(len(scripts), 4)
+
+
+class MovementCaptureTests(unittest.TestCase):
+    def _capture(self, page, capture_dir: Path, evidence: list[str], **kwargs) -> int:
+        kwargs.setdefault("get_last_human_route", lambda: [(1.0, 2.0), (30.0, 40.0)])
+        return capture_movement(
+            page=page,
+            tag="after_click_selector",
+            step_num=2,
+            move_capture_count=0,
+            visual=True,
+            movement_capture_dir=capture_dir,
+            evidence_paths=evidence,
+            to_repo_rel=lambda path: path.name,
+            **kwargs,
+        )
+
+    def test_svg_only_mode_skips_overlay_and_screenshot(self) -> None:
+        shots: list[str] = []
+        scripts: list[str] = []
+        page = types.SimpleNamespace(
+            evaluate=lambda script: scripts.append(script) or {"w": 100, "h": 50},
+            wait_for_timeout=lambda _ms: None,
+            screenshot=lambda path, full_page: shots.append(Path(path).name),
+        )
+        with tempfile.TemporaryDirectory() as td:
+            evidence: list[str] = []
+            self.assertEqual(self._capture(page, Path(td), evidence, capture_mode="svg_only"), 1)
+            self.assertEqual(evidence, ["step_2_move_1_after_click_selector.svg"])
+            svg = (Path(td) / evidence[0]).read_text(encoding="utf-8")
+            self.assertIn('width="100" height="50" viewBox="0 0 100 50"', svg)
+            self.assertIn('points="1.00,2.00 30.00,40.00" /></svg>', svg)
+            self.assertEqual((shots, len(scripts)), ([], 1))
+            self._capture(page, Path(td), evidence)
+            self.assertEqual(shots, ["step_2_move_1_after_click_selector.png"])
+
+    def test_svg_only_mode_falls_back_to_screenshot_without_route(self) -> None:
+        shots: list[str] = []
+        page = types.SimpleNamespace(
+            evaluate=lambda script: {"w": 100, "h": 50},
+            wait_for_timeout=lambda _ms: None,
+            screenshot=lambda path, full_page: shots.append(Path(path).name),
+        )
+        with tempfile.TemporaryDirectory() as td:
+            evidence: list[str] = []
+            self._capture(
+                page,
+                Path(td),
+                evidence,
+                capture_mode="svg_only",
+                get_last_human_route=lambda: [(1.0, 2.0)],
+            )
+        self.assertEqual(shots, ["step_2_move_1_after_click_selector.png"])
+        self.assertEqual(evidence, ["step_2_move_1_after_click_selector.png"])
+
+    def test_play_button_scan_stops_once_count_settles(self) -> None:
+        counts = iter([1, 3, 3, 5, 5, 5, 7])
+        scrolls: list[str] = []
+
+        def _evaluate(script):
+            if "querySelectorAll" in script:
+                return next(counts)
+            scrolls.append(script)
+            return True
+
+        page = types.SimpleNamespace(evaluate=_evaluate, wait_for_timeout=lambda _ms: None)
+        # A single unchanged pass (3, 3) is not enough to stop the scan.
+        self.assertEqual(scan_whole_page_for_play_buttons(page), 5)
+        # Initial scroll-to-top, five scroll steps, final scroll-to-top.
+        self.assertEqual(len(scrolls), 7)
+
+
+class WebPageObserverTests(unittest.TestCase):
+    def test_response_observer_skips_malformed_responses_only(self) -> None:
+        handlers: dict[str, object] = {}
+
+        class _Page:
+            def on(self, event, handler):
+                handlers[event] = handler
+
+        class _Resp:
+            status = None
+            url = "http://localhost:5173/api"
+
+        network: list[str] = []
+        attach_page_observers(page=_Page(), console_errors=[], network_findings=network)
+        handlers["response"](_Resp())
+        self.assertEqual(network, [])
+
+        class _Boom:
+            @property
+            def status(self):
+                raise RuntimeError("driver gone")
+
+        with self.assertRaises(RuntimeError):
+            handlers["response"](_Boom())
+
+
+class WebRunTimingConfigTests(unittest.TestCase):
+    def test_timing_config_is_a_frozen_env_snapshot(self) -> None:
+        env = {
+            "BRIDGE_WEB_WAIT_TIMEOUT_SECONDS": "3",
+            "BRIDGE_LEARNING_WINDOW_SECONDS": "9",
+            "BRIDGE_WEB_STUCK_STEP_SECONDS": "4",
+            "BRIDGE_WEB_MOVEMENT_CAPTURE": " SVG_Only ",
+        }
+        with patch.dict("os.environ", env):
+            cfg = load_run_timing_config()
+        self.assertEqual(cfg.wait_timeout_ms, 3000)
+        self.assertEqual(cfg.learning_window_seconds, 9)
+        self.assertEqual(cfg.watchdog_cfg.stuck_step_seconds, 4.0)
+        self.assertEqual(cfg.movement_capture_mode, "svg_only")
+        with self.assertRaises(AttributeError):
+            cfg.wait_timeout_ms = 1  # type: ignore[misc]
+        with self.assertRaises(AttributeError):
+            cfg.watchdog_cfg.stuck_step_seconds = 1.0  # type: ignore[misc]
+
+
+class WebPreflightSnapshotTests(unittest.TestCase):
+    def test_page_snapshot_uses_single_evaluate(self) -> None:
+        class _SnapshotPage:
+            url = "about:blank"
+
+            def __init__(self, state):
+                self.state = state
+                self.calls = 0
+
+            def evaluate(self, _script: str):
+                self.calls += 1
+                return self.state
+
+        page = _SnapshotPage({"url": "http://localhost:5173/", "title": "Demo", "body": "Hello"})
+        snapshot = _page_snapshot(page, lambda _p: "unused")
+        self.assertEqual(snapshot, ("http://localhost:5173/", "Demo", "Hello"))
+        self.assertEqual(page.calls, 1)
+
+        fallback = _page_snapshot(_SnapshotPage(None), lambda _p: "Fallback")
+        self.assertEqual(fallback, ("about:blank", "Fallback", ""))
+
+
+class WebWatchdogTests(unittest.TestCase):
+    def test_iframe_probe_only_runs_after_progress_window(self) -> None:
+        cfg = WebWatchdogConfig(
+            stuck_iframe_seconds=8, stuck_step_seconds=20, stuck_interactive_seconds=12
+        )
+        state = WebWatchdogState(
+            current_step_signature="step 1/1 click_text:Play",
+            last_step_change_ts=100.0,
+            last_progress_event_ts=100.0,
+        )
+        probes: list[bool] = []
+
+        def _locked() -> bool:
+            probes.append(True)
+            return True
+
+        self.assertEqual(
+            evaluate_stuck_reason(state, cfg=cfg, now_ts=105.0, iframe_focus_locked=_locked), ""
+        )
+        self.assertEqual(probes, [])
+        self.assertEqual(
+            evaluate_stuck_reason(state, cfg=cfg, now_ts=109.0, iframe_focus_locked=_locked),
+            "stuck_iframe_focus",
+        )
+        self.assertEqual(len(probes), 1)
+
+
+class DeadlineBudgetTests(unittest.TestCase):
+    def test_budget_is_capped_floored_and_flags_exhaustion(self) -> None:
+        self.assertEqual(deadline_budget(8000, 110.0, 130.0, now_ts=100.0), (8000, False))
+        self.assertEqual(deadline_budget(8000, 101.0, 130.0, now_ts=100.0), (1000, False))
+        self.assertEqual(deadline_budget(8000, 100.1, 130.0, now_ts=100.0), (250, False))
+        self.assertEqual(deadline_budget(8000, 110.0, 99.0, now_ts=100.0), (250, True))
+
+
+class VisualOverlayReadyCacheTests(unittest.TestCase):
+    def test_ready_overlay_is_reused_until_main_frame_navigates(self) -> None:
+        class _NavPage:
+            def __init__(self):
+                self.handlers = {}
+
+            def on(self, event, handler):
+                self.handlers[event] = handler
+
+        page = _NavPage()
+        with patch("bridge.web_visual_runtime._ensure_visual_overlay_installed") as install, patch(
+            "bridge.web_visual_runtime._verify_visual_overlay_visible"
+        ):
+            for _ in range(2):
+                ok = ensure_visual_overlay_ready_best_effort(
+                    page, [], cursor_expected=True, retries=1, delay_ms=0, to_repo_rel=str
+                )
+                self.assertTrue(ok)
+            self.assertEqual(install.call_count, 1)
+            page.handlers["framenavigated"](type("Frame", (), {"parent_frame": object()})())
+            ensure_visual_overlay_ready_best_effort(
+                page, [], cursor_expected=True, retries=1, delay_ms=0, to_repo_rel=str
+            )
+            self.assertEqual(install.call_count, 1)
+            page.handlers["framenavigated"](type("Frame", (), {"parent_frame": None})())
+            ensure_visual_overlay_ready_best_effort(
+                page, [], cursor_expected=True, retries=1, delay_ms=0, to_repo_rel=str
+            )
+            self.assertEqual(install.call_count, 2)
+
+    def test_ready_overlay_is_reverified_after_max_age(self) -> None:
+        class _NavPage:
+            def on(self, event, handler):
+                return None
+
+        page = _NavPage()
+        clock = {"now": 100.0}
+        with patch("bridge.web_visual_runtime._ensure_visual_overlay_installed") as install, patch(
+            "bridge.web_visual_runtime._verify_visual_overlay_visible"
+        ), patch("bridge.web_visual_runtime.time.monotonic", side_effect=lambda: clock["now"]):
+            ensure_visual_overlay_ready_best_effort(
+                page, [], cursor_expected=True, retries=1, delay_ms=0, to_repo_rel=str
+            )
+            clock["now"] += 29.0
+            ensure_visual_overlay_ready_best_effort(
+                page, [], cursor_expected=True, retries=1, delay_ms=0, to_repo_rel=str
+            )
+            self.assertEqual(install.call_count, 1)
+            clock["now"] += 2.0
+            ensure_visual_overlay_ready_best_effort(
+                page, [], cursor_expected=True, retries=1, delay_ms=0, to_repo_rel=str
+            )
+            self.assertEqual(install.call_count, 2)
+
+
+class WebRunFinalizeTests(unittest.TestCase):
+    def test_structured_findings_fill_only_missing_keys(self) -> None:
+        findings = ["where=step 2/3", "what_failed", "final_state_note=x", "attempted=a=b"]
+        ensure_structured_ui_findings(findings, result="failed", where_default="web-run")
+        self.assertEqual(
+            findings[4:],
+            [
+                "what_failed=unknown",
+                "why_likely=run ended without explicit failure classification",
+                "next_best_action=inspect report/logs and retry",
+                "final_state=failed",
+            ],
+        )
+
+
+class WebRunReportingTests(unittest.TestCase):
+    def test_status_is_written_even_when_report_write_fails(self) -> None:
+        report = OIReport(
+            task_id="r1",
+            goal="web: http://localhost:5173",
+            actions=[],
+            observations=[],
+            console_errors=[],
+            network_findings=[],
+            ui_findings=[],
+            result="success",
+            evidence_paths=[],
+        )
+        statuses: list[dict] = []
+
+        def _fail_json(_path, _payload):
+            raise OSError("disk full")
+
+        persist_report_and_status(
+            report=report,
+            run_dir=Path("runs") / "r1",
+            report_path=Path("runs") / "r1" / "report.json",
+            task="t",
+            write_json_fn=_fail_json,
+            write_status_fn=lambda **kwargs: statuses.append(kwargs),
+        )
+        self.assertEqual(len(statuses), 1)
+        self.assertEqual(statuses[0]["result"], "success")
+
+        with self.assertRaises(AttributeError):
+            persist_report_and_status(
+                report=report,
+                run_dir=Path("runs") / "r1",
+                report_path=Path("runs") / "r1" / "report.json",
+                task="t",
+                write_json_fn=lambda _p, _d: None,
+                write_status_fn=lambda **_kwargs: None.missing,  # type: ignore[attr-defined]
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from bridge.web_common import same_origin_path
+from bridge.web_common import collapse_ws, compact_js, same_origin_path
 
 
 class SameOriginPathTests(unittest.TestCase):
@@ -15,5 +15,32 @@ class SameOriginPathTests(unittest.TestCase):
         self.assertFalse(same_origin_path("http://localhost:5181/a", "http://127.0.0.1:5181/b"))
 
 
+class CollapseWsTests(unittest.TestCase):
+    def test_limit_matches_full_collapse_then_slice(self) -> None:
+        samples = [
+            "",
+            "  a  ",
+            "a b c d e f",
+            "x" * 30,
+            "  ab\n\tcd   e  fgh  " * 5,
+            "a " * 40 + "  tail  ",
+        ]
+        for text in samples:
+            for limit in (0, 1, 2, 3, 7, 10, 500):
+                self.assertEqual(collapse_ws(text, limit), collapse_ws(text)[:limit], (text, limit))
+
+
+class CompactJsTests(unittest.TestCase):
+    def test_strips_indentation_and_blank_lines_but_keeps_line_breaks(self) -> None:
+        source = """
+            () => {
+              const a = 1; // note
+
+              return a;
+            }
+        """
+        self.assertEqual(compact_js(source), "() => {\nconst a = 1; // note\nreturn a;\n}")
+
+
 if __name__ == "__main__":
     unittest.main()
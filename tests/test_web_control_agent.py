@@ -1,8 +1,13 @@
 import os
+import threading
+import time
 import unittest
+from types import SimpleNamespace
 from unittest.mock import patch
 
-from bridge.web_control_agent import _AgentRuntime
+from bridge import web_control_agent
+from bridge.web_control_agent import _AgentRuntime, _ControlServer
+from bridge.web_session import AgentConnection, request_session_state, request_session_state_since
 
 
 class WebControlAgentTests(unittest.TestCase):
@@ -36,6 +41,93 @@ class WebControlAgentTests(unittest.TestCase):
         event_types = [evt.get("type") for evt in snapshot["recent_events"]]
         self.assertIn("click", event_types)
 
+    def test_wait_for_change_wakes_on_new_event(self) -> None:
+        runtime = _AgentRuntime()
+        version = runtime.snapshot()["version"]
+        timer = threading.Timer(0.05, runtime.record_event, args=({"type": "console_error"},))
+        timer.start()
+        started = time.monotonic()
+        runtime.wait_for_change(version, timeout=5.0)
+        timer.join()
+        self.assertLess(time.monotonic() - started, 2.0)
+        self.assertEqual(runtime.snapshot()["version"], version + 1)
+
+    def test_state_long_poll_returns_only_events_after_cursor(self) -> None:
+        runtime = _AgentRuntime()
+        with patch.dict(os.environ, {"BRIDGE_OBSERVER_NOISE_MODE": "debug"}, clear=False):
+            runtime.record_event({"type": "click", "target": "old"})
+        snapshot = runtime.snapshot()
+        cursor = snapshot["last_event_at"]
+        fake_session = SimpleNamespace(
+            session_id="s1",
+            state="open",
+            controlled=False,
+            url="",
+            title="",
+            last_seen_at="",
+            control_port=0,
+        )
+        server = _ControlServer(("127.0.0.1", 0), "s1")
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        with patch.object(web_control_agent, "_RUNTIME", runtime), patch(
+            "bridge.web_control_agent.load_session", return_value=fake_session
+        ), patch("bridge.web_control_agent.refresh_session_state", side_effect=lambda s: s), patch(
+            "bridge.web_session.session_agent_online", return_value=True
+        ):
+            thread.start()
+            try:
+                client_session = SimpleNamespace(control_port=server.server_address[1])
+                timer = threading.Timer(
+                    0.05, runtime.record_event, args=({"type": "console_error", "message": "boom"},)
+                )
+                timer.start()
+                state = request_session_state_since(
+                    client_session,
+                    version=snapshot["version"],
+                    cursor=cursor,
+                    wait_seconds=5.0,
+                )
+                timer.join()
+            finally:
+                server.shutdown()
+                server.server_close()
+
+        self.assertIsNotNone(state)
+        self.assertEqual([evt["message"] for evt in state["recent_events"]], ["boom"])
+        self.assertEqual(state["version"], snapshot["version"] + 1)
+
+    def test_agent_connection_reuses_socket_across_state_requests(self) -> None:
+        fake_session = SimpleNamespace(
+            session_id="s1",
+            state="open",
+            controlled=False,
+            url="",
+            title="",
+            last_seen_at="",
+            control_port=0,
+        )
+        server = _ControlServer(("127.0.0.1", 0), "s1")
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        with patch("bridge.web_control_agent.load_session", return_value=fake_session), patch(
+            "bridge.web_control_agent.refresh_session_state", side_effect=lambda s: s
+        ):
+            thread.start()
+            port = server.server_address[1]
+            client = AgentConnection(port)
+            try:
+                client_session = SimpleNamespace(control_port=port, agent_pid=os.getpid())
+                first = request_session_state(client_session, client=client)
+                sock = client._conn.sock
+                second = request_session_state(client_session, client=client)
+                self.assertIs(client._conn.sock, sock)
+            finally:
+                client.close()
+                server.shutdown()
+                server.server_close()
+
+        self.assertEqual(first["session_id"], "s1")
+        self.assertEqual(second["session_id"], "s1")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -21,6 +21,7 @@ from bridge.web_backend import (
     _execute_playwright,
     _install_visual_overlay,
     ensure_session_top_bar,
+    release_and_destroy_session_top_bar,
     _session_state_payload,
     _parse_steps,
     run_web_task,
@@ -250,11 +251,14 @@ class _FakePage:
         if "frame.style.pointerEvents = prev" in _script and "data-bridge-prev-pe" in _script:
             self.iframe_pointer_events_disabled = False
             return True
-        if "iframe:focus,iframe:focus-within" in _script:
-            return self.iframe_focus_locked
         if "window === window.top" in _script:
             self._main_frame_context_checks += 1
-            return self._main_frame_context_checks > self.main_frame_context_failures
+            return {
+                "isMain": self._main_frame_context_checks > self.main_frame_context_failures,
+                "iframeFocus": self.iframe_focus_locked,
+            }
+        if "iframe:focus,iframe:focus-within" in _script:
+            return self.iframe_focus_locked
         if "window.__bridgeEnsureOverlay" in _script:
             return True
         if "getElementById('__bridge_cursor_overlay')" in _script and "pointerEvents" in _script:
@@ -337,6 +341,14 @@ class _FakePlaywrightCtx:
 
 
 class WebModeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        # run_web_task finalizes through write_status; keep it out of ./runs.
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        status_patch = patch("bridge.storage.STATUS_PATH", Path(tmp.name) / "status.json")
+        status_patch.start()
+        self.addCleanup(status_patch.stop)
+
     def test_parse_steps_supports_wait_click_and_select(self) -> None:
         steps = _parse_steps(
             'abre http://localhost:5173 wait selector:"#ready" click selector:"#go" '
@@ -496,6 +508,55 @@ class WebModeTests(unittest.TestCase):
         self.assertIn("cmd: playwright fill selector:#playlist-search-input text:__zz_no_match__", report.actions)
         self.assertEqual(page.filled.get("#playlist-search-input"), "__zz_no_match__")
 
+    def test_run_web_task_reuses_fresh_after_shot_as_next_before_shot(self) -> None:
+        page = _FakePage(demo_button_available=False)
+        shots: list[str] = []
+        original_screenshot = page.screenshot
+
+        def _screenshot(path: str, full_page: bool) -> None:
+            shots.append(Path(path).name)
+            original_screenshot(path, full_page)
+
+        page.screenshot = _screenshot
+        fake_sync_module = types.ModuleType("playwright.sync_api")
+        fake_sync_module.sync_playwright = lambda: _FakePlaywrightCtx(page)
+        fake_playwright = types.ModuleType("playwright")
+        fake_playwright.sync_api = fake_sync_module
+
+        with tempfile.TemporaryDirectory(dir=".") as tmp:
+            run_dir = Path(tmp) / "runs" / "r-reuse-shot"
+            run_dir.mkdir(parents=True)
+            with patch.dict(
+                sys.modules,
+                {"playwright": fake_playwright, "playwright.sync_api": fake_sync_module},
+            ), patch("bridge.web_backend._preflight_target_reachable"), patch(
+                "bridge.web_backend._preflight_stack_prereqs"
+            ), patch(
+                "bridge.web_backend._playwright_available",
+                return_value=True,
+            ), patch(
+                "bridge.web_run_loop.settle_after_action",
+                side_effect=lambda _page, _ms: shots.append("settle"),
+            ):
+                report = run_web_task(
+                    'open http://localhost:5173, fill selector "#a" text "x", '
+                    'fill selector "#b" text "y"',
+                    run_dir,
+                    30,
+                    verified=False,
+                    visual=False,
+                    teaching_mode=False,
+                )
+            reused = run_dir / "evidence" / "step_2_before.png"
+            self.assertTrue(reused.exists())
+
+        self.assertIn("step_1_before.png", shots)
+        self.assertIn("step_2_after.png", shots)
+        self.assertNotIn("step_2_before.png", shots)
+        # The reused frame was taken after the step settled.
+        self.assertEqual(shots.index("step_1_after.png") - 1, shots.index("settle"))
+        self.assertTrue(any(p.endswith("step_2_before.png") for p in report.evidence_paths))
+
     def test_run_web_task_run_timeout_finishes_and_releases_control(self) -> None:
         page = _FakePage(demo_button_available=False)
         fake_sync_module = types.ModuleType("playwright.sync_api")
@@ -2011,6 +2072,31 @@ class WebModeTests(unittest.TestCase):
         ):
             self.assertEqual(_observer_useful_event_count(session), 4)
 
+    def test_observer_useful_event_count_skips_env_when_agent_reports_mode(self) -> None:
+        session = WebSession(
+            session_id="s-noise",
+            pid=123,
+            port=9222,
+            user_data_dir="/tmp/x",
+            browser_binary="/usr/bin/chromium",
+            url="http://localhost:5173",
+            title="Demo App",
+            controlled=True,
+            created_at="2026-01-01T00:00:00+00:00",
+            last_seen_at="2026-01-01T00:00:00+00:00",
+            state="open",
+            control_port=9555,
+            agent_pid=201,
+        )
+        with patch(
+            "bridge.web_backend.request_session_state",
+            return_value={"observer_noise_mode": "minimal", "recent_events": [{"type": "click"}]},
+        ), patch(
+            "bridge.web_backend._observer_noise_mode",
+            side_effect=AssertionError("env should not be read"),
+        ):
+            self.assertEqual(_observer_useful_event_count(session), 1)
+
     def test_web_open_can_inject_top_bar_without_web_run(self) -> None:
         page = _FakePage()
         fake_sync_module = types.ModuleType("playwright.sync_api")
@@ -2049,6 +2135,74 @@ class WebModeTests(unittest.TestCase):
                 sys.modules["playwright.sync_api"] = old_sync
         self.assertTrue(page.init_scripts)
 
+    def test_web_open_top_bar_builds_session_payload_once(self) -> None:
+        page = _FakePage()
+        fake_sync_module = types.ModuleType("playwright.sync_api")
+        fake_sync_module.sync_playwright = lambda: _FakePlaywrightCtx(page)
+        fake_playwright = types.ModuleType("playwright")
+        fake_playwright.sync_api = fake_sync_module
+        session = WebSession(
+            session_id="s-open",
+            pid=123,
+            port=9222,
+            user_data_dir="/tmp/x",
+            browser_binary="/usr/bin/chromium",
+            url="http://localhost:5173",
+            title="Demo App",
+            controlled=False,
+            created_at="2026-01-01T00:00:00+00:00",
+            last_seen_at="2026-01-01T00:00:00+00:00",
+            state="open",
+            control_port=9555,
+            agent_pid=201,
+        )
+        with patch.dict(
+            sys.modules,
+            {"playwright": fake_playwright, "playwright.sync_api": fake_sync_module},
+        ), patch(
+            "bridge.web_backend._session_state_payload",
+            wraps=_session_state_payload,
+        ) as payload:
+            ensure_session_top_bar(session)
+        self.assertEqual(payload.call_count, 1)
+        self.assertTrue(page.init_scripts)
+
+    def test_web_close_overlays_share_one_cdp_connection(self) -> None:
+        page = _FakePage()
+        entered: list[object] = []
+
+        def _ctx():
+            entered.append(page)
+            return _FakePlaywrightCtx(page)
+
+        fake_sync_module = types.ModuleType("playwright.sync_api")
+        fake_sync_module.sync_playwright = _ctx
+        session = WebSession(
+            session_id="s-close",
+            pid=123,
+            port=9222,
+            user_data_dir="/tmp/x",
+            browser_binary="/usr/bin/chromium",
+            url="http://localhost:5173",
+            title="Demo App",
+            controlled=True,
+            created_at="2026-01-01T00:00:00+00:00",
+            last_seen_at="2026-01-01T00:00:00+00:00",
+            state="open",
+        )
+        old_sync = sys.modules.get("playwright.sync_api")
+        sys.modules["playwright.sync_api"] = fake_sync_module
+        try:
+            release_and_destroy_session_top_bar(session)
+        finally:
+            if old_sync is None:
+                sys.modules.pop("playwright.sync_api", None)
+            else:
+                sys.modules["playwright.sync_api"] = old_sync
+        self.assertEqual(len(entered), 1)
+        scripts = [script for script, _payload in page.eval_calls]
+        self.assertTrue(any("__bridgeDestroyTopBar" in script for script in scripts))
+
     def test_overlay_ready_retries_until_visible(self) -> None:
         page = _FakePage()
         page.overlay_visible_after = 2